@@ -0,0 +1,266 @@
+# app/database/archive.py
+
+"""
+Module archive.py
+
+Archivage des tâches closes (terminées ou annulées) dans la table
+`task_archive` :
+
+- archive_closed_tasks : déplace par lots les tâches closes depuis plus
+  de N jours (variable TASK_ARCHIVE_AFTER_DAYS, 30 par défaut)
+- get_archived_page : consultation des archives, plus récentes d'abord
+  (pagination keyset)
+- restore_tasks : remise des tâches dans la table `task`
+
+Une tâche archivée reste dans `task` comme tombstone (deleted_at, sans
+sa description) : le tableau et le cache ne la chargent plus, et les
+autres clients l'apprennent par le flux de modifications
+(get_tasks_changed_since). La restauration réécrit cette ligne avec
+une nouvelle révision ; la tâche reparaît donc partout avec son id.
+
+Toutes ces fonctions sont à exécuter sur le thread de la base
+(DatabaseWorker).
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import DateTime, and_, delete, func, insert, literal, or_, select, update
+
+from app.database.base import _chunks, _live, _next_revision, DEFAULT_CHUNK_SIZE, DEFAULT_PAGE_SIZE
+from app.database.engine import _env_int, get_session
+from app.database.models.task import Task, TaskStatus, task_archive
+
+
+# Statuts archivables
+CLOSED_STATUSES = (TaskStatus.TERMINE, TaskStatus.ANNULEE)
+
+# Âge minimal (jours depuis la dernière modification) d'une tâche archivée
+DEFAULT_ARCHIVE_AFTER_DAYS = 30
+
+# Colonnes copiées d'une table à l'autre
+_COPIED_COLUMNS = [
+    "id", "theme", "title", "status", "description", "priority",
+    "created_at", "deadline", "updated_at", "version",
+]
+
+ArchiveCursor = Tuple[datetime, int]
+
+
+def archive_age_days() -> int:
+    """Âge d'archivage configuré (TASK_ARCHIVE_AFTER_DAYS)."""
+    return _env_int("TASK_ARCHIVE_AFTER_DAYS", DEFAULT_ARCHIVE_AFTER_DAYS)
+
+
+# =======================
+# Archivage
+# =======================
+def archive_closed_tasks(
+    older_than_days: Optional[int] = None,
+    batch_size: int = DEFAULT_CHUNK_SIZE
+) -> int:
+    """
+    Archive les tâches terminées ou annulées non modifiées depuis
+    `older_than_days` jours.
+
+    Chaque lot est une transaction : copie dans task_archive
+    (INSERT ... SELECT) puis tombstone dans task, sous une même
+    révision. Une interruption laisse les lots déjà traités archivés.
+
+    Args:
+        older_than_days (int, optional): Âge minimal (archive_age_days() par défaut)
+        batch_size (int, optional): Tâches par lot
+
+    Returns:
+        int: Nombre de tâches archivées
+    """
+    if batch_size < 1:
+        raise ValueError("La taille des lots doit être strictement positive")
+    if older_than_days is None:
+        older_than_days = archive_age_days()
+    # Horodatage commun à tout le passage, comparable aux curseurs de get_archived_page
+    archived_at = datetime.now().replace(microsecond=0)
+    cutoff = archived_at - timedelta(days=older_than_days)
+
+    candidates = (
+        select(Task.id)
+        .where(_live(), Task.status.in_(CLOSED_STATUSES), Task.updated_at < cutoff)
+        .order_by(Task.id)
+        .limit(batch_size)
+    )
+
+    archived = 0
+    while True:
+        session = get_session()
+        try:
+            ids = session.execute(candidates.with_for_update()).scalars().all()
+            if not ids:
+                return archived
+
+            source = select(
+                *(Task.__table__.c[name] for name in _COPIED_COLUMNS), literal(archived_at, DateTime)
+            ).where(Task.id.in_(ids))
+            session.execute(
+                insert(task_archive).from_select(_COPIED_COLUMNS + ["archived_at"], source)
+            )
+            session.execute(
+                update(Task)
+                .where(Task.id.in_(ids))
+                .values(
+                    description="",
+                    deleted_at=func.now(),
+                    version=Task.version + 1,
+                    revision=_next_revision(session)
+                )
+                .execution_options(synchronize_session=False)
+            )
+            session.commit()
+            archived += len(ids)
+        except Exception as e:
+            session.rollback()
+            raise RuntimeError(f"Erreur lors de l'archivage des tâches : {e}") from e
+        finally:
+            session.close()
+
+
+# =======================
+# Consultation
+# =======================
+def _serialize_archived(row) -> Dict[str, Any]:
+    """Même format que serialize_task, plus `archived_at`."""
+    return {
+        "id": row.id,
+        "theme": row.theme,
+        "title": row.title,
+        "status": row.status.value,
+        "description": row.description,
+        "priority": row.priority.value,
+        "created_at": row.created_at.isoformat() if row.created_at else None,
+        "deadline": row.deadline.isoformat() if row.deadline else None,
+        "updated_at": row.updated_at.isoformat() if row.updated_at else None,
+        "version": row.version,
+        "archived_at": row.archived_at.isoformat() if row.archived_at else None,
+    }
+
+
+def get_archived_page(
+    after: Optional[ArchiveCursor] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    search: str = ""
+) -> Tuple[List[Dict[str, Any]], Optional[ArchiveCursor]]:
+    """
+    Page des tâches archivées, les plus récemment archivées d'abord.
+
+    Args:
+        after (ArchiveCursor, optional): Curseur renvoyé par la page précédente
+        limit (int, optional): Taille de la page
+        search (str, optional): Texte recherché dans le thème ou le titre
+
+    Returns:
+        Tuple[List[dict], Optional[ArchiveCursor]]: Tâches sérialisées et
+        curseur de la page suivante (None s'il n'y en a plus)
+    """
+    columns = task_archive.c
+    statement = select(task_archive).order_by(columns.archived_at.desc(), columns.id.desc())
+    if search.strip():
+        statement = statement.where(or_(
+            columns.theme.icontains(search.strip(), autoescape=True),
+            columns.title.icontains(search.strip(), autoescape=True),
+        ))
+    if after is not None:
+        archived_at, task_id = after
+        statement = statement.where(or_(
+            columns.archived_at < archived_at,
+            and_(columns.archived_at == archived_at, columns.id < task_id),
+        ))
+
+    session = get_session()
+    try:
+        rows = session.execute(statement.limit(limit + 1)).all()
+        next_cursor = (rows[limit - 1].archived_at, rows[limit - 1].id) if len(rows) > limit else None
+        return [_serialize_archived(row) for row in rows[:limit]], next_cursor
+    finally:
+        session.close()
+
+
+def count_archived_tasks() -> int:
+    """Nombre de tâches archivées."""
+    session = get_session()
+    try:
+        return session.execute(select(func.count()).select_from(task_archive)).scalar_one()
+    finally:
+        session.close()
+
+
+# =======================
+# Restauration
+# =======================
+def restore_tasks(task_ids: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Remet des tâches archivées dans la table `task`, en une transaction.
+
+    La tombstone de chaque tâche reprend son contenu archivé et une
+    nouvelle révision (elle reparaît chez tous les clients) ; une tâche
+    dont la tombstone a disparu est réinsérée avec son id. updated_at
+    repart de maintenant : la tâche n'est pas réarchivée aussitôt.
+
+    Args:
+        task_ids (Iterable[int]): Identifiants des tâches archivées
+        chunk_size (int, optional): Tâches par lot
+
+    Returns:
+        int: Nombre de tâches restaurées
+    """
+    task_ids = list(dict.fromkeys(task_ids))
+    if not task_ids:
+        return 0
+
+    columns = task_archive.c
+    restored_columns = ["theme", "title", "status", "description", "priority", "deadline"]
+    inserted_columns = ["id", "created_at", "version", *restored_columns]
+
+    session = get_session()
+    try:
+        revision = _next_revision(session)
+        restored = 0
+        for chunk in _chunks(task_ids, chunk_size):
+            archived = select(columns.id).where(columns.id.in_(chunk))
+            # Tombstones existantes : réécrites depuis l'archive
+            session.execute(
+                update(Task)
+                .where(Task.id.in_(archived), Task.deleted_at.isnot(None))
+                .values({
+                    **{name: select(columns[name]).where(columns.id == Task.id).scalar_subquery()
+                       for name in restored_columns},
+                    "deleted_at": None,
+                    "version": Task.version + 1,
+                    "revision": revision,
+                })
+                .execution_options(synchronize_session=False)
+            )
+            # Tâches sans ligne dans `task` : réinsérées
+            missing = select(
+                *(columns[name] for name in inserted_columns), literal(revision)
+            ).where(
+                columns.id.in_(chunk),
+                ~columns.id.in_(select(Task.id).where(Task.id.in_(chunk)))
+            )
+            session.execute(insert(Task).from_select(inserted_columns + ["revision"], missing))
+
+            # Seules les tâches effectivement remises en place quittent l'archive
+            put_back = select(Task.id).where(Task.id.in_(chunk), Task.revision == revision)
+            result = session.execute(
+                delete(task_archive).where(columns.id.in_(chunk), columns.id.in_(put_back))
+            )
+            restored += result.rowcount
+        session.commit()
+        return restored
+    except Exception as e:
+        session.rollback()
+        raise RuntimeError(f"Erreur lors de la restauration des tâches : {e}") from e
+    finally:
+        session.close()
@@ -0,0 +1,225 @@
+# app/database/backends.py
+
+"""
+Module backends.py
+
+Moteurs de stockage de l'application, choisis par la variable
+d'environnement DB_BACKEND :
+
+- "mysql" (défaut) : serveur MySQL (pymysql), pool de connexions
+- "sqlite" : fichier SQLite embarqué, réglé pour un usage local
+  (journal WAL, synchronous=NORMAL, E/S mappées en mémoire)
+- "memory" : base SQLite en mémoire, vide au démarrage et perdue à la
+  fermeture ; pour les tests et les mesures, sans service externe
+
+Un moteur fournit l'URL et les options de l'engine SQLAlchemy, puis
+règle l'engine créé (événements de connexion). Les fonctions de
+app.database.base ne dépendent que de SQLAlchemy : elles fonctionnent
+sur les trois moteurs, les rares différences de dialecte (révisions,
+recherche plein texte, upsert) étant traitées sur place.
+
+Variables d'environnement (fichier .env) :
+    DB_BACKEND : "mysql", "sqlite" ou "memory" (défaut : mysql)
+    DB_PATH : fichier du moteur sqlite (défaut : kairo.db)
+    DB_SQLITE_MMAP_MB : taille des E/S mappées en mémoire, en Mo (défaut : 256)
+    DB_SQLITE_CACHE_MB : cache de pages par connexion, en Mo (défaut : 64)
+    DB_BUSY_TIMEOUT : attente d'un verrou d'écriture SQLite, en secondes (défaut : 5)
+    Moteur mysql : voir app.database.engine
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import os
+import threading
+from typing import Any, Dict
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool, StaticPool
+
+from dotenv import load_dotenv
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value else default
+
+
+# =======================
+# Moteurs
+# =======================
+class Backend:
+    """
+    Moteur de stockage : URL, options et réglages de l'engine.
+
+    Attributs :
+        name (str): Valeur de DB_BACKEND correspondante
+    """
+
+    name = ""
+
+    def url(self) -> str:
+        raise NotImplementedError
+
+    def engine_options(self) -> Dict[str, Any]:
+        """Arguments de create_engine (hors URL)."""
+        return {}
+
+    def configure(self, engine: Engine) -> None:
+        """Réglages de l'engine créé (événements de connexion...)."""
+
+
+class MySQLBackend(Backend):
+    """Serveur MySQL, connexion décrite par DB_USER, DB_PASSWORD, DB_HOST, DB_NAME."""
+
+    name = "mysql"
+
+    def url(self) -> str:
+        return (
+            f"mysql+pymysql://{os.getenv('DB_USER')}:{os.getenv('DB_PASSWORD')}"
+            f"@{os.getenv('DB_HOST')}/{os.getenv('DB_NAME')}"
+        )
+
+    def engine_options(self) -> Dict[str, Any]:
+        return {
+            "poolclass": QueuePool,
+            "pool_size": _env_int("DB_POOL_SIZE", 5),
+            "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+            "pool_recycle": _env_int("DB_POOL_RECYCLE", 3600),
+            "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+            # Connexion tombée (serveur redémarré, veille) : détectée avant usage
+            "pool_pre_ping": True,
+            "connect_args": {"connect_timeout": _env_int("DB_CONNECT_TIMEOUT", 5)},
+        }
+
+
+class SQLiteBackend(Backend):
+    """
+    Fichier SQLite local.
+
+    Journal WAL : les lectures (thread de l'interface, exports) ne
+    bloquent pas l'écriture en cours ; synchronous=NORMAL ne synchronise
+    le disque qu'aux points de contrôle (une coupure de courant peut
+    perdre les dernières transactions, jamais corrompre la base).
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str = ""):
+        self.path = path or os.getenv("DB_PATH") or "kairo.db"
+
+    def url(self) -> str:
+        return f"sqlite:///{self.path}"
+
+    def engine_options(self) -> Dict[str, Any]:
+        return {
+            # Connexions gardées ouvertes : cache de pages et mmap conservés
+            "poolclass": QueuePool,
+            "pool_size": _env_int("DB_POOL_SIZE", 5),
+            "max_overflow": _env_int("DB_MAX_OVERFLOW", 10),
+            "pool_timeout": _env_int("DB_POOL_TIMEOUT", 30),
+            "connect_args": {
+                "timeout": _env_int("DB_BUSY_TIMEOUT", 5),
+                # Connexions du pool passées d'un thread à l'autre
+                "check_same_thread": False,
+            },
+        }
+
+    def pragmas(self) -> Dict[str, Any]:
+        return {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "mmap_size": _env_int("DB_SQLITE_MMAP_MB", 256) * 1024 * 1024,
+            # Taille négative : en Kio
+            "cache_size": -_env_int("DB_SQLITE_CACHE_MB", 64) * 1024,
+            "temp_store": "MEMORY",
+        }
+
+    def configure(self, engine: Engine) -> None:
+        pragmas = self.pragmas()
+
+        @event.listens_for(engine, "connect")
+        def _set_pragmas(dbapi_connection, connection_record):
+            cursor = dbapi_connection.cursor()
+            try:
+                for name, value in pragmas.items():
+                    cursor.execute(f"PRAGMA {name}={value}")
+            finally:
+                cursor.close()
+
+
+class SerializedStaticPool(StaticPool):
+    """StaticPool dont l'unique connexion n'est prêtée qu'à un thread à la fois."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Réentrant : un thread peut ouvrir une session dans une autre
+        self._lock = threading.RLock()
+
+    def _do_get(self):
+        self._lock.acquire()
+        try:
+            return super()._do_get()
+        except BaseException:
+            self._lock.release()
+            raise
+
+    def _do_return_conn(self, record):
+        try:
+            super()._do_return_conn(record)
+        finally:
+            self._lock.release()
+
+
+class MemoryBackend(SQLiteBackend):
+    """
+    Base SQLite en mémoire, propre au processus.
+
+    Une base en mémoire n'existe que dans sa connexion : tous les threads
+    partagent donc une seule connexion (SerializedStaticPool), prêtée à un
+    thread à la fois pour que leurs transactions ne se mélangent pas.
+    """
+
+    name = "memory"
+
+    def __init__(self):
+        super().__init__(":memory:")
+
+    def url(self) -> str:
+        return "sqlite://"
+
+    def engine_options(self) -> Dict[str, Any]:
+        return {
+            "poolclass": SerializedStaticPool,
+            "connect_args": {"check_same_thread": False},
+        }
+
+    def pragmas(self) -> Dict[str, Any]:
+        # Pas de journal WAL ni de mmap sans fichier
+        return {"temp_store": "MEMORY"}
+
+
+# Moteurs par nom (DB_BACKEND)
+BACKENDS = {
+    MySQLBackend.name: MySQLBackend,
+    SQLiteBackend.name: SQLiteBackend,
+    MemoryBackend.name: MemoryBackend,
+}
+
+DEFAULT_BACKEND = MySQLBackend.name
+
+
+def get_backend(name: str = "") -> Backend:
+    """
+    Moteur choisi par `name` ou, à défaut, par DB_BACKEND.
+
+    Raises:
+        ValueError: Moteur inconnu
+    """
+    load_dotenv()
+    name = (name or os.getenv("DB_BACKEND") or DEFAULT_BACKEND).strip().lower()
+    if name not in BACKENDS:
+        raise ValueError(f"Moteur de base inconnu : {name} (attendu : {', '.join(BACKENDS)})")
+    return BACKENDS[name]()
@@ -5,25 +5,174 @@ Module base.py
 
 Fonctions utilitaires pour la gestion des tâches :
 - création
-- récupération
+- opérations par lots (création, modification, suppression)
+- récupération (lecture légère via SQLAlchemy Core : TaskRecord)
+- suivi des modifications (révisions, tombstones, flux de changements)
+- recherche
+- pagination keyset par thème (et chargement complet du tableau)
+- synthèse du tableau (comptes par thème, en une requête GROUP BY)
 - sérialisation
 Gestion de session SQLAlchemy et typage complet.
 
+Les requêtes des appels fréquents sont préparées : construites une
+seule fois (`_prepared`), les valeurs passant par des bindparam. Un
+appel ne reconstruit donc ni la requête ni sa clé de cache, et SQLAlchemy
+en sert le texte compilé depuis son cache (taux de réussite :
+get_sql_stats()["compiled_cache"]).
+
 
 Auteur : SethiarWorks
 Date : 01-01-2026
 """
 
+import re
 from datetime import datetime
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Callable, Tuple, Iterable, Iterator, NamedTuple, Sequence
+
+from sqlalchemy import or_, and_, bindparam, case, func, insert, null, update, select
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import DBAPIError
+
+from app.database.engine import get_session
+from app.database.models.task import Task, TaskStatus, TaskPriority, DEFAULT_PRIORITY, task_revision
+
+
+# =======================
+# Requêtes préparées
+# =======================
+
+# Requêtes déjà construites, par (fonction de construction, variante)
+_statements: Dict[Tuple[Any, ...], Any] = {}
+
+# Table des tâches (écritures en Core : colonnes modifiées passées en paramètres)
+_task_table = Task.__table__
+
+
+def _prepared(build: Callable[..., Any], *variant: Any):
+    """
+    Requête construite par `build(*variant)` au premier appel, puis réutilisée.
+
+    La requête ne dépend que de sa variante (critère de tri, type de
+    recherche...) : toutes les valeurs sont des bindparam, fournis à
+    l'exécution. Sa clé de cache, mémorisée sur l'objet, n'est calculée
+    qu'une fois.
+    """
+    key = (build, *variant)
+    statement = _statements.get(key)
+    if statement is None:
+        statement = _statements.setdefault(key, build(*variant))
+    return statement
+
+
+# =======================
+# Révisions
+# =======================
+def _next_revision(session) -> int:
+    """
+    Attribue la révision de la transaction en cours.
+
+    L'incrément verrouille la ligne du compteur jusqu'au commit : deux
+    écritures concurrentes obtiennent des révisions croissantes dans
+    l'ordre de leurs commits, ce qui rend le flux de modifications sûr.
+    Sous MySQL, LAST_INSERT_ID(expr) renvoie la nouvelle valeur avec
+    l'UPDATE lui-même, sans SELECT.
+    """
+    if session.get_bind().dialect.name == "mysql":
+        result = session.execute(_prepared(_increment_revision_statement, True))
+        revision = result.lastrowid
+    else:
+        session.execute(_prepared(_increment_revision_statement, False))
+        revision = session.execute(_prepared(_revision_value_statement)).scalar_one()
+    # Lue au commit par le journal des opérations (mode hors ligne)
+    session.info["revision"] = revision
+    return revision
+
+
+def _increment_revision_statement(mysql: bool):
+    value = task_revision.c.value + 1
+    return update(task_revision).values(value=func.last_insert_id(value) if mysql else value)
+
+
+def _revision_value_statement():
+    return select(task_revision.c.value)
+
 
-from app.database.engine import SessionLocal
-from app.database.models.task import Task, TaskStatus, TaskPriority
+def _live():
+    """Clause des tâches non supprimées (hors tombstones)."""
+    return Task.deleted_at.is_(None)
+
+
+# =======================
+# Concurrence optimiste
+# =======================
+class TaskConflictError(RuntimeError):
+    """
+    Écriture refusée : la tâche a été modifiée ou supprimée depuis la
+    version lue par le client.
+
+    Attributs :
+        task_id (int): Tâche concernée
+        current (dict | None): État actuel en base (sérialisé), None si supprimée
+    """
+
+    def __init__(self, task_id: int, current: Optional[Dict[str, Any]]):
+        self.task_id = task_id
+        self.current = current
+        state = "supprimée" if current is None else "modifiée"
+        super().__init__(f"La tâche {task_id} a été {state} entre-temps")
+
+
+# Colonnes gérées par la base, jamais modifiées par le client
+_SYSTEM_COLUMNS = ("id", "created_at", "updated_at", "version", "revision", "deleted_at", "origin_key")
+
+
+def _current_state(session, task_id: int) -> Optional[Dict[str, Any]]:
+    """État courant d'une tâche après une écriture refusée (None si supprimée)."""
+    session.rollback()
+    records = _fetch_records(session, _prepared(_record_by_id_statement), {"task_id": task_id})
+    return serialize_task(records[0]) if records else None
+
+
+def _guarded(guarded: bool) -> list:
+    """
+    Conditions d'une écriture unitaire : tâche :task_id vivante et, si
+    `guarded`, à la version :expected_version.
+    """
+    clauses = [_task_table.c.id == bindparam("task_id"), _task_table.c.deleted_at.is_(None)]
+    if guarded:
+        clauses.append(_task_table.c.version == bindparam("expected_version"))
+    return clauses
+
+
+def _write_by_id_statement(guarded: bool):
+    """UPDATE d'une tâche ; les colonnes écrites (dont revision) sont passées en paramètres."""
+    return update(_task_table).where(*_guarded(guarded)).values(version=_task_table.c.version + 1)
+
+
+def _delete_by_id_statement(guarded: bool):
+    """Tombstone d'une tâche ; révision passée en paramètre."""
+    return (
+        update(_task_table)
+        .where(*_guarded(guarded))
+        .values(deleted_at=func.now(), version=_task_table.c.version + 1)
+    )
+
+
+def _target(task_id: int, expected_version: Optional[int]) -> Dict[str, Any]:
+    """Paramètres de _guarded."""
+    params = {"task_id": task_id}
+    if expected_version is not None:
+        params["expected_version"] = expected_version
+    return params
 
 
 # =======================
 # Création d'une tâche
-# =======================r
+# =======================
+def _insert_statement():
+    return insert(_task_table)
+
+
 def create_task(
     
     theme: str, title: str, description: str,
@@ -34,16 +183,20 @@ def create_task(
     """
     Crée une nouvelle tâche et la sauvegarde en base de données.
 
+    Un seul INSERT : l'id est celui renvoyé par le serveur, la tâche
+    n'est pas relue (created_at et updated_at restent à None dans
+    l'objet renvoyé).
+
     Args:
         theme (str): Thème de la tâche
         title (str): Titre de la tâche
         description (str): Description détaillée
         status (TaskStatus, optional): Statut de la tâche
-        priority (TaskPriority, optional): Priorité
+        priority (TaskPriority, optional): Priorité (DEFAULT_PRIORITY si absente)
         deadline (datetime, optional): Date limite
 
     Returns:
-        Task: L'objet Task créé et sauvegardé
+        Task: La tâche créée (objet détaché)
     """
     
     # Conversion si strings
@@ -51,26 +204,26 @@ def create_task(
         status = TaskStatus(status)
     if isinstance(priority, str):
         priority = TaskPriority(priority)
+    if priority is None:
+        priority = DEFAULT_PRIORITY
 
 
-    session = SessionLocal()
+    session = get_session()
     try:
-        new_task = Task(
+        values = dict(
             theme=theme,
             title=title,
             description=description,
             status=status,
             priority=priority,
-            deadline=deadline
+            deadline=deadline,
+            version=1,
+            revision=_next_revision(session)
         )
-        # Ajouter la tâche
-        session.add(new_task)
-        # Verification
-        print("Tentative de création :", theme, title, status, priority, deadline)
+        result = session.execute(_prepared(_insert_statement), values)
         # Enregistrer dans la dbb
         session.commit()
-        session.refresh(new_task)
-        return new_task
+        return Task(id=result.inserted_primary_key[0], **values)
 
     except Exception as e:
         session.rollback()
@@ -83,15 +236,39 @@ def create_task(
 # =======================
 # Suppression d'une tâche
 # =======================    
-def delete_task(task_id: int) -> bool:
-    session = SessionLocal()
+def delete_task(task_id: int, expected_version: Optional[int] = None) -> bool:
+    """
+    Supprime une tâche (tombstone : la ligne reste, marquée deleted_at).
+
+    Un seul UPDATE, conditionné à la version lue par le client si elle
+    est fournie.
+
+    Args:
+        task_id (int): Identifiant de la tâche
+        expected_version (int, optional): Version lue par le client
+
+    Returns:
+        bool: False si la tâche n'existe pas ou est déjà supprimée
+
+    Raises:
+        TaskConflictError: La tâche a été modifiée depuis `expected_version`
+    """
+    session = get_session()
     try:
-        task = session.query(Task).filter(Task.id == task_id).first()    
-        if not task:
+        result = session.execute(
+            _prepared(_delete_by_id_statement, expected_version is not None),
+            {**_target(task_id, expected_version), "revision": _next_revision(session)}
+        )
+        if result.rowcount == 0:
+            current = _current_state(session, task_id)
+            # Déjà supprimée : rien à faire ; encore présente : autre version
+            if expected_version is not None and current is not None:
+                raise TaskConflictError(task_id, current)
             return False
-        session.delete(task)
         session.commit()
         return True
+    except TaskConflictError:
+        raise
     except Exception as e:
         session.rollback()
         raise RuntimeError(f"Erreur lors de la suppression de la tâches : {e}") from e
@@ -102,35 +279,390 @@ def delete_task(task_id: int) -> bool:
 # =======================
 # Modification d'une tâche
 # =======================
-def update_task(task_id: int, **kwargs) -> Optional[Task]:
-    session = SessionLocal()
+def update_task(task_id: int, expected_version: Optional[int] = None, **kwargs) -> Optional[Dict[str, Any]]:
+    """
+    Modifie une tâche en un seul UPDATE, sans lecture préalable.
+
+    Args:
+        task_id (int): Identifiant de la tâche
+        expected_version (int, optional): Version lue par le client ;
+            sans elle, la dernière écriture l'emporte
+        **kwargs: Champs à modifier (colonnes de Task)
+
+    Returns:
+        Optional[dict]: Valeurs écrites (champs et revision ; la version
+        a été incrémentée), None si la tâche n'existe pas
+
+    Raises:
+        TaskConflictError: La tâche a été modifiée ou supprimée depuis
+            `expected_version`
+    """
+    values = {key: value for key, value in _task_row(kwargs).items() if key not in _SYSTEM_COLUMNS}
+
+    session = get_session()
     try:
-        task = session.query(Task).filter(Task.id == task_id).first()
-        if not task:
+        values["revision"] = _next_revision(session)
+        result = session.execute(
+            _prepared(_write_by_id_statement, expected_version is not None),
+            {**_target(task_id, expected_version), **values}
+        )
+        if result.rowcount == 0:
+            current = _current_state(session, task_id)
+            if expected_version is not None:
+                raise TaskConflictError(task_id, current)
             return None
-        for key, value in kwargs.items():
-            if hasattr(task, key):
-                setattr(task, key, value)
         session.commit()
-        session.refresh(task)
-        return task
+        return values
+    except TaskConflictError:
+        raise
     except Exception as e:
         session.rollback()
         raise RuntimeError(f"Erreur lors de la mise à jour de la tâche : {e}") from e
     finally:
-        session.close()        
-    
+        session.close()
+
+
+# =======================
+# Opérations par lots
+# =======================
+
+# Nombre de lignes envoyées par instruction
+DEFAULT_CHUNK_SIZE = 500
+
+
+def _chunks(items: Sequence[Any], size: int) -> Iterator[Sequence[Any]]:
+    """Découpe une séquence en tranches de `size` éléments."""
+    if size < 1:
+        raise ValueError("La taille des lots doit être strictement positive")
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def _task_row(data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Ne garde que les colonnes de Task et convertit statut / priorité en
+    Enum (une priorité absente devient DEFAULT_PRIORITY).
+    """
+    row = {key: value for key, value in data.items() if key in Task.__table__.columns}
+    if isinstance(row.get("status"), str):
+        row["status"] = TaskStatus(row["status"])
+    if isinstance(row.get("priority"), str):
+        row["priority"] = TaskPriority(row["priority"])
+    elif "priority" in row and row["priority"] is None:
+        row["priority"] = DEFAULT_PRIORITY
+    return row
+
+
+def create_tasks(tasks: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Crée plusieurs tâches en une seule transaction.
+
+    Chaque lot part en un INSERT multi-lignes ; aucune tâche n'est
+    relue après insertion.
+
+    Args:
+        tasks (Iterable[dict]): Champs de chaque tâche (mêmes clés que create_task)
+        chunk_size (int, optional): Nombre de tâches par INSERT
+
+    Returns:
+        int: Nombre de tâches créées
+    """
+    rows = []
+    for data in tasks:
+        row = _task_row(data)
+        row.setdefault("status", TaskStatus.A_FAIRE)
+        rows.append(row)
+    if not rows:
+        return 0
+
+    session = get_session()
+    try:
+        revision = _next_revision(session)
+        for row in rows:
+            row["revision"] = revision
+        for chunk in _chunks(rows, chunk_size):
+            session.execute(insert(Task), chunk)
+        session.commit()
+        return len(rows)
+    except Exception as e:
+        session.rollback()
+        raise RuntimeError(f"Erreur lors de la création des tâches : {e}") from e
+    finally:
+        session.close()
+
+
+def update_tasks(updates: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Met à jour plusieurs tâches en une seule transaction.
+
+    Chaque dictionnaire contient l'`id` de la tâche et les champs à
+    modifier ; les lignes sont envoyées par lots en `executemany`
+    (UPDATE ... WHERE id = ? AND deleted_at IS NULL, version incrémentée
+    au passage), sans SELECT préalable. Un id inconnu ou supprimé est
+    ignoré sans annuler les autres.
+
+    Args:
+        updates (Iterable[dict]): Modifications, chacune avec la clé "id"
+        chunk_size (int, optional): Nombre de lignes par executemany
+
+    Returns:
+        int: Nombre de tâches effectivement modifiées
+    """
+    rows = []
+    for data in updates:
+        row = _task_row(data)
+        if "id" not in row:
+            raise ValueError("Chaque modification doit contenir l'id de la tâche")
+        values = {key: value for key, value in row.items() if key not in _SYSTEM_COLUMNS}
+        if values:
+            rows.append({"task_id": row["id"], **values})
+    if not rows:
+        return 0
+
+    # Un executemany par jeu de colonnes modifiées
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+
+    session = get_session()
+    try:
+        revision = _next_revision(session)
+        matched = 0
+        for group in groups.values():
+            for row in group:
+                row["revision"] = revision
+            for chunk in _chunks(group, chunk_size):
+                matched += session.execute(_prepared(_write_by_id_statement, False), chunk).rowcount
+        session.commit()
+        return matched
+    except Exception as e:
+        session.rollback()
+        raise RuntimeError(f"Erreur lors de la mise à jour des tâches : {e}") from e
+    finally:
+        session.close()
+
+
+def update_tasks_guarded(
+    updates: Iterable[Tuple[int, Optional[int], Dict[str, Any]]]
+) -> Tuple[Dict[int, Dict[str, Any]], List[TaskConflictError]]:
+    """
+    Met à jour plusieurs tâches en une seule transaction, chacune
+    conditionnée à sa version (même garde que update_task).
+
+    Une tâche modifiée ou supprimée entre-temps n'est pas écrite, sans
+    empêcher l'écriture des autres.
+
+    Args:
+        updates (Iterable[tuple]): (id, version lue ou None, champs à modifier)
+
+    Returns:
+        Tuple[Dict[int, dict], List[TaskConflictError]]: Valeurs écrites
+        par id (comme update_task), et conflits (état actuel de chaque
+        tâche refusée)
+    """
+    rows = []
+    for task_id, expected_version, fields in updates:
+        values = {key: value for key, value in _task_row(fields).items() if key not in _SYSTEM_COLUMNS}
+        if values:
+            rows.append((task_id, expected_version, values))
+    if not rows:
+        return {}, []
+
+    session = get_session()
+    try:
+        revision = _next_revision(session)
+        written, refused = {}, []
+        for task_id, expected_version, values in rows:
+            values["revision"] = revision
+            result = session.execute(
+                _prepared(_write_by_id_statement, expected_version is not None),
+                {**_target(task_id, expected_version), **values}
+            )
+            if result.rowcount:
+                written[task_id] = values
+            else:
+                refused.append(task_id)
+
+        current = {}
+        if refused:
+            records = _fetch_records(session, _prepared(_records_by_ids_statement), {"task_ids": refused})
+            current = {record.id: serialize_task(record) for record in records}
+        session.commit()
+        return written, [TaskConflictError(task_id, current.get(task_id)) for task_id in refused]
+    except Exception as e:
+        session.rollback()
+        raise RuntimeError(f"Erreur lors de la mise à jour des tâches : {e}") from e
+    finally:
+        session.close()
+
+
+def _by_ids():
+    """Tâches vivantes parmi :task_ids (liste développée à l'exécution)."""
+    return (_task_table.c.id.in_(bindparam("task_ids", expanding=True)), _task_table.c.deleted_at.is_(None))
+
+
+def _delete_by_ids_statement():
+    return (
+        update(_task_table)
+        .where(*_by_ids())
+        .values(deleted_at=func.now(), version=_task_table.c.version + 1)
+    )
+
+
+def delete_tasks(task_ids: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """
+    Supprime plusieurs tâches en une seule transaction
+    (UPDATE ... WHERE id IN (...) par lot, les lignes restant comme tombstones).
+
+    Args:
+        task_ids (Iterable[int]): Identifiants des tâches
+        chunk_size (int, optional): Nombre d'ids par DELETE
+
+    Returns:
+        int: Nombre de tâches supprimées
+    """
+    ids = list(dict.fromkeys(task_ids))
+    if not ids:
+        return 0
+
+    session = get_session()
+    try:
+        revision = _next_revision(session)
+        deleted = 0
+        for chunk in _chunks(ids, chunk_size):
+            result = session.execute(
+                _prepared(_delete_by_ids_statement), {"task_ids": list(chunk), "revision": revision}
+            )
+            deleted += result.rowcount
+        session.commit()
+        return deleted
+    except Exception as e:
+        session.rollback()
+        raise RuntimeError(f"Erreur lors de la suppression des tâches : {e}") from e
+    finally:
+        session.close()
+
     
 
+# =======================
+# Lecture légère (Core)
+# =======================
+class TaskRecord(NamedTuple):
+    """
+    Ligne de la table task, lue sans l'ORM.
+
+    Simple tuple nommé : ni identity map, ni instrumentation des
+    attributs ; les dates restent des datetime et le statut / la
+    priorité des Enum. Mêmes noms d'attributs que Task, ce qui permet
+    de le passer à serialize_task ou _cursor_of.
+
+    La description n'est lue que sur demande (select_records(description=True)) ;
+    sinon elle vaut None.
+    """
+    id: int
+    theme: str
+    title: str
+    status: TaskStatus
+    description: Optional[str]
+    priority: TaskPriority
+    created_at: Optional[datetime]
+    deadline: Optional[datetime]
+    updated_at: Optional[datetime]
+    version: int
+    revision: int
+    deleted_at: Optional[datetime]
+
+
+# Colonnes lues, dans l'ordre des champs de TaskRecord
+_RECORD_COLUMNS = [Task.__table__.c[name] for name in TaskRecord._fields]
+
+# Idem sans la description (NULL à sa place) : listes et tableau
+_LIST_COLUMNS = [
+    null().label("description") if column.name == "description" else column
+    for column in _RECORD_COLUMNS
+]
+
+# Lignes récupérées par aller-retour lors d'une lecture en flux
+FETCH_BATCH_SIZE = 2000
+
+
+def select_records(description: bool = False):
+    """
+    SELECT des colonnes de TaskRecord, à compléter (where, order_by...).
+
+    Args:
+        description (bool, optional): Lire aussi la description ; par
+            défaut elle n'est pas transférée (None dans les TaskRecord)
+    """
+    return select(*(_RECORD_COLUMNS if description else _LIST_COLUMNS))
+
+
+def _iter_records(session, statement, params: Optional[Dict[str, Any]] = None) -> Iterator[TaskRecord]:
+    """
+    Exécute un select_records() (avec ses paramètres) et en lit les
+    lignes en flux, par lots de FETCH_BATCH_SIZE : chaque lot est
+    converti en TaskRecord avant la lecture du suivant.
+    """
+    result = session.execute(statement, params, execution_options={"yield_per": FETCH_BATCH_SIZE})
+    for partition in result.partitions():
+        yield from map(TaskRecord._make, partition)
+
+
+def _fetch_records(session, statement, params: Optional[Dict[str, Any]] = None) -> List[TaskRecord]:
+    """Exécute un select_records() (avec ses paramètres) et renvoie des TaskRecord."""
+    return list(_iter_records(session, statement, params))
+
+
+def _record_by_id_statement():
+    return select_records().where(Task.id == bindparam("task_id"), _live())
+
+
+def _records_by_ids_statement():
+    return select_records().where(*_by_ids())
+
+
+def _board_statement():
+    return select_records().where(_live()).order_by(Task.deadline)
+
+
+def iter_task_records(*criteria, order_by=None, description: bool = False) -> Iterator[TaskRecord]:
+    """
+    Parcourt les tâches non supprimées en flux (curseur serveur sous
+    MySQL, FETCH_BATCH_SIZE lignes à la fois) : la mémoire ne dépend pas
+    de la taille de la table.
+
+    Args:
+        *criteria: Conditions supplémentaires (clauses SQLAlchemy)
+        order_by (optional): Clé ou liste de clés de tri
+        description (bool, optional): Lire aussi les descriptions
+
+    Yields:
+        TaskRecord: Une tâche
+    """
+    statement = select_records(description).where(_live(), *criteria)
+    if order_by is not None:
+        statement = statement.order_by(*(order_by if isinstance(order_by, (list, tuple)) else [order_by]))
+
+    session = get_session()
+    try:
+        yield from _iter_records(session, statement)
+    finally:
+        session.close()
+
+
 # =======================       
 # Sérialisation d'une tâche       
 # =======================
 def serialize_task(task : Task):
     """
-    Sérialise un objet Task en dictionnaire pour affichage ou API.
+    Sérialise une tâche en dictionnaire pour affichage ou API.
+
+    Seul endroit où les dates deviennent des chaînes ISO et les Enum
+    leurs libellés. La description vaut None si elle n'a pas été lue
+    (voir get_task_description).
 
     Args:
-        task (Task): Objet Task à sérialiser
+        task (Task | TaskRecord): Tâche à sérialiser
 
     Returns:
         dict: Dictionnaire avec les champs sérialisés
@@ -143,22 +675,557 @@ def serialize_task(task : Task):
         "description": task.description,
         "priority": task.priority.value if task.priority else None,
         "created_at": task.created_at.isoformat() if task.created_at else None,
-        "deadline": task.deadline.isoformat() if task.deadline else None
+        "deadline": task.deadline.isoformat() if task.deadline else None,
+        "updated_at": task.updated_at.isoformat() if task.updated_at else None,
+        "version": task.version,
+        "revision": task.revision
     }
     
     
-def get_all_tasks() -> List[Dict[str, Any]]:
+def get_all_tasks() -> List[TaskRecord]:
     """
-    Récupère toutes les tâches triées par deadline et les sérialise.
+    Récupère toutes les tâches triées par deadline.
+
+    Les lignes sont lues en flux et gardées en TaskRecord : la
+    sérialisation (serialize_task) revient à l'appelant, côté interface.
 
     Returns:
-        List[dict]: Liste de tâches sérialisées
+        List[TaskRecord]: Tâches, sans description
     """
-    session = SessionLocal()
+    session = get_session()
     try:
-        tasks = session.query(Task).order_by(Task.deadline).all()
-        return [serialize_task(task) for task in tasks]
+        return _fetch_records(session, _prepared(_board_statement))
     finally:
         session.close()
-        
-        
\ No newline at end of file
+
+
+def load_all_tasks() -> Tuple[List[TaskRecord], int]:
+    """
+    Charge toutes les tâches et la révision correspondante.
+
+    Les deux lectures partagent la même transaction : la révision
+    renvoyée est le point de départ exact de get_tasks_changed_since.
+    Comme get_all_tasks, les tâches restent des TaskRecord.
+
+    Returns:
+        Tuple[List[TaskRecord], int]: Tâches et révision
+    """
+    session = get_session()
+    try:
+        revision = _current_revision(session)
+        return _fetch_records(session, _prepared(_board_statement)), revision
+    finally:
+        session.close()
+
+
+# =======================
+# Flux de modifications
+# =======================
+def _max_revision_statement():
+    return select(func.max(Task.revision))
+
+
+def _changed_since_statement():
+    return select_records().where(Task.revision > bindparam("revision"))
+
+
+def _current_revision(session) -> int:
+    return session.execute(_prepared(_max_revision_statement)).scalar() or 0
+
+
+def get_tasks_revision() -> int:
+    """
+    Dernière révision écrite (MAX(revision), lu sur l'index ix_task_revision).
+
+    Sonde peu coûteuse : un client compare la valeur à la sienne avant
+    de demander les modifications.
+    """
+    session = get_session()
+    try:
+        return _current_revision(session)
+    finally:
+        session.close()
+
+
+def get_tasks_changed_since(revision: int) -> Tuple[List[TaskRecord], List[int], int]:
+    """
+    Tâches écrites après une révision.
+
+    Args:
+        revision (int): Dernière révision connue du client
+
+    Returns:
+        Tuple[List[TaskRecord], List[int], int]: Tâches créées ou
+        modifiées, ids des tâches supprimées, et nouvelle révision
+    """
+    session = get_session()
+    try:
+        changed, deleted, latest = [], [], revision
+        for task in _iter_records(session, _prepared(_changed_since_statement), {"revision": revision}):
+            if task.deleted_at is None:
+                changed.append(task)
+            else:
+                deleted.append(task.id)
+            latest = max(latest, task.revision)
+        return changed, deleted, latest
+    finally:
+        session.close()
+
+
+# =======================
+# Recherche de tâches
+# =======================
+
+# Taille minimale d'un mot indexé par InnoDB (innodb_ft_min_token_size)
+FULLTEXT_MIN_TOKEN = 3
+
+# Code d'erreur MySQL : aucun index FULLTEXT sur les colonnes demandées
+_ER_FT_MATCHING_KEY_NOT_FOUND = 1191
+
+# Opérateurs du mode booléen MySQL, retirés de la saisie utilisateur
+_BOOLEAN_OPERATORS = re.compile(r'[+\-<>()~*"@]+')
+
+# Passe à False si la base ne possède pas encore l'index plein texte
+_fulltext_available = True
+
+
+def _fulltext_terms(query: str) -> List[str]:
+    """
+    Découpe la recherche en mots exploitables par MATCH ... AGAINST.
+
+    Returns:
+        List[str]: Mots nettoyés, ou liste vide si un mot est trop court
+        pour l'index (la recherche bascule alors sur LIKE).
+    """
+    terms = _BOOLEAN_OPERATORS.sub(" ", query).split()
+    if not terms or any(len(term) < FULLTEXT_MIN_TOKEN for term in terms):
+        return []
+    return terms
+
+
+# Types de recherche (variantes des requêtes préparées)
+SEARCH_FULLTEXT = "fulltext"
+SEARCH_LIKE = "like"
+
+# Caractère d'échappement des motifs LIKE
+_LIKE_ESCAPE = "/"
+
+
+def _search_clause(search: Optional[str]):
+    """
+    Clause de recherche d'un type (None : aucune), valeur en paramètre :
+    - SEARCH_FULLTEXT : MATCH ... AGAINST (:against) en mode booléen
+    - SEARCH_LIKE : LIKE insensible à la casse sur :pattern, pour les
+      bases sans index plein texte
+    """
+    if search == SEARCH_FULLTEXT:
+        return match(
+            Task.theme, Task.title, Task.description, against=bindparam("against")
+        ).in_boolean_mode()
+    if search == SEARCH_LIKE:
+        pattern = bindparam("pattern")
+        return or_(
+            Task.theme.icontains(pattern, escape=_LIKE_ESCAPE),
+            Task.title.icontains(pattern, escape=_LIKE_ESCAPE),
+            Task.description.icontains(pattern, escape=_LIKE_ESCAPE),
+        )
+    return None
+
+
+def _fulltext_params(terms: List[str]) -> Dict[str, Any]:
+    """Chaque mot est requis, en préfixe."""
+    return {"against": " ".join(f"+{term}*" for term in terms)}
+
+
+def _like_params(query: str) -> Dict[str, Any]:
+    """Saisie échappée : %, _ et / y sont cherchés littéralement."""
+    pattern = query.replace(_LIKE_ESCAPE, _LIKE_ESCAPE * 2)
+    for wildcard in ("%", "_"):
+        pattern = pattern.replace(wildcard, _LIKE_ESCAPE + wildcard)
+    return {"pattern": pattern}
+
+
+def _with_search(
+    session, query: str, fetch: Callable[[Optional[str], Dict[str, Any]], List[Any]]
+) -> List[Any]:
+    """
+    Exécute `fetch` avec le type de recherche adapté à la base.
+
+    Sous MySQL, la recherche passe par l'index FULLTEXT `ix_task_search` ;
+    seules les lignes correspondantes sont renvoyées par le serveur.
+    Les autres backends, les mots trop courts pour l'index et les bases
+    dont l'index n'existe pas encore utilisent un LIKE.
+
+    Args:
+        session: Session SQLAlchemy ouverte
+        query (str): Texte saisi par l'utilisateur (vide : pas de filtre)
+        fetch (Callable): Reçoit le type de recherche (SEARCH_*, None :
+            pas de filtre) et les paramètres de sa clause, et exécute la
+            requête (voir _search_clause)
+
+    Returns:
+        List: Résultat de `fetch`
+    """
+    global _fulltext_available
+
+    query = query.strip()
+    if not query:
+        return fetch(None, {})
+
+    terms = _fulltext_terms(query)
+    use_fulltext = (
+        _fulltext_available
+        and terms
+        and session.get_bind().dialect.name == "mysql"
+    )
+
+    if use_fulltext:
+        try:
+            return fetch(SEARCH_FULLTEXT, _fulltext_params(terms))
+        except DBAPIError as e:
+            if e.orig is None or e.orig.args[0] != _ER_FT_MATCHING_KEY_NOT_FOUND:
+                raise
+            session.rollback()
+            _fulltext_available = False
+            print("[search_tasks] Index FULLTEXT absent, recherche par LIKE")
+
+    return fetch(SEARCH_LIKE, _like_params(query))
+
+
+def _search_ids_statement(search: Optional[str]):
+    return select(Task.id).where(_live(), _search_clause(search))
+
+
+def _search_records_statement(search: Optional[str]):
+    return select_records().where(_live(), _search_clause(search)).order_by(Task.deadline)
+
+
+def _description_statement():
+    return select(Task.description).where(Task.id == bindparam("task_id"), _live())
+
+
+def search_task_ids(query: str) -> List[int]:
+    """
+    Identifiants des tâches correspondant à la recherche.
+
+    La recherche porte aussi sur les descriptions, mais seuls les ids
+    sont transférés : l'affichage filtre ensuite les tâches déjà en cache.
+
+    Args:
+        query (str): Texte saisi par l'utilisateur (non vide)
+
+    Returns:
+        List[int]: Identifiants des tâches trouvées
+    """
+    session = get_session()
+    try:
+        rows = _with_search(
+            session, query,
+            lambda search, params: session.execute(_prepared(_search_ids_statement, search), params).all()
+        )
+        return [row.id for row in rows]
+    finally:
+        session.close()
+
+
+def get_task_description(task_id: int) -> Optional[str]:
+    """
+    Description d'une tâche, chargée à la demande (dialogue, formulaire).
+
+    Returns:
+        Optional[str]: La description, None si la tâche n'existe pas
+    """
+    session = get_session()
+    try:
+        return session.execute(
+            _prepared(_description_statement), {"task_id": task_id}
+        ).scalar_one_or_none()
+    finally:
+        session.close()
+
+
+def search_tasks(query: str) -> List[TaskRecord]:
+    """
+    Recherche les tâches dont le thème, le titre ou la description
+    correspondent à la saisie, triées par deadline.
+
+    Args:
+        query (str): Texte saisi par l'utilisateur
+
+    Returns:
+        List[TaskRecord]: Tâches trouvées, sans description
+    """
+    if not query.strip():
+        return get_all_tasks()
+
+    session = get_session()
+    try:
+        return _with_search(
+            session, query,
+            lambda search, params: _fetch_records(
+                session, _prepared(_search_records_statement, search), params
+            )
+        )
+    finally:
+        session.close()
+
+
+# =======================
+# Pagination par thème (keyset)
+# =======================
+
+# Critères de tri proposés par l'écran des tâches
+SORT_DEADLINE = "Date de fin"
+SORT_PRIORITY = "Urgence"
+SORT_DEADLINE_PRIORITY = "Deadline puis Urgence"
+
+DEFAULT_PAGE_SIZE = 50
+
+Cursor = Tuple[Any, ...]
+
+
+def _sort_keys(sort_key: str) -> Tuple[list, bool]:
+    """
+    Clés de tri d'un critère, toutes croissantes et terminées par l'id.
+
+    Colonnes nues, sans expression : la priorité est stockée sous un
+    code dont l'ordre est celui de l'urgence (PRIORITY_CODES), et chaque
+    tri est servi par un index (theme, clés..., id).
+
+    Returns:
+        Tuple[list, bool]: Les clés, et True si la première clé est la
+        deadline (les tâches sans deadline sont alors servies en dernier).
+    """
+    if sort_key == SORT_PRIORITY:
+        return [Task.priority, Task.id], False
+    if sort_key == SORT_DEADLINE_PRIORITY:
+        return [Task.deadline, Task.priority, Task.id], True
+    return [Task.deadline, Task.id], True
+
+
+def _cursor_of(task: Task, sort_key: str) -> Cursor:
+    """Valeurs des clés de tri de la dernière tâche d'une page."""
+    if sort_key == SORT_PRIORITY:
+        return (task.priority, task.id)
+    if sort_key == SORT_DEADLINE_PRIORITY:
+        return (task.deadline, task.priority, task.id)
+    return (task.deadline, task.id)
+
+
+def _seek_after(keys: list, values: list):
+    """
+    Prédicat (k1, k2, ...) > (v1, v2, ...) développé en OR / AND,
+    forme que l'optimiseur sait transformer en parcours d'index.
+    """
+    clause = keys[-1] > values[-1]
+    for key, value in zip(reversed(keys[:-1]), reversed(values[:-1])):
+        clause = or_(key > value, and_(key == value, clause))
+    return clause
+
+
+def _themes_statement(search: Optional[str]):
+    statement = select(Task.theme).where(_live())
+    if search is not None:
+        statement = statement.where(_search_clause(search))
+    return statement.distinct().order_by(Task.theme)
+
+
+# Segments d'une page triée d'abord par deadline
+_DATED = "dated"
+_UNDATED = "undated"
+
+
+def _page_statement(sort_key: str, segment: Optional[str], seek: bool, search: Optional[str]):
+    """
+    Page d'un thème (:theme), :limit tâches, après le curseur (:seek_0,
+    :seek_1...) si `seek`. Le segment _UNDATED est trié sans la deadline.
+    """
+    keys, _ = _sort_keys(sort_key)
+    statement = select_records().where(Task.theme == bindparam("theme"), _live())
+    if search is not None:
+        statement = statement.where(_search_clause(search))
+    if segment == _DATED:
+        statement = statement.where(Task.deadline.isnot(None))
+    elif segment == _UNDATED:
+        statement = statement.where(Task.deadline.is_(None))
+        keys = keys[1:]
+    if seek:
+        statement = statement.where(
+            _seek_after(keys, [bindparam(f"seek_{index}") for index in range(len(keys))])
+        )
+    return statement.order_by(*keys).limit(bindparam("limit"))
+
+
+def get_themes(search: str = "") -> List[str]:
+    """
+    Liste les thèmes ayant au moins une tâche (correspondant à la recherche).
+
+    Args:
+        search (str, optional): Texte de recherche
+
+    Returns:
+        List[str]: Thèmes triés par ordre alphabétique
+    """
+    session = get_session()
+    try:
+        def fetch(search_type, params):
+            return session.execute(_prepared(_themes_statement, search_type), params).all()
+
+        return [row.theme for row in _with_search(session, search, fetch)]
+    finally:
+        session.close()
+
+
+def get_tasks_page(
+    theme: str,
+    sort_key: str = SORT_DEADLINE,
+    after: Optional[Cursor] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+    search: str = ""
+) -> Tuple[List[TaskRecord], Optional[Cursor]]:
+    """
+    Récupère une page de tâches d'un thème, par pagination keyset.
+
+    Chaque page reprend strictement après le curseur de la précédente
+    (prédicat de recherche sur les clés de tri, sans OFFSET) : le coût
+    d'une page ne dépend pas de sa position ni de la taille de la table.
+    Quand le tri commence par la deadline, les tâches datées sont servies
+    d'abord, puis celles sans deadline.
+
+    Args:
+        theme (str): Thème de la colonne
+        sort_key (str, optional): Critère de tri (SORT_*)
+        after (Cursor, optional): Curseur renvoyé par la page précédente
+        limit (int, optional): Taille de la page
+        search (str, optional): Texte de recherche
+
+    Returns:
+        Tuple[List[TaskRecord], Optional[Cursor]]: Tâches et curseur de
+        la page suivante (None s'il n'y en a plus)
+    """
+    _, by_deadline = _sort_keys(sort_key)
+
+    session = get_session()
+    try:
+        def fetch_segment(search_type, params, segment, seek, count):
+            statement = _prepared(_page_statement, sort_key, segment, seek is not None, search_type)
+            params = {**params, "theme": theme, "limit": count}
+            for index, value in enumerate(seek or ()):
+                params[f"seek_{index}"] = value
+            return _fetch_records(session, statement, params)
+
+        def fetch(search_type, params):
+            if not by_deadline:
+                return fetch_segment(search_type, params, None, after, limit + 1)
+
+            rows = []
+            # Tâches datées, tant que le curseur n'est pas passé aux autres
+            if after is None or after[0] is not None:
+                rows = fetch_segment(search_type, params, _DATED, after, limit + 1)
+            # Tâches sans deadline, triées sur les clés restantes
+            if len(rows) <= limit:
+                seek = after[1:] if after is not None and after[0] is None else None
+                rows += fetch_segment(search_type, params, _UNDATED, seek, limit + 1 - len(rows))
+            return rows
+
+        tasks = _with_search(session, search, fetch)
+        next_cursor = _cursor_of(tasks[limit - 1], sort_key) if len(tasks) > limit else None
+        return tasks[:limit], next_cursor
+    finally:
+        session.close()
+
+
+def get_board_pages(
+    sort_key: str = SORT_DEADLINE,
+    search: str = "",
+    limit: int = DEFAULT_PAGE_SIZE
+) -> List[Tuple[str, List[TaskRecord], Optional[Cursor]]]:
+    """
+    Première page de chaque thème, pour un chargement complet du tableau.
+
+    Args:
+        sort_key (str, optional): Critère de tri (SORT_*)
+        search (str, optional): Texte de recherche
+        limit (int, optional): Taille des pages
+
+    Returns:
+        List[Tuple[str, List[TaskRecord], Optional[Cursor]]]: Pour chaque
+        thème, ses tâches et le curseur de la page suivante
+    """
+    board = []
+    for theme in get_themes(search):
+        tasks, cursor = get_tasks_page(theme, sort_key, limit=limit, search=search)
+        board.append((theme, tasks, cursor))
+    return board
+
+
+# =======================
+# Synthèse du tableau
+# =======================
+
+# Statuts d'une tâche ouverte (en retard si sa deadline est passée)
+OPEN_STATUSES = (TaskStatus.A_FAIRE, TaskStatus.EN_COURS)
+
+
+class ThemeSummary(NamedTuple):
+    """
+    Comptes des tâches (non supprimées) d'un thème.
+
+    Attributs :
+        total (int): Toutes les tâches
+        open (int): Tâches ouvertes (OPEN_STATUSES)
+        overdue (int): Tâches ouvertes dont la deadline est passée
+        by_status (Dict[str, int]): Par libellé de statut
+        by_priority (Dict[str, int]): Par libellé de priorité
+    """
+    total: int
+    open: int
+    overdue: int
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+
+
+def _summary_statement():
+    # COUNT ignore les NULL : seules les deadlines passées sont comptées
+    overdue = func.count(case((Task.deadline < bindparam("now", type_=Task.deadline.type), 1)))
+    return (
+        select(Task.theme, Task.status, Task.priority, func.count().label("total"), overdue.label("overdue"))
+        .where(_live())
+        .group_by(Task.theme, Task.status, Task.priority)
+    )
+
+
+def get_board_summary(now: Optional[datetime] = None) -> Dict[str, ThemeSummary]:
+    """
+    Comptes de chaque thème, sans lire les tâches : une seule requête
+    GROUP BY theme, status, priority, dont le serveur ne renvoie qu'une
+    ligne par combinaison (au plus 16 par thème).
+
+    Args:
+        now (datetime, optional): Instant de référence des retards
+            (défaut : maintenant, heure locale comme les deadlines)
+
+    Returns:
+        Dict[str, ThemeSummary]: Comptes par thème
+    """
+    session = get_session()
+    try:
+        rows = session.execute(_prepared(_summary_statement), {"now": now or datetime.now()}).all()
+    finally:
+        session.close()
+
+    themes: Dict[str, Dict[str, Any]] = {}
+    for row in rows:
+        counts = themes.setdefault(
+            row.theme, {"total": 0, "open": 0, "overdue": 0, "by_status": {}, "by_priority": {}}
+        )
+        counts["total"] += row.total
+        if row.status in OPEN_STATUSES:
+            counts["open"] += row.total
+            counts["overdue"] += row.overdue
+        status = row.status.value
+        counts["by_status"][status] = counts["by_status"].get(status, 0) + row.total
+        if row.priority is not None:
+            priority = row.priority.value
+            counts["by_priority"][priority] = counts["by_priority"].get(priority, 0) + row.total
+    return {theme: ThemeSummary(**counts) for theme, counts in themes.items()}
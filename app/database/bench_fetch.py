@@ -0,0 +1,111 @@
+# app/database/bench_fetch.py
+
+"""
+Module bench_fetch.py
+
+Mesure du coût par ligne des lectures en masse de la table task :
+
+- orm : instances Task (identity map) puis serialize_task
+- core : TaskRecord (select Core, sans ORM) puis serialize_task
+- core sans sérialisation : TaskRecord seuls
+- tableau : TaskRecord sans description (lecture du tableau)
+
+Les trois premières mesures lisent les lignes complètes, description
+comprise.
+
+Usage :
+    python -m app.database.bench_fetch [--rows 100000] [--url sqlite://]
+
+Sans --url, la mesure se fait sur une base SQLite en mémoire remplie
+pour l'occasion ; avec une URL, sur la table existante (aucune écriture).
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session, undefer
+
+from app.database.base import _fetch_records, _live, select_records, serialize_task
+from app.database.models.task import Base, Task, TaskStatus, TaskPriority, task_revision
+
+
+def _seed(engine, rows: int) -> None:
+    """Crée le schéma et insère `rows` tâches aléatoires."""
+    Base.metadata.create_all(engine)
+    start = datetime(2026, 1, 1)
+    priorities = list(TaskPriority)
+    with engine.begin() as conn:
+        conn.execute(task_revision.insert().values(id=1, value=1))
+        batch = []
+        for number in range(rows):
+            batch.append({
+                "theme": f"Thème {number % 12}",
+                "title": f"Tâche {number}",
+                "description": "Description " * 8,
+                "status": random.choice(list(TaskStatus)),
+                "priority": random.choice(priorities),
+                "deadline": start + timedelta(hours=number) if number % 5 else None,
+                "revision": 1,
+            })
+            if len(batch) == 5000:
+                conn.execute(insert(Task), batch)
+                batch.clear()
+        if batch:
+            conn.execute(insert(Task), batch)
+
+
+def _measure(label: str, engine, fetch) -> None:
+    with Session(engine) as session:
+        begin = time.perf_counter()
+        count = len(fetch(session))
+        elapsed = time.perf_counter() - begin
+    per_row = elapsed / count * 1e6 if count else 0.0
+    print(f"{label:<28} {count:>8} lignes  {elapsed:7.3f} s  {per_row:6.2f} µs/ligne")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coût par ligne des lectures de tâches")
+    parser.add_argument("--rows", type=int, default=100_000, help="Tâches générées (base en mémoire)")
+    parser.add_argument("--url", default=None, help="Base existante à mesurer (lecture seule)")
+    args = parser.parse_args()
+
+    if args.url:
+        engine = create_engine(args.url)
+    else:
+        engine = create_engine("sqlite://")
+        _seed(engine, args.rows)
+
+    statement = select_records(description=True).where(_live()).order_by(Task.deadline)
+    board_statement = select_records().where(_live()).order_by(Task.deadline)
+
+    _measure(
+        "orm + serialize_task", engine,
+        lambda session: [
+            serialize_task(task)
+            for task in session.query(Task).options(undefer(Task.description))
+            .filter(_live()).order_by(Task.deadline).all()
+        ]
+    )
+    _measure(
+        "core + serialize_task", engine,
+        lambda session: [serialize_task(record) for record in _fetch_records(session, statement)]
+    )
+    _measure(
+        "core (TaskRecord seuls)", engine,
+        lambda session: _fetch_records(session, statement)
+    )
+    _measure(
+        "tableau (sans description)", engine,
+        lambda session: [serialize_task(record) for record in _fetch_records(session, board_statement)]
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,61 +6,191 @@ Module engine.py
 Configuration de la base de données pour l'application Kairo.
 
 - Chargement des variables d'environnement via dotenv
-- Création de l'engine SQLAlchemy
-- Création de la session factory (SessionLocal)
+- Choix du moteur de stockage (app.database.backends : MySQL, SQLite,
+  mémoire)
+- Création différée de l'engine SQLAlchemy (`get_engine()`)
+- Session factory (SessionLocal) et accès aux sessions (`get_session()`)
+- Pré-ouverture d'une connexion du pool (`warm_up()`)
+- Mode hors ligne (DB_REPLICA) : l'application travaille sur un réplica
+  SQLite local, le serveur n'est joint que par la synchronisation
+  (`get_remote_engine()`, `get_remote_session()`, voir app.database.sync)
+- Mesures des requêtes et du pool (app.database.instrumentation)
+
+Rien n'est connecté à l'import : l'engine est créé au premier accès et
+la première connexion (poignée de main MySQL) a lieu au premier appel, normalement le
+`warm_up()` lancé sur le thread de la base pendant l'affichage de la
+fenêtre.
+
+La création et l'évolution du schéma relèvent de app.database.migrations,
+lancé explicitement au démarrage.
+
+Variables d'environnement (fichier .env) :
+    DB_BACKEND : moteur de stockage (voir app.database.backends)
+    DB_REPLICA : fichier du réplica local ; active le mode hors ligne,
+        DB_BACKEND désignant alors le serveur (défaut : désactivé)
+    DB_USER, DB_PASSWORD, DB_HOST, DB_NAME : connexion MySQL
+    DB_INSTRUMENT : mesures des requêtes et du pool (défaut : activé)
+    DB_SLOW_QUERY_MS : seuil du journal des requêtes lentes, en ms (défaut : 200)
+    DB_QUERY_CACHE_SIZE : requêtes compilées conservées par engine (défaut : 500)
+    DB_POOL_SIZE, DB_MAX_OVERFLOW : taille du pool (défaut : 5, 10)
+    DB_POOL_RECYCLE : durée de vie d'une connexion MySQL, en secondes (défaut : 3600)
+    DB_POOL_TIMEOUT : attente d'une connexion libre, en secondes (défaut : 30)
+    DB_CONNECT_TIMEOUT : délai de connexion au serveur MySQL, en secondes (défaut : 5)
 
 
 Auteur : SethiarWorks
 Date : 01-01-2026
 """
 import os
+import threading
+from typing import Optional
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
 from dotenv import load_dotenv
 
-load_dotenv()
+from app.database.backends import _env_int, get_backend, Backend, SQLiteBackend
+from app.database.instrumentation import (
+    DEFAULT_SLOW_QUERY_MS, SQL_STATS, TimedQueuePool, instrument
+)
+from app.database.oplog import install_oplog
+
 
 # =======================
-# Variables d'environnement
+# Configuration
 # =======================
-DB_USER = os.getenv("DB_USER")
-DB_PASSWORD = os.getenv("DB_PASSWORD")
-DB_HOST = os.getenv("DB_HOST")
-DB_NAME = os.getenv("DB_NAME")
+def _env_bool(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def database_url() -> str:
+    """URL de connexion du moteur choisi par l'environnement."""
+    return get_backend().url()
+
+
+def replica_path() -> str:
+    """Fichier du réplica local ("" : mode hors ligne désactivé)."""
+    load_dotenv()
+    return os.getenv("DB_REPLICA", "").strip()
 
-# URL de connexion
-DATABASE_URL = f"mysql+pymysql://{DB_USER}:{DB_PASSWORD}@{DB_HOST}/{DB_NAME}"
 
 # =======================
 # Engine SQLAlchemy
 # =======================
-engine = create_engine(
-    DATABASE_URL,
-    echo=True,
-    future=True
-)
+# Taille du cache de compilation par défaut (celle de SQLAlchemy)
+DEFAULT_QUERY_CACHE_SIZE = 500
+
+_engine: Optional[Engine] = None
+_remote_engine: Optional[Engine] = None
+_engine_lock = threading.Lock()
+
+
+def _create_engine(backend: Backend) -> Engine:
+    """Engine d'un moteur, instrumenté sauf DB_INSTRUMENT=0."""
+    options = backend.engine_options()
+    instrumented = _env_bool("DB_INSTRUMENT", True)
+    if instrumented and options.get("poolclass") is QueuePool:
+        # Attente d'une connexion libre mesurée
+        options["poolclass"] = TimedQueuePool
+    # Requêtes compilées réutilisées (cache LRU de SQLAlchemy)
+    options.setdefault("query_cache_size", _env_int("DB_QUERY_CACHE_SIZE", DEFAULT_QUERY_CACHE_SIZE))
+    engine = create_engine(backend.url(), future=True, **options)
+    backend.configure(engine)
+    if instrumented:
+        SQL_STATS.slow_query_ms = _env_int("DB_SLOW_QUERY_MS", DEFAULT_SLOW_QUERY_MS)
+        instrument(engine)
+    return engine
+
+
+def get_engine() -> Engine:
+    """
+    Retourne l'engine de l'application, créé au premier appel.
+
+    La création n'ouvre aucune connexion ; l'accès est sûr depuis
+    plusieurs threads. En mode hors ligne, c'est l'engine du réplica
+    local, dont les écritures sont journalisées (app.database.oplog).
+    """
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                replica = replica_path()
+                engine = _create_engine(SQLiteBackend(replica) if replica else get_backend())
+                if replica:
+                    install_oplog(SessionLocal)
+                SessionLocal.configure(bind=engine)
+                _engine = engine
+    return _engine
+
+
+def get_remote_engine() -> Optional[Engine]:
+    """
+    Engine du serveur en mode hors ligne (None hors de ce mode : le
+    serveur est alors l'engine de l'application).
+    """
+    global _remote_engine
+    if _remote_engine is None and replica_path():
+        with _engine_lock:
+            if _remote_engine is None:
+                engine = _create_engine(get_backend())
+                RemoteSession.configure(bind=engine)
+                _remote_engine = engine
+    return _remote_engine
+
+
+def warm_up() -> None:
+    """
+    Ouvre une connexion, la vérifie (SELECT 1) et la rend au pool.
+
+    À lancer sur le thread de la base au démarrage : le premier accès
+    aux données réutilise cette connexion au lieu de payer la poignée
+    de main.
+    """
+    with get_engine().connect() as conn:
+        conn.execute(text("SELECT 1"))
 
 
 # =======================
 # Session factory
 # =======================
 SessionLocal = sessionmaker(
-    bind=engine,
     autocommit=False,
     autoflush=False,
     future=True)
 
 """
-SessionLocal : factory pour créer des sessions SQLAlchemy.
+SessionLocal : factory pour créer des sessions SQLAlchemy, liée à
+l'engine lors de sa création. Passer par `get_session()`, qui crée
+l'engine au besoin.
 Exemple :
-    with SessionLocal() as session:
+    with get_session() as session:
         session.query(Task).all()
+
+Le schéma n'est pas créé à l'import : voir app.database.migrations.
 """
 
 
-from app.database.models.task import Task
-# Création de la table task
-Task.metadata.create_all(engine)
\ No newline at end of file
+def get_session() -> Session:
+    """Nouvelle session, liée à l'engine de l'application."""
+    get_engine()
+    return SessionLocal()
+
+
+# Sessions du serveur, en mode hors ligne (synchronisation)
+RemoteSession = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    future=True)
+
+
+def get_remote_session() -> Session:
+    """Nouvelle session sur le serveur (mode hors ligne uniquement)."""
+    if get_remote_engine() is None:
+        raise RuntimeError("Mode hors ligne désactivé (DB_REPLICA) : pas de serveur distinct")
+    return RemoteSession()
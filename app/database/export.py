@@ -0,0 +1,291 @@
+# app/database/export.py
+
+"""
+Module export.py
+
+Export des tâches vers un fichier, en flux :
+
+- CSV (une ligne d'en-tête puis une ligne par tâche)
+- NDJSON (un objet JSON par ligne, format de serialize_task)
+- iCalendar (.ics) : une tâche par VTODO (échéance DUE) ou, pour les
+  seules tâches datées, par VEVENT
+
+Chaque format est un générateur de texte branché sur iter_task_records
+(curseur serveur, FETCH_BATCH_SIZE lignes à la fois) : aucune liste de
+tâches n'est construite, la mémoire ne dépend pas du nombre de lignes.
+Le fichier est compressé en gzip si son nom se termine par `.gz`.
+
+Le fichier est écrit à côté sous un nom temporaire puis renommé : une
+erreur ou une annulation ne laisse pas d'export partiel.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Optional
+
+from sqlalchemy import func, select
+
+from app.database.base import _live, iter_task_records, serialize_task, TaskRecord
+from app.database.engine import get_engine, get_session
+from app.database.models.task import Task, TaskStatus, TaskPriority
+
+
+# Formats reconnus (extension du fichier, sans .gz)
+EXPORT_CSV = "csv"
+EXPORT_NDJSON = "ndjson"
+EXPORT_ICAL = "ics"
+
+_EXTENSIONS = {".csv": EXPORT_CSV, ".ndjson": EXPORT_NDJSON, ".jsonl": EXPORT_NDJSON, ".ics": EXPORT_ICAL}
+
+# Composants iCalendar possibles
+ICAL_TODO = "VTODO"
+ICAL_EVENT = "VEVENT"
+
+# Fréquence des rappels de progression (en tâches)
+PROGRESS_STEP = 1000
+
+# Colonnes du CSV, dans l'ordre
+CSV_FIELDS = [
+    "id", "theme", "title", "status", "description", "priority",
+    "created_at", "deadline", "updated_at",
+]
+
+
+class ExportCancelled(Exception):
+    """Export interrompu à la demande de l'appelant."""
+
+
+# =======================
+# Formats
+# =======================
+def _csv_chunks(records: Iterable[TaskRecord]) -> Iterator[str]:
+    """En-tête puis une ligne CSV par tâche."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(CSV_FIELDS)
+    for record in records:
+        task = serialize_task(record)
+        writer.writerow([task[field] for field in CSV_FIELDS])
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+    yield buffer.getvalue()
+
+
+def _ndjson_chunks(records: Iterable[TaskRecord]) -> Iterator[str]:
+    """Un objet JSON par ligne."""
+    for record in records:
+        yield json.dumps(serialize_task(record), ensure_ascii=False) + "\n"
+
+
+# Correspondances iCalendar (RFC 5545)
+_ICAL_STATUS = {
+    TaskStatus.A_FAIRE: "NEEDS-ACTION",
+    TaskStatus.EN_COURS: "IN-PROCESS",
+    TaskStatus.TERMINE: "COMPLETED",
+    TaskStatus.ANNULEE: "CANCELLED",
+}
+_ICAL_EVENT_STATUS = {
+    TaskStatus.A_FAIRE: "TENTATIVE",
+    TaskStatus.EN_COURS: "CONFIRMED",
+    TaskStatus.TERMINE: "CONFIRMED",
+    TaskStatus.ANNULEE: "CANCELLED",
+}
+_ICAL_PRIORITY = {
+    TaskPriority.URGENTE: 1,
+    TaskPriority.HAUTE: 3,
+    TaskPriority.MOYENNE: 5,
+    TaskPriority.BASSE: 9,
+}
+
+
+def _ical_text(value: Optional[str]) -> str:
+    """Échappement des valeurs TEXT."""
+    return (
+        (value or "")
+        .replace("\\", "\\\\").replace(";", "\\;").replace(",", "\\,")
+        .replace("\r\n", "\\n").replace("\n", "\\n")
+    )
+
+
+def _ical_date(value: datetime) -> str:
+    """Date-heure locale (« flottante »), comme stockée en base : DUE, DTSTART, DTEND."""
+    return value.strftime("%Y%m%dT%H%M%S")
+
+
+def _ical_utc(value: datetime, stored_utc: bool = False) -> str:
+    """
+    Date-heure UTC (suffixe Z), exigée pour DTSTAMP, CREATED et
+    LAST-MODIFIED (RFC 5545, 3.8.7).
+
+    Args:
+        value (datetime): Date avec fuseau, ou sans (heure locale)
+        stored_utc (bool, optional): Date sans fuseau déjà en UTC
+            (horodatage CURRENT_TIMESTAMP de SQLite)
+    """
+    if stored_utc and value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+
+
+def _ical_line(line: str) -> str:
+    """Ligne terminée par CRLF, repliée à 75 octets."""
+    encoded = line.encode("utf-8")
+    if len(encoded) <= 75:
+        return line + "\r\n"
+    parts, start, limit = [], 0, 75
+    while start < len(encoded):
+        end = min(start + limit, len(encoded))
+        # Pas de coupure au milieu d'un caractère UTF-8
+        while end < len(encoded) and encoded[end] & 0xC0 == 0x80:
+            end -= 1
+        parts.append(encoded[start:end].decode("utf-8"))
+        start, limit = end, 74
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _ical_chunks(
+    records: Iterable[TaskRecord], component: str = ICAL_TODO, stored_utc: bool = False
+) -> Iterator[str]:
+    """
+    Calendrier : un composant par tâche (VEVENT : tâches datées seulement).
+
+    `stored_utc` : created_at / updated_at lus en UTC (voir _ical_utc).
+    """
+    stamp = _ical_utc(datetime.now(timezone.utc))
+    yield "".join(_ical_line(line) for line in (
+        "BEGIN:VCALENDAR", "VERSION:2.0", "PRODID:-//SethiarWorks//Kairo//FR", "CALSCALE:GREGORIAN",
+    ))
+    for record in records:
+        if component == ICAL_EVENT and record.deadline is None:
+            continue
+        lines = [
+            f"BEGIN:{component}",
+            f"UID:kairo-task-{record.id}",
+            f"DTSTAMP:{stamp}",
+            f"SUMMARY:{_ical_text(record.title)}",
+            f"CATEGORIES:{_ical_text(record.theme)}",
+        ]
+        if record.description:
+            lines.append(f"DESCRIPTION:{_ical_text(record.description)}")
+        if record.created_at:
+            lines.append(f"CREATED:{_ical_utc(record.created_at, stored_utc)}")
+        if record.updated_at:
+            lines.append(f"LAST-MODIFIED:{_ical_utc(record.updated_at, stored_utc)}")
+        if component == ICAL_EVENT:
+            lines += [
+                f"DTSTART:{_ical_date(record.deadline)}",
+                f"DTEND:{_ical_date(record.deadline)}",
+                f"STATUS:{_ICAL_EVENT_STATUS[record.status]}",
+            ]
+        else:
+            if record.deadline:
+                lines.append(f"DUE:{_ical_date(record.deadline)}")
+            lines.append(f"STATUS:{_ICAL_STATUS[record.status]}")
+        lines += [f"PRIORITY:{_ICAL_PRIORITY[record.priority]}", f"END:{component}"]
+        yield "".join(_ical_line(line) for line in lines)
+    yield _ical_line("END:VCALENDAR")
+
+
+# =======================
+# Export
+# =======================
+def export_format(path: str) -> str:
+    """Format d'export déduit de l'extension (`.gz` ignoré)."""
+    name = path[:-3] if path.lower().endswith(".gz") else path
+    extension = os.path.splitext(name)[1].lower()
+    if extension not in _EXTENSIONS:
+        raise ValueError(f"Format d'export inconnu : {extension or path}")
+    return _EXTENSIONS[extension]
+
+
+def count_tasks() -> int:
+    """Nombre de tâches non supprimées (total de la progression)."""
+    session = get_session()
+    try:
+        return session.execute(select(func.count()).select_from(Task).where(_live())).scalar_one()
+    finally:
+        session.close()
+
+
+def export_tasks(
+    path: str,
+    fmt: Optional[str] = None,
+    ical_component: str = ICAL_TODO,
+    progress: Optional[Callable[[int, int], None]] = None,
+    stop: Optional[Callable[[], bool]] = None
+) -> int:
+    """
+    Exporte toutes les tâches non supprimées, triées par thème puis id.
+
+    Args:
+        path (str): Fichier à écrire (compressé en gzip s'il finit par .gz)
+        fmt (str, optional): EXPORT_* (par défaut déduit de l'extension)
+        ical_component (str, optional): ICAL_TODO ou ICAL_EVENT (format .ics)
+        progress (Callable, optional): Appelé avec (tâches écrites, total)
+            toutes les PROGRESS_STEP tâches et à la fin
+        stop (Callable, optional): Renvoie True pour interrompre l'export
+
+    Returns:
+        int: Nombre de tâches lues (en VEVENT, celles sans deadline ne
+        sont pas écrites)
+
+    Raises:
+        ExportCancelled: `stop()` a demandé l'interruption
+    """
+    fmt = fmt or export_format(path)
+    total = count_tasks() if progress is not None else 0
+    exported = 0
+
+    def counted(records: Iterable[TaskRecord]) -> Iterator[TaskRecord]:
+        nonlocal exported
+        for record in records:
+            yield record
+            exported += 1
+            if exported % PROGRESS_STEP == 0:
+                if stop is not None and stop():
+                    raise ExportCancelled(f"Export interrompu après {exported} tâches")
+                if progress is not None:
+                    progress(exported, max(total, exported))
+
+    source = iter_task_records(order_by=[Task.theme, Task.id], description=True)
+    records = counted(source)
+    if fmt == EXPORT_CSV:
+        chunks = _csv_chunks(records)
+    elif fmt == EXPORT_NDJSON:
+        chunks = _ndjson_chunks(records)
+    elif fmt == EXPORT_ICAL:
+        # Horodatages de la base : heure locale sous MySQL, UTC sous SQLite
+        chunks = _ical_chunks(records, ical_component, get_engine().dialect.name == "sqlite")
+    else:
+        raise ValueError(f"Format d'export inconnu : {fmt}")
+
+    temporary = f"{path}.part"
+    # CSV et iCalendar gèrent eux-mêmes leurs fins de ligne
+    if path.lower().endswith(".gz"):
+        output = gzip.open(temporary, "wt", encoding="utf-8", newline="")
+    else:
+        output = open(temporary, "w", encoding="utf-8", newline="")
+    try:
+        with output:
+            output.writelines(chunks)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    finally:
+        # Curseur serveur libéré même si l'écriture a échoué
+        source.close()
+
+    if progress is not None:
+        progress(exported, max(total, exported))
+    return exported
@@ -0,0 +1,312 @@
+# app/database/importer.py
+
+"""
+Module importer.py
+
+Import en masse de tâches depuis un fichier CSV ou NDJSON (éventuellement
+compressé en gzip), au format produit par app.database.export.
+
+- Lecture paresseuse : une ligne du fichier à la fois (générateurs)
+- Validation de chaque ligne (champs obligatoires, TaskStatus,
+  TaskPriority, deadline ISO 8601) ; une ligne invalide est signalée et
+  ignorée, sans interrompre l'import
+- Écriture par lots, un INSERT multi-lignes par lot et une transaction
+  (une révision) par lot :
+    - ligne avec `id` : upsert (INSERT ... ON DUPLICATE KEY UPDATE sous
+      MySQL, ON CONFLICT DO UPDATE sous SQLite) ; une tâche existante ou
+      supprimée est remplacée par la ligne importée, et une tâche archivée
+      quitte l'archive (comme une restauration, voir app.database.archive)
+    - ligne sans `id` : nouvelle tâche
+  Si un lot est refusé par la base, ses lignes sont réessayées une à une
+  pour isoler les fautives.
+
+Les colonnes gérées par la base (created_at, updated_at, version,
+revision...) sont ignorées si elles sont présentes.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import csv
+import gzip
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import delete, func, insert
+from sqlalchemy.dialects import mysql, sqlite
+
+from app.database.base import _next_revision, DEFAULT_CHUNK_SIZE
+from app.database.engine import get_session
+from app.database.export import export_format, EXPORT_CSV, EXPORT_NDJSON
+from app.database.models.task import Task, TaskStatus, TaskPriority, DEFAULT_PRIORITY, task_archive
+
+
+# Erreurs conservées dans le rapport (les suivantes sont seulement comptées)
+MAX_REPORTED_ERRORS = 1000
+
+# Colonnes écrites par l'import
+_IMPORTED_COLUMNS = ("theme", "title", "description", "status", "priority", "deadline")
+
+# Libellés et noms des membres acceptés pour le statut et la priorité
+_STATUSES = {**{status.value.lower(): status for status in TaskStatus},
+             **{status.name.lower(): status for status in TaskStatus}}
+_PRIORITIES = {**{priority.value.lower(): priority for priority in TaskPriority},
+               **{priority.name.lower(): priority for priority in TaskPriority}}
+
+
+class ImportRowError(NamedTuple):
+    """Ligne refusée : numéro de ligne dans le fichier et raison."""
+    line: int
+    message: str
+
+
+class ImportReport(NamedTuple):
+    """
+    Bilan d'un import.
+
+    Attributs :
+        imported (int): Lignes écrites (créées ou remplacées)
+        failed (int): Lignes refusées
+        errors (List[ImportRowError]): Les MAX_REPORTED_ERRORS premières
+    """
+    imported: int
+    failed: int
+    errors: List[ImportRowError]
+
+
+# =======================
+# Lecture
+# =======================
+def _open_text(path: str):
+    # utf-8-sig : BOM ajouté par certains tableurs
+    if path.lower().endswith(".gz"):
+        return gzip.open(path, "rt", encoding="utf-8-sig", newline="")
+    return open(path, "r", encoding="utf-8-sig", newline="")
+
+
+def _csv_rows(path: str) -> Iterator[Tuple[int, Any]]:
+    """(numéro de ligne, dict des colonnes) ; l'en-tête donne les noms."""
+    with _open_text(path) as file:
+        reader = csv.DictReader(file)
+        for row in reader:
+            # Dernière ligne lue (un champ entre guillemets peut en couvrir plusieurs)
+            yield reader.line_num, row
+
+
+def _ndjson_rows(path: str) -> Iterator[Tuple[int, Any]]:
+    """(numéro de ligne, objet JSON ou exception de décodage) ; lignes vides ignorées."""
+    with _open_text(path) as file:
+        for number, line in enumerate(file, start=1):
+            if not line.strip():
+                continue
+            try:
+                yield number, json.loads(line)
+            except ValueError as e:
+                yield number, e
+
+
+# =======================
+# Validation
+# =======================
+def _text(row: Dict[str, Any], key: str) -> str:
+    value = row.get(key)
+    return "" if value is None else str(value).strip()
+
+
+def validate_row(row: Any) -> Dict[str, Any]:
+    """
+    Convertit une ligne lue en valeurs de colonnes de Task.
+
+    Raises:
+        ValueError: Ligne invalide (message destiné à l'utilisateur)
+    """
+    if isinstance(row, Exception):
+        raise ValueError(f"JSON invalide : {row}")
+    if not isinstance(row, dict):
+        raise ValueError("Objet attendu")
+
+    values: Dict[str, Any] = {}
+
+    task_id = _text(row, "id")
+    if task_id:
+        try:
+            values["id"] = int(task_id)
+        except ValueError:
+            raise ValueError(f"Identifiant invalide : {task_id!r}") from None
+        if values["id"] < 1:
+            raise ValueError(f"Identifiant invalide : {task_id!r}")
+
+    for key in ("theme", "title"):
+        values[key] = _text(row, key)
+        if not values[key]:
+            raise ValueError(f"Champ obligatoire manquant : {key}")
+        if len(values[key]) > 255:
+            raise ValueError(f"Champ trop long (255 caractères au plus) : {key}")
+    values["description"] = _text(row, "description")
+
+    status = _text(row, "status")
+    if status:
+        if status.lower() not in _STATUSES:
+            raise ValueError(f"Statut inconnu : {status!r}")
+        values["status"] = _STATUSES[status.lower()]
+    else:
+        values["status"] = TaskStatus.A_FAIRE
+
+    priority = _text(row, "priority")
+    if priority:
+        if priority.lower() not in _PRIORITIES:
+            raise ValueError(f"Priorité inconnue : {priority!r}")
+        values["priority"] = _PRIORITIES[priority.lower()]
+    else:
+        values["priority"] = DEFAULT_PRIORITY
+
+    deadline = _text(row, "deadline")
+    if deadline:
+        try:
+            values["deadline"] = datetime.fromisoformat(deadline)
+        except ValueError:
+            raise ValueError(f"Deadline invalide (ISO 8601 attendu) : {deadline!r}") from None
+        # Stockage en heure locale sans fuseau, comme le formulaire
+        if values["deadline"].tzinfo is not None:
+            values["deadline"] = values["deadline"].astimezone().replace(tzinfo=None)
+    else:
+        values["deadline"] = None
+
+    return values
+
+
+# =======================
+# Écriture
+# =======================
+def _upsert(dialect: str, rows: List[Dict[str, Any]]):
+    """INSERT multi-lignes remplaçant les tâches de même id."""
+    if dialect == "mysql":
+        statement = mysql.insert(Task).values(rows)
+        new = statement.inserted
+        on_conflict = statement.on_duplicate_key_update
+    elif dialect == "sqlite":
+        statement = sqlite.insert(Task).values(rows)
+        new = statement.excluded
+        on_conflict = lambda **values: statement.on_conflict_do_update(index_elements=[Task.id], set_=values)
+    else:
+        raise NotImplementedError(f"Upsert non pris en charge pour {dialect}")
+
+    return on_conflict(
+        **{name: new[name] for name in _IMPORTED_COLUMNS},
+        revision=new.revision,
+        version=Task.version + 1,
+        deleted_at=None,
+        # onupdate de la colonne non appliqué par les upserts
+        updated_at=func.now(),
+    )
+
+
+def _write_chunk(rows: List[Dict[str, Any]]) -> None:
+    """Écrit un lot en une transaction (une révision)."""
+    session = get_session()
+    try:
+        revision = _next_revision(session)
+        with_id = [{**row, "version": 1, "revision": revision} for row in rows if "id" in row]
+        without_id = [{**row, "version": 1, "revision": revision} for row in rows if "id" not in row]
+        if with_id:
+            session.execute(_upsert(session.get_bind().dialect.name, with_id))
+            # Tâche de nouveau vivante : sa ligne d'archive bloquerait son prochain archivage
+            session.execute(delete(task_archive).where(task_archive.c.id.in_([row["id"] for row in with_id])))
+        if without_id:
+            session.execute(insert(Task), without_id)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def import_tasks(
+    path: str,
+    fmt: Optional[str] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[Callable[[int], None]] = None,
+    stop: Optional[Callable[[], bool]] = None
+) -> ImportReport:
+    """
+    Importe les tâches d'un fichier CSV ou NDJSON.
+
+    Args:
+        path (str): Fichier à lire (.csv, .ndjson, .jsonl, éventuellement .gz)
+        fmt (str, optional): EXPORT_CSV ou EXPORT_NDJSON (par défaut selon l'extension)
+        chunk_size (int, optional): Lignes par INSERT
+        progress (Callable, optional): Appelé avec le nombre de lignes
+            traitées après chaque lot
+        stop (Callable, optional): Renvoie True pour arrêter l'import ;
+            les lots déjà écrits le restent
+
+    Returns:
+        ImportReport: Lignes écrites, lignes refusées et leurs raisons
+    """
+    if chunk_size < 1:
+        raise ValueError("La taille des lots doit être strictement positive")
+    fmt = fmt or export_format(path)
+    if fmt == EXPORT_CSV:
+        source = _csv_rows(path)
+    elif fmt == EXPORT_NDJSON:
+        source = _ndjson_rows(path)
+    else:
+        raise ValueError(f"Format d'import non pris en charge : {fmt}")
+
+    imported, failed, processed = 0, 0, 0
+    errors: List[ImportRowError] = []
+
+    def refuse(line: int, message: str):
+        nonlocal failed
+        failed += 1
+        if len(errors) < MAX_REPORTED_ERRORS:
+            errors.append(ImportRowError(line, message))
+
+    def valid_rows() -> Iterator[Tuple[int, Dict[str, Any]]]:
+        nonlocal processed
+        for line, row in source:
+            processed += 1
+            try:
+                yield line, validate_row(row)
+            except ValueError as e:
+                refuse(line, str(e))
+
+    def write(batch: List[Tuple[int, Dict[str, Any]]]):
+        nonlocal imported
+        try:
+            _write_chunk([row for _, row in batch])
+            imported += len(batch)
+        except Exception:
+            # Lot refusé : lignes réessayées une à une
+            for line, row in batch:
+                try:
+                    _write_chunk([row])
+                    imported += 1
+                except Exception as e:
+                    refuse(line, f"Refusée par la base : {e}")
+
+    try:
+        batch: List[Tuple[int, Dict[str, Any]]] = []
+        for item in valid_rows():
+            batch.append(item)
+            if len(batch) >= chunk_size:
+                write(batch)
+                batch = []
+                if progress is not None:
+                    progress(processed)
+                if stop is not None and stop():
+                    break
+        else:
+            if batch:
+                write(batch)
+    except (OSError, csv.Error, UnicodeDecodeError) as e:
+        raise RuntimeError(f"Lecture du fichier impossible : {e}") from e
+    finally:
+        source.close()
+
+    if progress is not None:
+        progress(processed)
+    return ImportReport(imported, failed, errors)
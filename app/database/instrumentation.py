@@ -0,0 +1,395 @@
+# app/database/instrumentation.py
+
+"""
+Module instrumentation.py
+
+Mesures de la couche d'accès aux données, par événements SQLAlchemy :
+
+- par requête (texte normalisé : listes IN et VALUES multi-lignes
+  réduites) : nombre d'exécutions, temps total / max, histogramme des
+  latences, lignes renvoyées ou modifiées
+- cache de compilation de SQLAlchemy : requêtes servies déjà
+  compilées (hits), compilées (misses) ou non mises en cache ; voir
+  les requêtes préparées de app.database.base
+- pool de connexions : nombre d'emprunts, attente d'une connexion
+  libre (TimedQueuePool), durée de détention
+- journal des requêtes lentes (logger `kairo.sql`, au-delà de
+  DB_SLOW_QUERY_MS millisecondes)
+- par action (un appel soumis au DatabaseWorker, voir `track_action`) :
+  détection des motifs N+1 (même requête exécutée N_PLUS_ONE_THRESHOLD
+  fois avec des paramètres différents) et des requêtes identiques
+  répétées ; les traitements d'infrastructure (migrations) s'en
+  excluent par `untracked()`
+
+Lecture des agrégats : `get_sql_stats()`, `format_sql_stats()`,
+remise à zéro : `reset_sql_stats()`.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import logging
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections import Counter, deque
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS
+from sqlalchemy.pool import QueuePool
+
+
+logger = logging.getLogger("kairo.sql")
+
+# Seuil du journal des requêtes lentes (ms)
+DEFAULT_SLOW_QUERY_MS = 200
+
+# Bornes supérieures des classes de l'histogramme (ms) ; dernière classe : au-delà
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Exécutions d'une même requête, dans une action, signalées comme N+1
+N_PLUS_ONE_THRESHOLD = 10
+# Exécutions identiques (requête et paramètres), dans une action, signalées
+REPEATED_QUERY_THRESHOLD = 2
+
+# Avertissements conservés pour get_sql_stats
+MAX_WARNINGS = 100
+
+# Longueur des requêtes citées dans le journal
+_LOGGED_STATEMENT_LENGTH = 500
+
+_WHITESPACE = re.compile(r"\s+")
+_PLACEHOLDER = r"(?:%s|\?|%\(\w+\)s|:\w+)"
+_IN_LIST = re.compile(rf"\(\s*{_PLACEHOLDER}(?:\s*,\s*{_PLACEHOLDER})+\s*\)")
+_VALUES_ROWS = re.compile(r"(VALUES\s*\([^()]*\))(?:\s*,\s*\([^()]*\))+", re.IGNORECASE)
+
+
+def normalize_statement(statement: str) -> str:
+    """Texte d'une requête, indépendant du nombre de valeurs liées."""
+    statement = _WHITESPACE.sub(" ", statement).strip()
+    statement = _IN_LIST.sub("(…)", statement)
+    return _VALUES_ROWS.sub(r"\1, …", statement)
+
+
+# =======================
+# Agrégats
+# =======================
+class _StatementStats:
+    """Exécutions d'une requête normalisée."""
+
+    __slots__ = ("count", "total", "max", "rows", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def add(self, elapsed_ms: float, rows: int):
+        self.count += 1
+        self.total += elapsed_ms
+        self.max = max(self.max, elapsed_ms)
+        if rows > 0:
+            self.rows += rows
+        self.buckets[bisect_left(LATENCY_BUCKETS_MS, elapsed_ms)] += 1
+
+    def percentile(self, fraction: float) -> float:
+        """Borne supérieure de la classe contenant le percentile (ms)."""
+        rank = fraction * self.count
+        seen = 0
+        for index, count in enumerate(self.buckets):
+            seen += count
+            if seen >= rank and count:
+                return LATENCY_BUCKETS_MS[index] if index < len(LATENCY_BUCKETS_MS) else self.max
+        return self.max
+
+
+class _Action:
+    """Requêtes exécutées pendant une action (un appel du DatabaseWorker)."""
+
+    __slots__ = ("name", "statements", "identical")
+
+    def __init__(self, name: str):
+        self.name = name
+        self.statements: Counter = Counter()
+        self.identical: Counter = Counter()
+
+
+class SqlStats:
+    """
+    Collecteur des mesures, partagé par tous les threads (verrou interne).
+    """
+
+    def __init__(self, slow_query_ms: float = DEFAULT_SLOW_QUERY_MS):
+        self.slow_query_ms = slow_query_ms
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._statements: Dict[str, _StatementStats] = {}
+            self.slow_queries = 0
+            # Exécutions par issue du cache de compilation
+            self.cache_hits = 0
+            self.cache_misses = 0
+            self.uncached = 0
+            self.checkouts = 0
+            self.wait_total = 0.0
+            self.wait_max = 0.0
+            self.held_total = 0.0
+            self.held_max = 0.0
+            self.warnings: deque = deque(maxlen=MAX_WARNINGS)
+
+    # -----------------------
+    # Enregistrement
+    # -----------------------
+    def record_statement(self, statement: str, parameters: Any, executemany: bool, elapsed_ms: float, rows: int):
+        key = normalize_statement(statement)
+        with self._lock:
+            stats = self._statements.get(key)
+            if stats is None:
+                stats = self._statements[key] = _StatementStats()
+            stats.add(elapsed_ms, rows)
+            if elapsed_ms >= self.slow_query_ms:
+                self.slow_queries += 1
+
+        if elapsed_ms >= self.slow_query_ms:
+            logger.warning(
+                "Requête lente (%.1f ms, %s ligne(s)) : %s",
+                elapsed_ms, rows if rows >= 0 else "?", key[:_LOGGED_STATEMENT_LENGTH]
+            )
+
+        action = getattr(self._local, "action", None)
+        if action is not None:
+            action.statements[key] += 1
+            if not executemany:
+                action.identical[(key, repr(parameters))] += 1
+
+    def record_compilation(self, cache_hit: Any):
+        """Issue du cache de compilation pour une exécution (context.cache_hit)."""
+        with self._lock:
+            if cache_hit is CACHE_HIT:
+                self.cache_hits += 1
+            elif cache_hit is CACHE_MISS:
+                self.cache_misses += 1
+            else:
+                self.uncached += 1
+
+    def record_wait(self, elapsed_ms: float):
+        with self._lock:
+            self.wait_total += elapsed_ms
+            self.wait_max = max(self.wait_max, elapsed_ms)
+
+    def record_checkout(self):
+        with self._lock:
+            self.checkouts += 1
+
+    def record_checkin(self, held_ms: float):
+        with self._lock:
+            self.held_total += held_ms
+            self.held_max = max(self.held_max, held_ms)
+
+    def _warn(self, message: str):
+        with self._lock:
+            self.warnings.append(message)
+        logger.warning(message)
+
+    # -----------------------
+    # Actions
+    # -----------------------
+    @contextmanager
+    def action(self, name: str) -> Iterator[None]:
+        """
+        Délimite une action : les requêtes du thread courant y sont
+        regroupées, puis analysées (N+1, requêtes répétées) à la sortie.
+        """
+        previous = getattr(self._local, "action", None)
+        current = self._local.action = _Action(name)
+        try:
+            yield
+        finally:
+            self._local.action = previous
+            self._analyse(current)
+
+    @contextmanager
+    def untracked(self) -> Iterator[None]:
+        """
+        Suspend l'action du thread courant : les requêtes du bloc sont
+        comptées dans les agrégats mais pas analysées (N+1, répétitions).
+        """
+        previous = getattr(self._local, "action", None)
+        self._local.action = None
+        try:
+            yield
+        finally:
+            self._local.action = previous
+
+    def _analyse(self, action: _Action):
+        for key, count in action.statements.items():
+            if count >= N_PLUS_ONE_THRESHOLD:
+                self._warn(
+                    f"N+1 probable dans {action.name} : {count} exécutions de "
+                    f"{key[:_LOGGED_STATEMENT_LENGTH]}"
+                )
+        for (key, _), count in action.identical.items():
+            if count >= REPEATED_QUERY_THRESHOLD:
+                self._warn(
+                    f"Requête identique répétée dans {action.name} ({count} fois) : "
+                    f"{key[:_LOGGED_STATEMENT_LENGTH]}"
+                )
+
+    # -----------------------
+    # Lecture
+    # -----------------------
+    def snapshot(self) -> Dict[str, Any]:
+        """Agrégats courants (voir get_sql_stats)."""
+        with self._lock:
+            statements = [
+                {
+                    "statement": key,
+                    "count": stats.count,
+                    "total_ms": stats.total,
+                    "mean_ms": stats.total / stats.count,
+                    "p50_ms": stats.percentile(0.50),
+                    "p95_ms": stats.percentile(0.95),
+                    "max_ms": stats.max,
+                    "rows": stats.rows,
+                    "histogram": dict(zip([*map(str, LATENCY_BUCKETS_MS), "+"], stats.buckets)),
+                }
+                for key, stats in self._statements.items()
+            ]
+            pool = {
+                "checkouts": self.checkouts,
+                "wait_total_ms": self.wait_total,
+                "wait_max_ms": self.wait_max,
+                "held_total_ms": self.held_total,
+                "held_max_ms": self.held_max,
+            }
+            compiled = self.cache_hits + self.cache_misses
+            compiled_cache = {
+                "hits": self.cache_hits,
+                "misses": self.cache_misses,
+                "uncached": self.uncached,
+                "hit_rate": self.cache_hits / compiled if compiled else 0.0,
+            }
+            warnings = list(self.warnings)
+            slow_queries = self.slow_queries
+        statements.sort(key=lambda item: item["total_ms"], reverse=True)
+        return {
+            "statements": statements, "pool": pool, "compiled_cache": compiled_cache,
+            "slow_queries": slow_queries, "warnings": warnings,
+        }
+
+
+# Collecteur de l'application
+SQL_STATS = SqlStats()
+
+
+# =======================
+# Pool
+# =======================
+class TimedQueuePool(QueuePool):
+    """QueuePool mesurant l'attente d'une connexion libre."""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            SQL_STATS.record_wait((time.perf_counter() - start) * 1000)
+
+
+# =======================
+# Branchement
+# =======================
+def instrument(engine: Engine, stats: SqlStats = SQL_STATS) -> None:
+    """Installe les événements de mesure sur un engine."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+        stats.record_statement(statement, parameters, executemany, elapsed_ms, cursor.rowcount)
+        stats.record_compilation(getattr(context, "cache_hit", None))
+
+    @event.listens_for(engine, "handle_error")
+    def _error(exception_context):
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+    @event.listens_for(engine.pool, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checkout_at"] = time.perf_counter()
+        stats.record_checkout()
+
+    @event.listens_for(engine.pool, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        start = connection_record.info.pop("checkout_at", None)
+        if start is not None:
+            stats.record_checkin((time.perf_counter() - start) * 1000)
+
+
+def track_action(name: str):
+    """Contexte d'une action (voir SqlStats.action), sur le collecteur de l'application."""
+    return SQL_STATS.action(name)
+
+
+def untracked():
+    """Bloc exclu des actions (voir SqlStats.untracked), sur le collecteur de l'application."""
+    return SQL_STATS.untracked()
+
+
+def get_sql_stats() -> Dict[str, Any]:
+    """
+    Agrégats depuis le démarrage (ou le dernier reset_sql_stats).
+
+    Returns:
+        dict: "statements" (par requête normalisée, du plus coûteux au
+        moins coûteux : count, total_ms, mean_ms, p50_ms, p95_ms, max_ms,
+        rows, histogram), "pool" (checkouts, attente et détention en ms),
+        "compiled_cache" (hits, misses, uncached, hit_rate : part des
+        exécutions compilables servies sans compilation), "slow_queries"
+        et "warnings" (N+1, requêtes répétées)
+    """
+    return SQL_STATS.snapshot()
+
+
+def reset_sql_stats() -> None:
+    SQL_STATS.reset()
+
+
+def format_sql_stats(limit: int = 20) -> str:
+    """Rapport texte des requêtes les plus coûteuses et du pool."""
+    stats = get_sql_stats()
+    pool = stats["pool"]
+    lines = [
+        f"{'total ms':>10} {'nb':>7} {'moy':>8} {'p95':>8} {'max':>8} {'lignes':>8}  requête",
+    ]
+    for item in stats["statements"][:limit]:
+        lines.append(
+            f"{item['total_ms']:10.1f} {item['count']:7d} {item['mean_ms']:8.2f} "
+            f"{item['p95_ms']:8.1f} {item['max_ms']:8.1f} {item['rows']:8d}  {item['statement'][:120]}"
+        )
+    lines.append(
+        f"Pool : {pool['checkouts']} emprunt(s), attente {pool['wait_total_ms']:.1f} ms "
+        f"(max {pool['wait_max_ms']:.1f}), détention max {pool['held_max_ms']:.1f} ms"
+    )
+    cache = stats["compiled_cache"]
+    lines.append(
+        f"Cache de compilation : {cache['hit_rate']:.1%} de hits "
+        f"({cache['hits']} hit(s), {cache['misses']} compilation(s), {cache['uncached']} hors cache)"
+    )
+    lines.append(f"Requêtes lentes : {stats['slow_queries']}")
+    lines.extend(stats["warnings"])
+    return "\n".join(lines)
@@ -0,0 +1,416 @@
+# app/database/migrations.py
+
+"""
+Module migrations.py
+
+Migrations versionnées du schéma de la base de données de Kairo.
+
+- Table `schema_version` : une ligne par migration appliquée
+- Liste ordonnée des migrations (MIGRATIONS)
+- Lancement explicite au démarrage via `migrate()`
+
+Chaque migration est idempotente : elle vérifie l'état réel du schéma
+avant d'agir, ce qui permet de l'appliquer aussi bien à une base neuve
+qu'à une base créée par l'ancien `create_all` à l'import.
+
+La migration 1 crée la table `task` d'origine, définie ici en toutes
+lettres : une base neuve passe par les mêmes étapes qu'une base
+existante, quelles que soient les évolutions ultérieures du modèle.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+from typing import Callable, List, Optional, Tuple
+
+from sqlalchemy import (
+    BigInteger, Column, DateTime, Enum, Index, Integer, MetaData, SmallInteger, String, Table, TIMESTAMP,
+    inspect, select, func, text, update
+)
+from sqlalchemy.dialects import mysql
+from sqlalchemy.types import Integer as IntegerType, Text
+from sqlalchemy.schema import CreateColumn
+from sqlalchemy.engine import Connection, Engine
+
+from app.database.engine import get_engine, replica_path, warm_up
+from app.database.instrumentation import untracked
+from app.database.oplog import prepare_replica
+
+
+# =======================
+# Table des versions
+# =======================
+_metadata = MetaData()
+
+schema_version = Table(
+    "schema_version",
+    _metadata,
+    Column("version", Integer, primary_key=True, autoincrement=False),
+    Column("name", String(255), nullable=False),
+    Column("applied_at", DateTime, server_default=func.now(), nullable=False),
+)
+
+Migration = Tuple[int, str, Callable[[Connection], None]]
+
+
+# =======================
+# Schéma d'origine
+# =======================
+_baseline_metadata = MetaData()
+
+_baseline_task = Table(
+    "task",
+    _baseline_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("theme", String(255), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("status", Enum("À faire", "En cours", "Terminé", "Annulée", name="taskstatus"), nullable=False),
+    Column("description", String(1024), nullable=False),
+    Column("priority", Enum("Basse", "Moyenne", "Haute", "Urgente", name="taskpriority"), nullable=True),
+    Column("created_at", TIMESTAMP, server_default=func.now(), nullable=False),
+    Column("deadline", DateTime, nullable=True),
+)
+"""
+_baseline_task : table `task` de la première version de Kairo, sans
+index secondaire. Figée : les évolutions passent par les migrations
+suivantes, jamais par cette définition.
+"""
+
+
+# =======================
+# Schéma des migrations suivantes
+# =======================
+# Comme _baseline_task, ces définitions sont figées : une migration crée
+# toujours les mêmes colonnes et index, quelles que soient les évolutions
+# ultérieures du modèle (app.database.models.task).
+_frozen_metadata = MetaData()
+
+# Petit entier des codes de statut / priorité (migration 6)
+_CODE = SmallInteger().with_variant(mysql.TINYINT(unsigned=True), "mysql")
+
+# Colonnes de `task` utilisées par les migrations (index, colonnes ajoutées)
+_task = Table(
+    "task",
+    _frozen_metadata,
+    Column("id", Integer, primary_key=True),
+    Column("theme", String(255), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("status", _CODE, nullable=False),
+    Column("description", Text, nullable=False),
+    Column("priority", _CODE, nullable=False),
+    Column("deadline", DateTime, nullable=True),
+    # Migration 4
+    Column("updated_at", TIMESTAMP, server_default=func.now(), nullable=False),
+    Column("revision", BigInteger, server_default="0", nullable=False),
+    Column("deleted_at", DateTime, nullable=True),
+    # Migration 5
+    Column("version", Integer, server_default="1", nullable=False),
+    # Migration 10
+    Column("origin_key", String(64), nullable=True),
+)
+_columns = _task.c
+
+# Migration 2
+_ACCESS_PATH_INDEXES = (
+    Index("ix_task_theme_deadline", _columns.theme, _columns.deadline, _columns.id),
+    Index("ix_task_status_deadline", _columns.status, _columns.deadline),
+    Index("ix_task_priority_deadline", _columns.priority, _columns.deadline),
+    Index("ix_task_deadline", _columns.deadline, _columns.id),
+)
+
+# Migration 3 (MySQL uniquement)
+_SEARCH_INDEX = Index(
+    "ix_task_search", _columns.theme, _columns.title, _columns.description, mysql_prefix="FULLTEXT"
+)
+
+# Migration 4
+_REVISION_INDEX = Index("ix_task_revision", _columns.revision)
+
+_task_revision = Table(
+    "task_revision",
+    _frozen_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("value", BigInteger, nullable=False),
+)
+
+# Migration 6 : codes par libellé, et valeurs par défaut
+_STATUS_CODES = {"À faire": 1, "En cours": 2, "Terminé": 3, "Annulée": 4}
+_PRIORITY_CODES = {"Urgente": 1, "Haute": 2, "Moyenne": 3, "Basse": 4}
+_STATUS_DEFAULT = _STATUS_CODES["À faire"]
+_PRIORITY_DEFAULT = _PRIORITY_CODES["Haute"]
+
+_PRIORITY_INDEXES = (
+    Index("ix_task_theme_priority", _columns.theme, _columns.priority, _columns.id),
+    Index("ix_task_theme_deadline_priority", _columns.theme, _columns.deadline, _columns.priority, _columns.id),
+)
+
+# Migration 8
+_task_archive = Table(
+    "task_archive",
+    _frozen_metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("theme", String(255), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("status", _CODE, nullable=False),
+    Column("description", Text, nullable=False),
+    Column("priority", _CODE, nullable=False),
+    Column("created_at", TIMESTAMP, nullable=True),
+    Column("deadline", DateTime, nullable=True),
+    Column("updated_at", TIMESTAMP, nullable=True),
+    Column("version", Integer, nullable=False),
+    Column("archived_at", DateTime, server_default=func.now(), nullable=False),
+    Index("ix_task_archive_archived_at", "archived_at", "id"),
+)
+
+# Migration 9
+_SUMMARY_INDEX = Index(
+    "ix_task_summary", _columns.theme, _columns.status, _columns.priority, _columns.deadline,
+    _columns.deleted_at
+)
+
+# Migration 10
+_ORIGIN_KEY_INDEX = Index("ux_task_origin_key", _columns.origin_key, unique=True)
+
+
+# =======================
+# Utilitaires
+# =======================
+def _index_names(conn: Connection, table: str) -> set:
+    """Noms des index existants d'une table."""
+    return {index["name"] for index in inspect(conn).get_indexes(table)}
+
+
+def _create_index_if_missing(conn: Connection, index: Index) -> None:
+    """Crée un index s'il n'existe pas encore en base."""
+    if index.name not in _index_names(conn, index.table.name):
+        index.create(conn)
+
+
+def _add_column_if_missing(conn: Connection, column: Column) -> None:
+    """Ajoute une colonne à sa table si elle n'existe pas encore."""
+    table = column.table.name
+    if column.name not in {col["name"] for col in inspect(conn).get_columns(table)}:
+        ddl = CreateColumn(column).compile(dialect=conn.dialect)
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {ddl}"))
+
+
+# =======================
+# Migrations
+# =======================
+def _create_task_table(conn: Connection) -> None:
+    """Table `task` d'origine (voir _baseline_task)."""
+    _baseline_task.create(conn, checkfirst=True)
+
+
+def _add_access_path_indexes(conn: Connection) -> None:
+    """Index composites des requêtes du tableau des tâches."""
+    for index in _ACCESS_PATH_INDEXES:
+        _create_index_if_missing(conn, index)
+
+
+def _add_fulltext_index(conn: Connection) -> None:
+    """Index FULLTEXT de la recherche (MySQL uniquement)."""
+    if conn.dialect.name == "mysql":
+        _create_index_if_missing(conn, _SEARCH_INDEX)
+
+
+def _add_revision_tracking(conn: Connection) -> None:
+    """
+    Suivi des modifications : updated_at, révision, tombstones
+    (deleted_at) et compteur `task_revision`.
+
+    Les tâches existantes reçoivent la révision 1, valeur initiale du compteur.
+    """
+    if conn.dialect.name == "sqlite":
+        # SQLite refuse d'ajouter une colonne de défaut non constant (CURRENT_TIMESTAMP) :
+        # colonne sans défaut, renseignée ici puis par le défaut client du modèle
+        if "updated_at" not in {col["name"] for col in inspect(conn).get_columns("task")}:
+            conn.execute(text("ALTER TABLE task ADD COLUMN updated_at TIMESTAMP"))
+            conn.execute(text("UPDATE task SET updated_at = created_at"))
+    else:
+        _add_column_if_missing(conn, _columns.updated_at)
+    for column in (_columns.revision, _columns.deleted_at):
+        _add_column_if_missing(conn, column)
+    _create_index_if_missing(conn, _REVISION_INDEX)
+
+    _task_revision.create(conn, checkfirst=True)
+    if conn.execute(select(_task_revision.c.value)).first() is None:
+        conn.execute(update(_task).where(_columns.revision == 0).values(revision=1))
+        conn.execute(_task_revision.insert().values(id=1, value=1))
+
+
+def _add_row_version(conn: Connection) -> None:
+    """Colonne `version` de la concurrence optimiste (1 pour les tâches existantes)."""
+    _add_column_if_missing(conn, _columns.version)
+
+
+def _recode(conn: Connection, column: str, mapping: dict, default: int) -> None:
+    """UPDATE task SET column = CASE column WHEN ancien THEN code ... ELSE défaut END."""
+    whens = " ".join(f"WHEN :old_{i} THEN {code}" for i, code in enumerate(mapping.values()))
+    params = {f"old_{i}": old for i, old in enumerate(mapping)}
+    conn.execute(
+        text(f"UPDATE task SET {column} = CASE {column} {whens} ELSE {default} END"),
+        params
+    )
+
+
+def _use_integer_codes(conn: Connection) -> None:
+    """
+    Statut et priorité stockés en petits entiers (_STATUS_CODES,
+    _PRIORITY_CODES) au lieu d'ENUM de libellés.
+
+    Sous MySQL, convertir un ENUM en entier conserve le rang de la
+    valeur dans l'ENUM (1, 2, ...) : les colonnes sont modifiées sur
+    place, index compris, puis les rangs renumérotés en codes. Les
+    priorités absentes reçoivent la priorité par défaut, rang sous
+    lequel elles étaient déjà triées.
+    """
+    columns = {col["name"]: col["type"] for col in inspect(conn).get_columns("task")}
+    if isinstance(columns["status"], IntegerType) and isinstance(columns["priority"], IntegerType):
+        return
+
+    if conn.dialect.name == "mysql":
+        # Rang dans l'ENUM d'origine (ordre de déclaration) -> code
+        status_map = {
+            rank: _STATUS_CODES[label] for rank, label in enumerate(_baseline_task.c.status.type.enums, 1)
+        }
+        priority_map = {
+            rank: _PRIORITY_CODES[label] for rank, label in enumerate(_baseline_task.c.priority.type.enums, 1)
+        }
+
+        conn.execute(text("ALTER TABLE task MODIFY status TINYINT UNSIGNED NOT NULL"))
+        conn.execute(text("ALTER TABLE task MODIFY priority TINYINT UNSIGNED NULL"))
+        _recode(conn, "status", status_map, _STATUS_DEFAULT)
+        _recode(conn, "priority", priority_map, _PRIORITY_DEFAULT)
+        conn.execute(text(
+            f"ALTER TABLE task "
+            f"MODIFY status TINYINT UNSIGNED NOT NULL DEFAULT {_STATUS_DEFAULT}, "
+            f"MODIFY priority TINYINT UNSIGNED NOT NULL DEFAULT {_PRIORITY_DEFAULT}"
+        ))
+    else:
+        # Autres bases : libellés remplacés par les codes dans la même colonne
+        _recode(conn, "status", _STATUS_CODES, _STATUS_DEFAULT)
+        _recode(conn, "priority", _PRIORITY_CODES, _PRIORITY_DEFAULT)
+
+    for index in _PRIORITY_INDEXES:
+        _create_index_if_missing(conn, index)
+
+
+def _description_as_text(conn: Connection) -> None:
+    """Description en TEXT au lieu de VARCHAR(1024) (MySQL ; TEXT partout ailleurs)."""
+    if conn.dialect.name == "mysql":
+        columns = {col["name"]: col["type"] for col in inspect(conn).get_columns("task")}
+        if not isinstance(columns["description"], Text):
+            conn.execute(text("ALTER TABLE task MODIFY description TEXT NOT NULL"))
+
+
+def _create_task_archive(conn: Connection) -> None:
+    """Table `task_archive` des tâches closes (voir app.database.archive)."""
+    _task_archive.create(conn, checkfirst=True)
+
+
+def _add_summary_index(conn: Connection) -> None:
+    """Index couvrant des comptes du tableau (voir get_board_summary)."""
+    _create_index_if_missing(conn, _SUMMARY_INDEX)
+
+
+def _add_origin_key(conn: Connection) -> None:
+    """Clé d'origine des tâches créées hors ligne (envoi idempotent, voir app.database.sync)."""
+    _add_column_if_missing(conn, _columns.origin_key)
+    _create_index_if_missing(conn, _ORIGIN_KEY_INDEX)
+
+
+def _drop_search_btree(conn: Connection) -> None:
+    """
+    Hors MySQL, ix_task_search était créé avec la table comme un simple
+    B-tree (theme, title, description), inutile à la recherche LIKE.
+    """
+    if conn.dialect.name != "mysql" and "ix_task_search" in _index_names(conn, "task"):
+        conn.execute(text("DROP INDEX ix_task_search"))
+
+
+MIGRATIONS: List[Migration] = [
+    (1, "create_task_table", _create_task_table),
+    (2, "add_access_path_indexes", _add_access_path_indexes),
+    (3, "add_fulltext_index", _add_fulltext_index),
+    (4, "add_revision_tracking", _add_revision_tracking),
+    (5, "add_row_version", _add_row_version),
+    (6, "use_integer_codes", _use_integer_codes),
+    (7, "description_as_text", _description_as_text),
+    (8, "create_task_archive", _create_task_archive),
+    (9, "add_summary_index", _add_summary_index),
+    (10, "add_origin_key", _add_origin_key),
+    (11, "drop_search_btree", _drop_search_btree),
+]
+
+
+# =======================
+# Exécution
+# =======================
+def current_version(conn: Connection) -> int:
+    """Dernière version appliquée (0 pour une base vierge)."""
+    version = conn.execute(select(func.max(schema_version.c.version))).scalar()
+    return version or 0
+
+
+def migrate(engine: Optional[Engine] = None, target: Optional[int] = None) -> int:
+    """
+    Applique, dans l'ordre, les migrations non encore appliquées.
+
+    Chaque migration est exécutée dans sa propre transaction et
+    enregistrée dans `schema_version` ; un échec interrompt la suite
+    sans marquer la migration comme appliquée.
+
+    Args:
+        engine (Engine, optional): Engine cible (par défaut celui de l'application)
+        target (int, optional): Version à atteindre (par défaut la dernière)
+
+    Returns:
+        int: Version du schéma après exécution
+    """
+    if engine is None:
+        engine = get_engine()
+
+    # Requêtes d'introspection, répétées par nature : hors détection N+1
+    with untracked():
+        schema_version.create(engine, checkfirst=True)
+
+        with engine.connect() as conn:
+            version = current_version(conn)
+
+        for number, name, apply in MIGRATIONS:
+            if number <= version or (target is not None and number > target):
+                continue
+            try:
+                with engine.begin() as conn:
+                    apply(conn)
+                    conn.execute(schema_version.insert().values(version=number, name=name))
+            except Exception as e:
+                raise RuntimeError(f"Erreur lors de la migration {number} ({name}) : {e}") from e
+            print(f"[migrate] Migration {number} appliquée : {name}")
+            version = number
+
+    return version
+
+
+def bootstrap() -> int:
+    """
+    Démarrage de la base : pré-ouvre une connexion du pool puis met le
+    schéma à jour.
+
+    Prévu pour le thread de la base (DatabaseWorker) : la fenêtre
+    s'affiche sans attendre MySQL, et les chargements soumis ensuite
+    passent après la migration. Ses requêtes ne sont pas analysées
+    comme une action de l'application (voir untracked). En mode hors ligne, c'est le réplica
+    local qui est préparé (le serveur est migré par la synchronisation).
+
+    Returns:
+        int: Version du schéma après exécution
+    """
+    with untracked():
+        warm_up()
+        version = migrate()
+        if replica_path():
+            prepare_replica(get_engine())
+    return version
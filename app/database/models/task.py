@@ -14,8 +14,11 @@ Date : 01-01-2026
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, TIMESTAMP
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, Text, DateTime, TIMESTAMP, Index, Table
+from sqlalchemy.dialects import mysql
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 
 
@@ -44,6 +47,64 @@ class TaskPriority(str, Enum):
     URGENTE = "Urgente"
     
 
+# =======================
+# Codes stockés en base
+# =======================
+
+# Ordre du cycle de vie
+STATUS_CODES = {
+    TaskStatus.A_FAIRE: 1,
+    TaskStatus.EN_COURS: 2,
+    TaskStatus.TERMINE: 3,
+    TaskStatus.ANNULEE: 4,
+}
+
+# Ordre d'urgence : un ORDER BY priority croissant sert les plus urgentes d'abord
+PRIORITY_CODES = {
+    TaskPriority.URGENTE: 1,
+    TaskPriority.HAUTE: 2,
+    TaskPriority.MOYENNE: 3,
+    TaskPriority.BASSE: 4,
+}
+
+# Priorité enregistrée pour une tâche créée sans priorité
+DEFAULT_PRIORITY = TaskPriority.HAUTE
+
+
+class CodedEnum(TypeDecorator):
+    """
+    Enum Python stocké sous forme de petit entier (TINYINT sous MySQL).
+
+    Les valeurs liées (insertions, filtres, curseurs) peuvent être des
+    membres de l'Enum ou leurs libellés ; la lecture renvoie le membre.
+    """
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum_class, codes):
+        super().__init__()
+        self.enum_class = enum_class
+        # Tuple (hachable) : sert de clé au cache de compilation de SQLAlchemy
+        self.codes = tuple(codes.items())
+        self._codes = dict(codes)
+        self._members = {code: member for member, code in codes.items()}
+
+    def load_dialect_impl(self, dialect):
+        if dialect.name == "mysql":
+            return dialect.type_descriptor(mysql.TINYINT(unsigned=True))
+        return dialect.type_descriptor(SmallInteger())
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return self._codes[self.enum_class(value)]
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return self._members[int(value)]
+
+
 # =======================
 # Table de données des tâches
 # =======================
@@ -55,33 +116,121 @@ class Task(Base):
         id (int): Identifiant unique de la tâche.
         theme (str): Thème de la tâche
         title (str): Titre de la tâche.
-        status (str): Statut de la tâche (ex : 'En cours', 'Terminé').
-        description (str): Description détaillée.
-        priority (str | None): Priorité éventuelle (ex : 'Haute', 'Moyenne').
+        status (TaskStatus): Statut de la tâche (stocké en code, voir STATUS_CODES).
+        description (str): Description détaillée (TEXT, chargée à la demande :
+            ni le tableau ni les requêtes ORM ne la lisent par défaut).
+        priority (TaskPriority): Priorité (stockée en code, voir PRIORITY_CODES ;
+            DEFAULT_PRIORITY si non précisée).
         created_at (datetime): Date de création, générée automatiquement.
         deadline (datetime | None): Date limite de la tâche.
+        updated_at (datetime): Date de dernière modification.
+        version (int): Version de la ligne, incrémentée à chaque écriture
+            (concurrence optimiste : UPDATE ... WHERE version = :lue).
+        revision (int): Révision de la dernière écriture (voir task_revision).
+        deleted_at (datetime | None): Date de suppression ; une tâche
+            supprimée reste en base comme tombstone pour la synchronisation.
+        origin_key (str | None): Clé d'une tâche créée hors ligne
+            (réplica:id local, voir app.database.sync) : un envoi rejoué
+            retrouve la tâche au lieu de la créer une seconde fois.
     """
     __tablename__ = "task"
+    __table_args__ = (
+        # Colonnes du tableau : thème puis clés de chaque tri (pagination keyset)
+        Index("ix_task_theme_deadline", "theme", "deadline", "id"),
+        Index("ix_task_theme_priority", "theme", "priority", "id"),
+        Index("ix_task_theme_deadline_priority", "theme", "deadline", "priority", "id"),
+        # Filtres par statut / priorité, ordonnés par deadline
+        Index("ix_task_status_deadline", "status", "deadline"),
+        Index("ix_task_priority_deadline", "priority", "deadline"),
+        # Liste globale par deadline
+        Index("ix_task_deadline", "deadline", "id"),
+        # Flux de modifications : tâches écrites depuis une révision
+        Index("ix_task_revision", "revision"),
+        # Synthèse du tableau (get_board_summary) : GROUP BY lu dans l'index seul
+        Index("ix_task_summary", "theme", "status", "priority", "deadline", "deleted_at"),
+        # Tâche créée hors ligne : au plus une ligne par clé d'origine
+        Index("ux_task_origin_key", "origin_key", unique=True),
+        # Index plein texte utilisé par la recherche (MySQL uniquement : ailleurs
+        # ce serait un B-tree inutile à la recherche LIKE)
+        Index("ix_task_search", "theme", "title", "description", mysql_prefix="FULLTEXT").ddl_if(dialect="mysql"),
+    )
 
     id: int = Column(Integer, primary_key=True, autoincrement=True)
     theme: str = Column(String(255), nullable=False)
     title: str = Column(String(255), nullable=False)
     status: TaskStatus = Column(
-        SQLEnum(TaskStatus, name="taskstatus", values_callable=lambda x: [e.value for e in x]),
+        CodedEnum(TaskStatus, STATUS_CODES),
         nullable=False, 
-        default=TaskStatus.A_FAIRE  
+        default=TaskStatus.A_FAIRE,
+        server_default=str(STATUS_CODES[TaskStatus.A_FAIRE])
     )
-    description: str = Column(String(1024), nullable=False)
-    priority: Optional[TaskPriority] = Column(
-        SQLEnum(TaskPriority, name="taskpriority", values_callable=lambda x: [e.value for e in x]),
-        nullable=True
+    description = deferred(Column(Text, nullable=False))
+    priority: TaskPriority = Column(
+        CodedEnum(TaskPriority, PRIORITY_CODES),
+        nullable=False,
+        default=DEFAULT_PRIORITY,
+        server_default=str(PRIORITY_CODES[DEFAULT_PRIORITY])
     )
     created_at: DateTime = Column(TIMESTAMP, server_default=func.now(), nullable=False)
     deadline: Optional[DateTime] = Column(DateTime, nullable=True)
+    # Défaut aussi côté client : sous SQLite la colonne, ajoutée par migration, n'a pas de défaut
+    updated_at: DateTime = Column(
+        TIMESTAMP, default=func.now(), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+    version: int = Column(Integer, nullable=False, default=1, server_default="1")
+    revision: int = Column(BigInteger, nullable=False, default=0, server_default="0")
+    deleted_at: Optional[DateTime] = Column(DateTime, nullable=True)
+    origin_key: Optional[str] = Column(String(64), nullable=True)
 
     def __repr__(self) -> str:
         return (f"<Task(id={self.id}, title={self.title!r}, status={self.status.value}, "
                 f"priority={self.priority.value if self.priority else None})>")
     
     
-    
\ No newline at end of file
+    
+
+
+# =======================
+# Compteur de révisions
+# =======================
+task_revision = Table(
+    "task_revision",
+    Base.metadata,
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("value", BigInteger, nullable=False),
+)
+"""
+task_revision : ligne unique (id = 1) contenant la dernière révision
+attribuée. Chaque transaction d'écriture l'incrémente et marque ses
+lignes avec la nouvelle valeur ; le verrou posé par l'UPDATE est tenu
+jusqu'au commit, donc les révisions deviennent visibles dans l'ordre.
+"""
+
+
+# =======================
+# Archives
+# =======================
+task_archive = Table(
+    "task_archive",
+    Base.metadata,
+    # Même id que dans `task` : la restauration rend à la tâche son identité
+    Column("id", Integer, primary_key=True, autoincrement=False),
+    Column("theme", String(255), nullable=False),
+    Column("title", String(255), nullable=False),
+    Column("status", CodedEnum(TaskStatus, STATUS_CODES), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("priority", CodedEnum(TaskPriority, PRIORITY_CODES), nullable=False),
+    Column("created_at", TIMESTAMP, nullable=True),
+    Column("deadline", DateTime, nullable=True),
+    Column("updated_at", TIMESTAMP, nullable=True),
+    Column("version", Integer, nullable=False),
+    Column("archived_at", DateTime, server_default=func.now(), nullable=False),
+    # Consultation : plus récentes d'abord
+    Index("ix_task_archive_archived_at", "archived_at", "id"),
+)
+"""
+task_archive : tâches terminées ou annulées, sorties de la table `task`
+par app.database.archive. La ligne d'origine reste dans `task` comme
+tombstone (deleted_at) : les autres clients voient la tâche disparaître
+par le flux de modifications, et la retrouvent de même à sa restauration.
+"""
@@ -0,0 +1,161 @@
+# app/database/oplog.py
+
+"""
+Module oplog.py
+
+Journal des opérations du réplica local (mode hors ligne, DB_REPLICA).
+
+En mode hors ligne, l'application lit et écrit dans un réplica SQLite
+local ; chaque transaction d'écriture y ajoute, avant son commit et
+dans la même transaction, une entrée par tâche écrite dans `task_oplog`.
+Le journal est donc aussi durable que l'écriture elle-même : rien n'est
+perdu si MySQL est injoignable ou si l'application se ferme avant la
+synchronisation (app.database.sync).
+
+Tables locales du réplica (absentes de MySQL) :
+- task_oplog : opérations en attente d'envoi, dans l'ordre
+- task_shadow : dernier état de chaque tâche connu du serveur (base
+  commune de la fusion champ par champ)
+- sync_state : curseurs de synchronisation (dernière révision reçue)
+
+Identifiants : une tâche créée hors ligne reçoit un id à partir de
+LOCAL_ID_BASE, jamais attribué par MySQL ; elle prend son id définitif
+à son envoi. Le réplica tire au hasard, à sa création, son propre
+identifiant (sync_state) : avec l'id local, il forme la clé d'origine
+de la tâche sur le serveur (`origin_key`).
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import secrets
+from datetime import datetime
+from typing import List
+
+from sqlalchemy import (
+    BigInteger, Column, DateTime, Integer, MetaData, String, Table, Text, case, event, func, insert,
+    select
+)
+from sqlalchemy.engine import Engine
+
+from app.database.models.task import Task, task_archive
+
+
+# Premier id des tâches créées localement (ids MySQL : INT, < 2**31)
+LOCAL_ID_BASE = 2 ** 40
+
+# Clé de sync_state : identifiant du réplica
+REPLICA_ID = "replica_id"
+
+# Opérations journalisées
+OP_UPSERT = "upsert"
+OP_DELETE = "delete"
+OP_ARCHIVE = "archive"
+
+
+# =======================
+# Tables locales
+# =======================
+_metadata = MetaData()
+
+task_oplog = Table(
+    "task_oplog",
+    _metadata,
+    Column("seq", Integer, primary_key=True, autoincrement=True),
+    Column("task_id", BigInteger, nullable=False, index=True),
+    Column("op", String(16), nullable=False),
+    # Révision locale de l'écriture
+    Column("revision", BigInteger, nullable=False),
+    Column("recorded_at", DateTime, server_default=func.now(), nullable=False),
+)
+
+task_shadow = Table(
+    "task_shadow",
+    _metadata,
+    Column("id", BigInteger, primary_key=True, autoincrement=False),
+    # Version et révision de la ligne sur le serveur
+    Column("version", Integer, nullable=False),
+    Column("revision", BigInteger, nullable=False),
+    # Champs synchronisés, en JSON (voir app.database.sync)
+    Column("state", Text, nullable=False),
+)
+
+sync_state = Table(
+    "sync_state",
+    _metadata,
+    Column("key", String(64), primary_key=True),
+    Column("value", BigInteger, nullable=False),
+)
+
+
+def prepare_replica(engine: Engine) -> None:
+    """
+    Crée les tables locales du réplica et réserve la plage des ids locaux.
+
+    SQLite attribue à une nouvelle ligne le plus grand id + 1 : une
+    tombstone d'id LOCAL_ID_BASE suffit à placer les créations locales
+    au-delà des ids du serveur. L'identifiant du réplica est tiré une
+    fois pour toutes (voir origin_key).
+    """
+    _metadata.create_all(engine, checkfirst=True)
+    with engine.begin() as conn:
+        exists = conn.execute(select(Task.id).where(Task.id == LOCAL_ID_BASE)).first()
+        if exists is None:
+            conn.execute(insert(Task).values(
+                id=LOCAL_ID_BASE, theme="", title="", description="",
+                version=1, revision=0, deleted_at=datetime.now()
+            ))
+        if conn.execute(select(sync_state.c.value).where(sync_state.c.key == REPLICA_ID)).first() is None:
+            conn.execute(insert(sync_state).values(key=REPLICA_ID, value=secrets.randbits(63)))
+
+
+def origin_key(replica_id: int, task_id: int) -> str:
+    """Clé d'origine, sur le serveur, d'une tâche créée dans ce réplica."""
+    return f"{replica_id:016x}:{task_id}"
+
+
+# =======================
+# Journalisation
+# =======================
+def _operation():
+    """Opération déduite de l'état de la ligne écrite."""
+    return case(
+        (Task.deleted_at.is_(None), OP_UPSERT),
+        (Task.id.in_(select(task_archive.c.id)), OP_ARCHIVE),
+        else_=OP_DELETE,
+    )
+
+
+def _record_operations(session) -> None:
+    # Révision attribuée par _next_revision dans cette transaction
+    revision = session.info.pop("revision", None)
+    if revision is None or session.info.get("replicated"):
+        return
+    session.execute(
+        insert(task_oplog).from_select(
+            ["task_id", "op", "revision"],
+            select(Task.id, _operation(), Task.revision).where(Task.revision == revision)
+        )
+    )
+
+
+def _forget_revision(session) -> None:
+    session.info.pop("revision", None)
+
+
+def install_oplog(session_factory) -> None:
+    """Journalise les écritures des sessions de `session_factory`."""
+    event.listen(session_factory, "before_commit", _record_operations)
+    event.listen(session_factory, "after_rollback", _forget_revision)
+
+
+def pending_task_ids(session, task_ids: List[int]) -> set:
+    """Tâches parmi `task_ids` ayant des opérations non envoyées."""
+    return set(session.execute(
+        select(task_oplog.c.task_id).where(task_oplog.c.task_id.in_(task_ids)).distinct()
+    ).scalars())
+
+
+def count_pending_operations(session) -> int:
+    return session.execute(select(func.count()).select_from(task_oplog)).scalar_one()
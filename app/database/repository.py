@@ -0,0 +1,282 @@
+# app/database/repository.py
+
+"""
+Module repository.py
+
+Cache mémoire des tâches, entre le TasksController et base.py.
+
+- TaskRepository : tâches sérialisées indexées par id ; tri, filtrage
+  (par les ids trouvés par search_task_ids) et pagination des colonnes
+  calculés en mémoire
+- DescriptionCache : descriptions chargées à la demande (LRU), le
+  tableau ne les transférant pas
+- Fonctions d'écriture renvoyant la tâche sérialisée, à exécuter sur le
+  thread de la base (DatabaseWorker), pour une mise à jour du cache sans
+  relecture de la table (write-through)
+
+Le cache retient la révision de la base qu'il reflète : il n'est
+rechargé entièrement que sur invalidation explicite ; sinon seules les
+tâches écrites depuis cette révision (get_tasks_changed_since) lui
+sont appliquées.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+from bisect import bisect_right
+from collections import OrderedDict
+from datetime import datetime
+from enum import Enum
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Tuple
+
+from app.database.base import (
+    create_task, serialize_task,
+    SORT_PRIORITY, SORT_DEADLINE_PRIORITY, DEFAULT_PAGE_SIZE,
+    Cursor
+)
+from app.database.models.task import PRIORITY_CODES, DEFAULT_PRIORITY
+
+
+# Code de la priorité (ordre d'urgence) par valeur affichée
+_PRIORITY_CODE_BY_VALUE = {priority.value: code for priority, code in PRIORITY_CODES.items()}
+_DEFAULT_PRIORITY_CODE = PRIORITY_CODES[DEFAULT_PRIORITY]
+
+
+# =======================
+# Appels exécutés sur le thread de la base
+# =======================
+def create_task_record(**data) -> Dict[str, Any]:
+    """Crée une tâche (voir create_task) et la renvoie sérialisée."""
+    return serialize_task(create_task(**data))
+
+
+def _serialized_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Champs modifiés, convertis au format de serialize_task."""
+    fields = {}
+    for key, value in data.items():
+        if isinstance(value, Enum):
+            value = value.value
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        fields[key] = value
+    return fields
+
+
+# =======================
+# Tri et recherche en mémoire
+# =======================
+def _priority_rank(task: Dict[str, Any]) -> int:
+    return _PRIORITY_CODE_BY_VALUE.get(task.get("priority"), _DEFAULT_PRIORITY_CODE)
+
+
+def _sort_key(sort_key: str):
+    """
+    Clé de tri Python équivalente à celle de get_tasks_page :
+    tâches datées d'abord (deadline croissante), puis sans deadline,
+    départagées par l'id.
+    """
+    if sort_key == SORT_PRIORITY:
+        return lambda task: (_priority_rank(task), task["id"])
+    if sort_key == SORT_DEADLINE_PRIORITY:
+        return lambda task: (
+            task["deadline"] is None, task["deadline"] or "", _priority_rank(task), task["id"]
+        )
+    return lambda task: (task["deadline"] is None, task["deadline"] or "", task["id"])
+
+
+# =======================
+# Cache
+# =======================
+class TaskRepository:
+    """
+    Tâches en mémoire, indexées par id.
+
+    Utilisé depuis le thread de l'interface uniquement : les accès à la
+    base passent par le DatabaseWorker et leurs résultats sont appliqués
+    ici à réception.
+
+    _tasks: tâches sérialisées par id
+    _views: colonnes triées et filtrées, par (tri, ids retenus) ;
+        vidé à chaque modification
+    """
+
+    def __init__(self):
+        self._tasks: Dict[int, Dict[str, Any]] = {}
+        self._views: Dict[Tuple[str, Optional[frozenset]], Dict[str, Tuple[List[Cursor], List[Dict[str, Any]]]]] = {}
+        self.loaded = False
+        # Révision de la base reflétée par le cache
+        self.revision = 0
+
+    # -----------------------
+    # Contenu
+    # -----------------------
+    def replace(self, tasks: Iterable[Dict[str, Any]], revision: int):
+        """Remplace tout le contenu (chargement complet depuis la base)."""
+        self._tasks = {task["id"]: task for task in tasks}
+        self._views.clear()
+        self.loaded = True
+        self.revision = revision
+
+    def apply_changes(self, changed: Iterable[Dict[str, Any]], deleted: Iterable[int], revision: int):
+        """
+        Applique le résultat de get_tasks_changed_since (tâches sérialisées).
+
+        Returns:
+            bool: True si le contenu a changé
+        """
+        modified = False
+        for task in changed:
+            if self._tasks.get(task["id"]) != task:
+                self._tasks[task["id"]] = task
+                modified = True
+        for task_id in deleted:
+            modified |= self._tasks.pop(task_id, None) is not None
+        if modified:
+            self._views.clear()
+        self.revision = max(self.revision, revision)
+        return modified
+
+    def invalidate(self):
+        """Marque le cache comme périmé : le prochain accès recharge la base."""
+        self._tasks.clear()
+        self._views.clear()
+        self.loaded = False
+        self.revision = 0
+
+    def get(self, task_id: int) -> Optional[Dict[str, Any]]:
+        return self._tasks.get(task_id)
+
+    def tasks(self) -> List[Dict[str, Any]]:
+        """Toutes les tâches, sans ordre (ex : instantané du tableau)."""
+        return list(self._tasks.values())
+
+    # -----------------------
+    # Écritures (write-through)
+    #
+    # La révision n'avance pas : une écriture d'un autre client
+    # intercalée serait sinon manquée ; la ligne écrite ici reviendra
+    # simplement, identique, dans le prochain flux de modifications.
+    # -----------------------
+    def put(self, task: Dict[str, Any]):
+        """Ajoute ou remplace une tâche sérialisée."""
+        self._tasks[task["id"]] = task
+        self._views.clear()
+
+    def patch(self, updates: Iterable[Dict[str, Any]]):
+        """
+        Applique des modifications partielles (dicts avec "id", comme
+        update_tasks) ; chacune incrémente la version, comme en base.
+        """
+        for data in updates:
+            task = self._tasks.get(data["id"])
+            if task is not None:
+                fields = _serialized_fields(data)
+                fields.setdefault("version", (task.get("version") or 1) + 1)
+                self._tasks[task["id"]] = {**task, **fields}
+        self._views.clear()
+
+    def discard(self, task_ids: Iterable[int]):
+        """Retire des tâches."""
+        for task_id in task_ids:
+            self._tasks.pop(task_id, None)
+        self._views.clear()
+
+    # -----------------------
+    # Lecture
+    # -----------------------
+    def _columns(self, sort_key: str, matches: Optional[AbstractSet[int]]):
+        """Colonnes triées et filtrées : {thème: (clés de tri, tâches)}."""
+        if matches is not None and not isinstance(matches, frozenset):
+            matches = frozenset(matches)
+        view_key = (sort_key, matches)
+        columns = self._views.get(view_key)
+        if columns is None:
+            grouped: Dict[str, List[Dict[str, Any]]] = {}
+            for task in self._tasks.values():
+                if matches is None or task["id"] in matches:
+                    grouped.setdefault(task["theme"], []).append(task)
+
+            key = _sort_key(sort_key)
+            columns = {}
+            for theme in sorted(grouped):
+                tasks = sorted(grouped[theme], key=key)
+                columns[theme] = ([key(task) for task in tasks], tasks)
+            self._views[view_key] = columns
+        return columns
+
+    def page(
+        self,
+        theme: str,
+        sort_key: str,
+        after: Optional[Cursor] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        matches: Optional[AbstractSet[int]] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[Cursor]]:
+        """
+        Page d'une colonne, mêmes conventions que get_tasks_page :
+        reprise strictement après le curseur, curseur suivant ou None.
+
+        Args:
+            matches (set, optional): Ids retenus par la recherche (None : toutes)
+        """
+        keys, tasks = self._columns(sort_key, matches).get(theme, ([], []))
+        start = bisect_right(keys, after) if after is not None else 0
+        end = start + limit
+        next_cursor = keys[end - 1] if end < len(tasks) else None
+        return tasks[start:end], next_cursor
+
+    def board(
+        self,
+        sort_key: str,
+        matches: Optional[AbstractSet[int]] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        extents: Optional[Dict[str, int]] = None
+    ) -> List[Tuple[str, List[Dict[str, Any]], Optional[Cursor]]]:
+        """
+        Première page de chaque thème, même format que get_board_pages.
+
+        Args:
+            extents (dict, optional): Lignes déjà affichées par thème : une
+                colonne étendue (pages suivantes) garde au moins ce nombre
+        """
+        extents = extents or {}
+        return [
+            (theme, *self.page(theme, sort_key, limit=max(limit, extents.get(theme, 0)), matches=matches))
+            for theme in self._columns(sort_key, matches)
+        ]
+
+
+# =======================
+# Descriptions
+# =======================
+class DescriptionCache:
+    """
+    Descriptions des tâches, chargées à la demande (get_task_description)
+    et conservées pour les `capacity` dernières utilisées.
+
+    Utilisé depuis le thread de l'interface uniquement.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self.capacity = capacity
+        self._items: "OrderedDict[int, str]" = OrderedDict()
+
+    def get(self, task_id: int) -> Optional[str]:
+        description = self._items.get(task_id)
+        if description is not None:
+            self._items.move_to_end(task_id)
+        return description
+
+    def put(self, task_id: int, description: str):
+        self._items[task_id] = description
+        self._items.move_to_end(task_id)
+        while len(self._items) > self.capacity:
+            self._items.popitem(last=False)
+
+    def discard(self, task_ids: Iterable[int]):
+        for task_id in task_ids:
+            self._items.pop(task_id, None)
+
+    def clear(self):
+        self._items.clear()
@@ -0,0 +1,307 @@
+# app/database/snapshot.py
+
+"""
+Module snapshot.py
+
+Instantané disque du tableau : les tâches du TaskRepository (sans
+description) et la révision qu'elles reflètent, dans un fichier binaire
+compact relu au démarrage.
+
+Le tableau s'affiche depuis l'instantané dès la première image ; la
+base n'est ensuite interrogée que pour les tâches écrites depuis sa
+révision (get_tasks_changed_since).
+
+Format (entiers petit-boutistes) :
+- en-tête : MAGIC, nombre de tâches, de thèmes, révision, puis la
+  source (base d'origine) et le tri des colonnes, en chaînes préfixées
+  par leur longueur
+- thèmes, dans l'ordre d'affichage : nom, premier enregistrement, nombre
+- table des positions des enregistrements
+- enregistrements, groupés par thème et triés comme l'affichage :
+  id, version, révision, dates (µs depuis 1970, _NO_DATE si absente),
+  codes du statut et de la priorité, index du thème, titre
+
+Lecture : le fichier est projeté en mémoire (mmap) et seuls l'en-tête,
+les thèmes et la table des positions sont lus à l'ouverture ; un
+enregistrement n'est décodé qu'au premier accès. La première page de
+chaque colonne (`board()`) ne décode que les tâches affichées.
+
+L'écriture passe par un fichier temporaire propre à chaque appel,
+renommé à la fin : un arrêt brutal laisse l'instantané précédent
+intact, et deux écritures simultanées (fin de chargement, fermeture)
+ne mêlent pas leurs données.
+
+Un enregistrement corrompu n'est détecté qu'à son décodage :
+l'appelant intercepte SNAPSHOT_ERRORS, supprime le fichier
+(discard_snapshot) et recharge depuis la base.
+
+Variables d'environnement (fichier .env) :
+    BOARD_SNAPSHOT : fichier de l'instantané, vide pour désactiver
+        (défaut : board_snapshot.bin)
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+from app.database.base import DEFAULT_PAGE_SIZE, Cursor
+from app.database.engine import get_engine
+from app.database.models.task import STATUS_CODES, PRIORITY_CODES
+from app.database.repository import _sort_key
+
+
+DEFAULT_SNAPSHOT_PATH = "board_snapshot.bin"
+
+# Signature et version du format
+MAGIC = b"KAIROSNAP\x01"
+
+_HEADER = struct.Struct("<IIq")
+_LENGTH = struct.Struct("<H")
+_THEME = struct.Struct("<II")
+_OFFSET = struct.Struct("<I")
+# id, version, révision, created_at, deadline, updated_at, statut, priorité, thème
+_RECORD = struct.Struct("<qiqqqqBBH")
+
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+_NO_DATE = -(2 ** 63)
+
+_STATUS_BY_CODE = {code: status.value for status, code in STATUS_CODES.items()}
+_STATUS_CODE = {status.value: code for status, code in STATUS_CODES.items()}
+_PRIORITY_BY_CODE = {code: priority.value for priority, code in PRIORITY_CODES.items()}
+_PRIORITY_CODE = {priority.value: code for priority, code in PRIORITY_CODES.items()}
+
+# Erreurs de décodage d'un instantané corrompu ou d'un autre schéma
+SNAPSHOT_ERRORS = (KeyError, IndexError, ValueError, struct.error)
+
+
+def snapshot_path() -> str:
+    """Fichier de l'instantané configuré ("" : désactivé)."""
+    load_dotenv()
+    return os.getenv("BOARD_SNAPSHOT", DEFAULT_SNAPSHOT_PATH).strip()
+
+
+def snapshot_source() -> str:
+    """
+    Base d'origine d'un instantané : URL de l'engine, sans mot de passe
+    (aucune connexion ouverte). "" pour une base en mémoire, vide à
+    chaque lancement.
+    """
+    url = get_engine().url
+    if url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:"):
+        return ""
+    return url.render_as_string(hide_password=True)
+
+
+# =======================
+# Encodage
+# =======================
+def _pack_text(text: str) -> bytes:
+    data = text.encode("utf-8")
+    if len(data) > 0xFFFF:
+        raise ValueError("Texte trop long pour l'instantané")
+    return _LENGTH.pack(len(data)) + data
+
+
+def _pack_date(value: Optional[str]) -> int:
+    if not value:
+        return _NO_DATE
+    return (datetime.fromisoformat(value) - _EPOCH) // _MICROSECOND
+
+
+def _unpack_date(value: int) -> Optional[str]:
+    if value == _NO_DATE:
+        return None
+    return (_EPOCH + value * _MICROSECOND).isoformat()
+
+
+def save_snapshot(
+    path: str, tasks: Iterable[Dict[str, Any]], revision: int, sort_key: str, source: str
+) -> int:
+    """
+    Écrit l'instantané des tâches (format de serialize_task).
+
+    Args:
+        path (str): Fichier à écrire
+        tasks (Iterable[dict]): Tâches du tableau (descriptions ignorées)
+        revision (int): Révision de la base reflétée par les tâches
+        sort_key (str): Tri des colonnes (ordre des enregistrements)
+        source (str): Base d'origine (voir snapshot_source)
+
+    Returns:
+        int: Nombre de tâches écrites
+    """
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for task in tasks:
+        grouped.setdefault(task["theme"], []).append(task)
+    themes = sorted(grouped)
+    key = _sort_key(sort_key)
+
+    records, theme_table, first = [], [], 0
+    for index, theme in enumerate(themes):
+        column = sorted(grouped[theme], key=key)
+        theme_table.append(_pack_text(theme) + _THEME.pack(first, len(column)))
+        first += len(column)
+        for task in column:
+            records.append(_RECORD.pack(
+                task["id"], task.get("version") or 1, task.get("revision") or 0,
+                _pack_date(task.get("created_at")), _pack_date(task.get("deadline")),
+                _pack_date(task.get("updated_at")),
+                _STATUS_CODE[task["status"]], _PRIORITY_CODE.get(task.get("priority"), 0), index,
+            ) + _pack_text(task["title"]))
+
+    offsets, position = [], 0
+    for record in records:
+        offsets.append(_OFFSET.pack(position))
+        position += len(record)
+
+    directory, name = os.path.split(os.path.abspath(path))
+    descriptor, temporary = tempfile.mkstemp(prefix=f"{name}.", suffix=".part", dir=directory)
+    try:
+        with os.fdopen(descriptor, "wb") as file:
+            file.write(MAGIC)
+            file.write(_HEADER.pack(len(records), len(themes), revision))
+            file.write(_pack_text(source))
+            file.write(_pack_text(sort_key))
+            file.writelines(theme_table)
+            file.writelines(offsets)
+            file.writelines(records)
+        os.replace(temporary, path)
+    except BaseException:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return len(records)
+
+
+# =======================
+# Lecture
+# =======================
+class BoardSnapshot:
+    """
+    Instantané ouvert (projeté en mémoire), décodé à la demande.
+
+    Attributs :
+        revision (int): Révision de la base reflétée
+        source (str): Base d'origine
+        sort_key (str): Tri des colonnes enregistré
+    """
+
+    def __init__(self, path: str):
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._parse()
+        except Exception:
+            self.close()
+            raise
+
+    def _text(self, position: int) -> Tuple[str, int]:
+        (length,) = _LENGTH.unpack_from(self._map, position)
+        start = position + _LENGTH.size
+        return self._map[start:start + length].decode("utf-8"), start + length
+
+    def _parse(self):
+        if self._map[:len(MAGIC)] != MAGIC:
+            raise ValueError("Instantané d'un autre format")
+        position = len(MAGIC)
+        count, theme_count, self.revision = _HEADER.unpack_from(self._map, position)
+        position += _HEADER.size
+        self.source, position = self._text(position)
+        self.sort_key, position = self._text(position)
+
+        self.themes: List[Tuple[str, int, int]] = []
+        for _ in range(theme_count):
+            name, position = self._text(position)
+            self.themes.append((name, *_THEME.unpack_from(self._map, position)))
+            position += _THEME.size
+
+        self._offsets = memoryview(self._map)[position:position + count * _OFFSET.size].cast("I")
+        self._data = position + count * _OFFSET.size
+        self._decoded: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def task(self, index: int) -> Dict[str, Any]:
+        """Tâche n° `index` (ordre du fichier), au format de serialize_task."""
+        task = self._decoded.get(index)
+        if task is None:
+            position = self._data + self._offsets[index]
+            (task_id, version, revision, created_at, deadline, updated_at,
+             status, priority, theme) = _RECORD.unpack_from(self._map, position)
+            title, _ = self._text(position + _RECORD.size)
+            task = self._decoded[index] = {
+                "id": task_id,
+                "theme": self.themes[theme][0],
+                "title": title,
+                "status": _STATUS_BY_CODE[status],
+                "description": None,
+                "priority": _PRIORITY_BY_CODE.get(priority),
+                "created_at": _unpack_date(created_at),
+                "deadline": _unpack_date(deadline),
+                "updated_at": _unpack_date(updated_at),
+                "version": version,
+                "revision": revision,
+            }
+        return task
+
+    def tasks(self) -> Iterator[Dict[str, Any]]:
+        """Toutes les tâches, décodées au fil de l'itération."""
+        for index in range(len(self)):
+            yield self.task(index)
+
+    def board(self, limit: int = DEFAULT_PAGE_SIZE) -> List[Tuple[str, List[Dict[str, Any]], Optional[Cursor]]]:
+        """Première page de chaque thème, même format que TaskRepository.board."""
+        key = _sort_key(self.sort_key)
+        board = []
+        for name, first, count in self.themes:
+            tasks = [self.task(index) for index in range(first, first + min(count, limit))]
+            board.append((name, tasks, key(tasks[-1]) if count > limit else None))
+        return board
+
+    def close(self):
+        if getattr(self, "_offsets", None) is not None:
+            self._offsets.release()
+            self._offsets = None
+        if getattr(self, "_map", None) is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def discard_snapshot(path: str) -> None:
+    """Supprime un instantané illisible (le prochain chargement complet le réécrit)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def open_snapshot(path: str, source: str) -> Optional[BoardSnapshot]:
+    """
+    Ouvre l'instantané s'il existe et provient de la même base.
+
+    Returns:
+        Optional[BoardSnapshot]: None si absent, illisible ou d'une autre base
+    """
+    if not path or not source or not os.path.exists(path):
+        return None
+    try:
+        snapshot = BoardSnapshot(path)
+    except (OSError, ValueError, struct.error) as e:
+        print(f"[snapshot] Instantané ignoré : {e}")
+        return None
+    if snapshot.source != source:
+        snapshot.close()
+        return None
+    return snapshot
@@ -0,0 +1,586 @@
+# app/database/sync.py
+
+"""
+Module sync.py
+
+Synchronisation du réplica local avec le serveur (mode hors ligne,
+DB_REPLICA ; voir app.database.oplog).
+
+Un passage (`sync_once`) :
+
+1. Envoi : les opérations du journal sont regroupées par tâche et
+   envoyées par lots de SYNC_BATCH_SIZE tâches, une transaction serveur
+   par lot. Chaque tâche est fusionnée champ par champ entre l'état
+   local, l'état du serveur et leur base commune (task_shadow : dernier
+   état du serveur connu du réplica) :
+    - champ modifié d'un seul côté : cette valeur l'emporte
+    - champ modifié des deux côtés : la valeur du serveur, écrite la
+      première, l'emporte (même règle que TaskConflictError) et la
+      tâche est signalée en conflit
+    - suppression locale d'une tâche modifiée sur le serveur : la
+      modification l'emporte ; modification locale d'une tâche
+      supprimée sur le serveur : la suppression l'emporte
+   Une tâche créée hors ligne (id >= LOCAL_ID_BASE) est insérée sur le
+   serveur avec sa clé d'origine (origin_key : réplica et id local, clé
+   unique) puis prend, dans le réplica, l'id attribué par le serveur.
+   L'envoi est idempotent : si l'application s'arrête entre le commit du
+   serveur et celui du réplica, le journal est rejoué, la tâche est
+   retrouvée par sa clé d'origine et fusionnée au lieu d'être recréée ;
+   les autres opérations rejouées ne font que refusionner des champs
+   déjà égaux.
+   Une tâche archivée localement est archivée de même sur le serveur.
+2. Réception : les tâches écrites sur le serveur depuis la dernière
+   révision reçue sont copiées dans le réplica, sauf celles ayant des
+   opérations en attente (fusionnées au prochain envoi).
+
+Les écritures du réplica faites ici reçoivent une révision locale mais
+ne sont pas journalisées : le flux de modifications
+(get_tasks_changed_since) les fait apparaître dans le tableau comme
+celles d'un autre client.
+
+- SyncService : passages périodiques sur le thread d'arrière-plan du
+  DatabaseWorker ; un serveur injoignable n'est pas une erreur, le
+  journal attend le passage suivant
+
+Variables d'environnement (fichier .env) :
+    DB_SYNC_INTERVAL : intervalle entre deux passages, en secondes (défaut : 10)
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+import json
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+from sqlalchemy import delete, func, insert, literal, select, update
+from sqlalchemy.dialects import sqlite
+
+from app.database.base import (
+    _chunks, _fetch_records, _live, _next_revision, select_records, serialize_task, TaskConflictError
+)
+from app.database.engine import _env_int, get_engine, get_remote_engine, get_remote_session, get_session
+from app.database.migrations import migrate
+from app.database.models.task import Task, TaskStatus, TaskPriority, task_archive
+from app.database.oplog import (
+    LOCAL_ID_BASE, REPLICA_ID, origin_key, pending_task_ids, sync_state, task_oplog, task_shadow
+)
+from app.database.worker import DatabaseWorker
+
+
+# Tâches par transaction (envoi comme réception)
+SYNC_BATCH_SIZE = 200
+
+# Intervalle par défaut entre deux passages (s)
+DEFAULT_SYNC_INTERVAL = 10
+
+# Champs fusionnés, plus l'état de suppression
+SYNCED_FIELDS = ("theme", "title", "status", "description", "priority", "deadline")
+_DELETED = "deleted"
+
+# Clé de sync_state : dernière révision du serveur copiée dans le réplica
+_PULLED_REVISION = "pulled_revision"
+
+# Colonnes copiées du serveur vers le réplica
+_PULLED_COLUMNS = (
+    "theme", "title", "status", "description", "priority",
+    "created_at", "deadline", "updated_at", "deleted_at",
+)
+
+_TASK_COLUMNS = list(Task.__table__.c)
+
+
+class SyncReport(NamedTuple):
+    """
+    Bilan d'un passage.
+
+    Attributs :
+        pushed (int): Tâches envoyées au serveur
+        pulled (int): Tâches reçues du serveur
+        remapped (Dict[int, int]): Ids locaux des tâches créées hors
+            ligne -> ids attribués par le serveur
+        conflicts (List[TaskConflictError]): Tâches dont une modification
+            locale a été écartée (état résultant dans `current`)
+    """
+    pushed: int
+    pulled: int
+    remapped: Dict[int, int]
+    conflicts: List[TaskConflictError]
+
+
+class _Outcome(NamedTuple):
+    """Résultat de l'envoi d'une tâche, appliqué ensuite au réplica."""
+    task_id: int
+    new_id: Optional[int] = None
+    to_local: Optional[Dict[str, Any]] = None
+    shadow: Optional[Tuple[int, int, Dict[str, Any]]] = None
+    conflicted: bool = False
+    local_version: Optional[int] = None
+
+
+# =======================
+# États comparables
+# =======================
+def _encode(row) -> Dict[str, Any]:
+    """Champs synchronisés d'une ligne de task, sous forme JSON."""
+    return {
+        "theme": row.theme,
+        "title": row.title,
+        "status": row.status.name,
+        "description": row.description,
+        "priority": row.priority.name,
+        "deadline": row.deadline.isoformat() if row.deadline else None,
+        _DELETED: row.deleted_at is not None,
+    }
+
+
+def _decode(state: Dict[str, Any]) -> Dict[str, Any]:
+    """Valeurs de colonnes d'un état encodé (partiel ou complet)."""
+    values = {}
+    for name, value in state.items():
+        if name == "status":
+            value = TaskStatus[value]
+        elif name == "priority":
+            value = TaskPriority[value]
+        elif name == "deadline" and value is not None:
+            value = datetime.fromisoformat(value)
+        elif name == _DELETED:
+            name, value = "deleted_at", func.now() if value else None
+        values[name] = value
+    return values
+
+
+def _merge(
+    mine: Dict[str, Any], base: Dict[str, Any], theirs: Dict[str, Any]
+) -> Tuple[Dict[str, Any], Dict[str, Any], bool]:
+    """
+    Fusion champ par champ (voir l'en-tête du module).
+
+    Returns:
+        Tuple[dict, dict, bool]: Champs à écrire sur le serveur, champs à
+        écrire dans le réplica, et True si une modification locale est écartée
+    """
+    to_remote, to_local, conflicted = {}, {}, False
+    for name in (*SYNCED_FIELDS, _DELETED):
+        if mine[name] == theirs[name]:
+            continue
+        if mine[name] != base[name] and theirs[name] == base[name]:
+            to_remote[name] = mine[name]
+        else:
+            # Modifié sur le serveur seul, ou des deux côtés
+            to_local[name] = theirs[name]
+            conflicted = conflicted or mine[name] != base[name]
+
+    if to_remote.get(_DELETED) and any(theirs[name] != base[name] for name in SYNCED_FIELDS):
+        # Supprimée ici, modifiée sur le serveur : la tâche reste
+        return {}, {name: theirs[name] for name in theirs if mine[name] != theirs[name]}, True
+    if theirs[_DELETED] and to_remote and _DELETED not in to_remote:
+        # Modifiée ici, supprimée sur le serveur
+        return {}, {_DELETED: True}, True
+    return to_remote, to_local, conflicted
+
+
+def _save_shadow(session, task_id: int, version: int, revision: int, state: Dict[str, Any]) -> None:
+    values = {"version": version, "revision": revision, "state": json.dumps(state, ensure_ascii=False)}
+    statement = sqlite.insert(task_shadow).values(id=task_id, **values)
+    session.execute(statement.on_conflict_do_update(index_elements=[task_shadow.c.id], set_=values))
+
+
+# =======================
+# Envoi
+# =======================
+def _write_remote(remote, row, to_remote: Dict[str, Any], archived, revision: int) -> bool:
+    """Écrit les champs fusionnés d'une tâche sur le serveur (False : modifiée entre-temps)."""
+    if to_remote.get(_DELETED) and archived is not None:
+        # Archivée localement : même ligne d'archive sur le serveur
+        remote.execute(delete(task_archive).where(task_archive.c.id == row.id))
+        # Sous l'id du serveur (tâche créée hors ligne : id local dans le réplica)
+        remote.execute(insert(task_archive).values(**{**archived._mapping, "id": row.id}))
+    elif to_remote.get(_DELETED) is False:
+        # Restaurée localement
+        remote.execute(delete(task_archive).where(task_archive.c.id == row.id))
+
+    result = remote.execute(
+        update(Task)
+        .where(Task.id == row.id, Task.version == row.version)
+        .values(version=Task.version + 1, revision=revision, **_decode(to_remote))
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount == 1
+
+
+def _push_task(
+    remote, task_id: int, row, shadow, theirs_row, archived, revision: int, key: Optional[str] = None
+) -> Optional[_Outcome]:
+    """
+    Envoie une tâche ; None si elle doit attendre le passage suivant.
+
+    `theirs_row` est la ligne du serveur : même id, ou, pour une tâche
+    créée hors ligne déjà envoyée (envoi rejoué), même clé d'origine `key`.
+    """
+    if row is None:
+        return _Outcome(task_id)
+    mine = _encode(row)
+
+    if theirs_row is None:
+        # Inconnue du serveur : créée ici (ou importée avec son id)
+        if mine[_DELETED]:
+            return _Outcome(task_id)
+        values = _decode(mine)
+        if task_id < LOCAL_ID_BASE:
+            values["id"] = task_id
+        else:
+            values["origin_key"] = key
+        result = remote.execute(insert(Task).values(version=1, revision=revision, **values))
+        return _Outcome(task_id, new_id=result.inserted_primary_key[0], shadow=(1, revision, mine))
+
+    theirs = _encode(theirs_row)
+    # Sans base commune (jamais reçue), l'état du serveur en tient lieu
+    base = json.loads(shadow.state) if shadow is not None else theirs
+    to_remote, to_local, conflicted = _merge(mine, base, theirs)
+
+    shadow = (theirs_row.version, theirs_row.revision, theirs)
+    if to_remote:
+        if not _write_remote(remote, theirs_row, to_remote, archived, revision):
+            return None
+        shadow = (theirs_row.version + 1, revision, {**theirs, **to_remote})
+    return _Outcome(
+        task_id, new_id=theirs_row.id if theirs_row.id != task_id else None,
+        to_local=to_local, shadow=shadow, conflicted=conflicted, local_version=row.version
+    )
+
+
+def _apply_outcomes(outcomes: List[_Outcome], last_seq: int) -> Tuple[Dict[int, int], List[TaskConflictError]]:
+    """Reporte dans le réplica le résultat d'un lot envoyé, et vide le journal correspondant."""
+    session = get_session()
+    session.info["replicated"] = True
+    try:
+        revision = _next_revision(session)
+        remapped, conflicted = {}, []
+        for outcome in outcomes:
+            task_id = outcome.task_id
+            if outcome.new_id is not None and outcome.new_id != task_id:
+                # Copie sous l'id du serveur ; l'ancienne ligne devient tombstone
+                copied = [column for column in _TASK_COLUMNS if column.name not in ("id", "revision")]
+                session.execute(insert(Task).from_select(
+                    [column.name for column in copied] + ["id", "revision"],
+                    select(*copied, literal(outcome.new_id), literal(revision)).where(Task.id == task_id)
+                ))
+                session.execute(
+                    update(Task).where(Task.id == task_id)
+                    .values(description="", deleted_at=func.now(), version=Task.version + 1, revision=revision)
+                    .execution_options(synchronize_session=False)
+                )
+                session.execute(
+                    update(task_archive).where(task_archive.c.id == task_id).values(id=outcome.new_id)
+                )
+                # Opérations arrivées pendant l'envoi : suivent la tâche
+                session.execute(
+                    update(task_oplog)
+                    .where(task_oplog.c.task_id == task_id, task_oplog.c.seq > last_seq)
+                    .values(task_id=outcome.new_id)
+                )
+                remapped[task_id] = task_id = outcome.new_id
+
+            if outcome.to_local:
+                session.execute(
+                    update(Task)
+                    # Tâche modifiée ici depuis la lecture : fusionnée au passage suivant
+                    .where(Task.id == task_id, Task.version == outcome.local_version)
+                    .values(version=Task.version + 1, revision=revision, **_decode(outcome.to_local))
+                    .execution_options(synchronize_session=False)
+                )
+                if outcome.to_local.get(_DELETED) is False:
+                    session.execute(delete(task_archive).where(task_archive.c.id == task_id))
+            if outcome.shadow is not None:
+                _save_shadow(session, task_id, *outcome.shadow)
+            if outcome.conflicted:
+                conflicted.append(task_id)
+
+        session.execute(
+            delete(task_oplog).where(
+                task_oplog.c.task_id.in_([outcome.task_id for outcome in outcomes]),
+                task_oplog.c.seq <= last_seq
+            )
+        )
+        current = {}
+        if conflicted:
+            records = _fetch_records(session, select_records().where(Task.id.in_(conflicted), _live()))
+            current = {record.id: serialize_task(record) for record in records}
+        session.commit()
+        return remapped, [TaskConflictError(task_id, current.get(task_id)) for task_id in conflicted]
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def _push_chunk(task_ids: List[int], last_seq: int) -> Tuple[int, Dict[int, int], List[TaskConflictError]]:
+    session = get_session()
+    try:
+        local = {row.id: row for row in session.execute(select(*_TASK_COLUMNS).where(Task.id.in_(task_ids)))}
+        shadows = {row.id: row for row in session.execute(select(task_shadow).where(task_shadow.c.id.in_(task_ids)))}
+        archived = {
+            row.id: row
+            for row in session.execute(select(task_archive).where(task_archive.c.id.in_(task_ids)))
+        }
+        replica_id = session.execute(
+            select(sync_state.c.value).where(sync_state.c.key == REPLICA_ID)
+        ).scalar_one()
+    finally:
+        session.close()
+    # Clés d'origine des tâches créées hors ligne
+    keys = {task_id: origin_key(replica_id, task_id) for task_id in task_ids if task_id >= LOCAL_ID_BASE}
+
+    remote = get_remote_session()
+    try:
+        server_ids = [task_id for task_id in task_ids if task_id < LOCAL_ID_BASE]
+        theirs = {
+            row.id: row
+            for row in remote.execute(select(*_TASK_COLUMNS).where(Task.id.in_(server_ids)).with_for_update())
+        }
+        if keys:
+            # Déjà insérées par un envoi dont le réplica n'a pas enregistré l'issue
+            local_ids = {key: task_id for task_id, key in keys.items()}
+            for row in remote.execute(
+                select(*_TASK_COLUMNS).where(Task.origin_key.in_(list(keys.values()))).with_for_update()
+            ):
+                theirs[local_ids[row.origin_key]] = row
+        revision = _next_revision(remote)
+        outcomes = []
+        for task_id in task_ids:
+            outcome = _push_task(
+                remote, task_id, local.get(task_id), shadows.get(task_id), theirs.get(task_id),
+                archived.get(task_id), revision, keys.get(task_id)
+            )
+            if outcome is not None:
+                outcomes.append(outcome)
+        remote.commit()
+    except Exception:
+        remote.rollback()
+        raise
+    finally:
+        remote.close()
+
+    remapped, conflicts = _apply_outcomes(outcomes, last_seq) if outcomes else ({}, [])
+    return len(outcomes), remapped, conflicts
+
+
+def push_operations() -> Tuple[int, Dict[int, int], List[TaskConflictError]]:
+    """
+    Envoie au serveur les opérations du journal, par lots de tâches.
+
+    Returns:
+        Tuple[int, Dict[int, int], List[TaskConflictError]]: Tâches
+        envoyées, ids réattribués et conflits
+    """
+    session = get_session()
+    try:
+        last_seq = session.execute(select(func.max(task_oplog.c.seq))).scalar()
+        if last_seq is None:
+            return 0, {}, []
+        # Tâches dans l'ordre de leur première opération
+        task_ids = session.execute(
+            select(task_oplog.c.task_id)
+            .where(task_oplog.c.seq <= last_seq)
+            .group_by(task_oplog.c.task_id)
+            .order_by(func.min(task_oplog.c.seq))
+        ).scalars().all()
+    finally:
+        session.close()
+
+    pushed, remapped, conflicts = 0, {}, []
+    for chunk in _chunks(task_ids, SYNC_BATCH_SIZE):
+        count, chunk_remapped, chunk_conflicts = _push_chunk(list(chunk), last_seq)
+        pushed += count
+        remapped.update(chunk_remapped)
+        conflicts += chunk_conflicts
+    return pushed, remapped, conflicts
+
+
+# =======================
+# Réception
+# =======================
+def _apply_pulled(rows) -> int:
+    """Copie un lot de lignes du serveur dans le réplica (une transaction)."""
+    session = get_session()
+    session.info["replicated"] = True
+    try:
+        # Le verrou d'écriture est pris avant de lire le journal : aucune
+        # écriture locale ne peut s'intercaler
+        revision = _next_revision(session)
+        ids = [row.id for row in rows]
+        pending = pending_task_ids(session, ids)
+        known = dict(session.execute(
+            select(task_shadow.c.id, task_shadow.c.revision).where(task_shadow.c.id.in_(ids))
+        ).all())
+        existing = set(session.execute(select(Task.id).where(Task.id.in_(ids))).scalars())
+
+        pulled = 0
+        for row in rows:
+            # En attente d'envoi, déjà connue (écrite par nous), ou tombstone jamais vue
+            if row.id in pending or known.get(row.id) == row.revision:
+                continue
+            if row.deleted_at is not None and row.id not in existing:
+                continue
+            values = {name: getattr(row, name) for name in _PULLED_COLUMNS}
+            statement = sqlite.insert(Task).values(id=row.id, version=1, revision=revision, **values)
+            session.execute(statement.on_conflict_do_update(
+                index_elements=[Task.id],
+                set_={**values, "version": Task.version + 1, "revision": revision}
+            ))
+            _save_shadow(session, row.id, row.version, row.revision, _encode(row))
+            pulled += 1
+
+        if pulled:
+            session.commit()
+        else:
+            session.rollback()
+        return pulled
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        session.close()
+
+
+def pull_changes() -> int:
+    """
+    Copie dans le réplica les tâches écrites sur le serveur depuis la
+    dernière révision reçue.
+
+    Returns:
+        int: Tâches reçues
+    """
+    session = get_session()
+    try:
+        last = session.execute(
+            select(sync_state.c.value).where(sync_state.c.key == _PULLED_REVISION)
+        ).scalar() or 0
+    finally:
+        session.close()
+
+    pulled = 0
+    remote = get_remote_session()
+    try:
+        latest = remote.execute(select(func.max(Task.revision))).scalar() or 0
+        if latest <= last:
+            return 0
+        result = remote.execute(
+            select(*_TASK_COLUMNS)
+            .where(Task.revision > last, Task.revision <= latest)
+            .execution_options(yield_per=SYNC_BATCH_SIZE)
+        )
+        for rows in result.partitions():
+            pulled += _apply_pulled(rows)
+    finally:
+        remote.close()
+
+    session = get_session()
+    try:
+        statement = sqlite.insert(sync_state).values(key=_PULLED_REVISION, value=latest)
+        session.execute(statement.on_conflict_do_update(
+            index_elements=[sync_state.c.key], set_={"value": latest}
+        ))
+        session.commit()
+    finally:
+        session.close()
+    return pulled
+
+
+# =======================
+# Passage complet
+# =======================
+_remote_migrated = False
+
+
+def sync_once() -> SyncReport:
+    """
+    Envoie le journal puis reçoit les modifications du serveur.
+
+    À lancer hors du thread de l'interface (SyncService). Le schéma du
+    serveur est mis à jour au premier passage réussi.
+
+    Raises:
+        RuntimeError: Mode hors ligne désactivé
+        sqlalchemy.exc.DBAPIError: Serveur injoignable (journal conservé)
+    """
+    global _remote_migrated
+    engine = get_remote_engine()
+    if engine is None:
+        raise RuntimeError("Mode hors ligne désactivé (DB_REPLICA)")
+    get_engine()
+    if not _remote_migrated:
+        migrate(engine)
+        _remote_migrated = True
+
+    pushed, remapped, conflicts = push_operations()
+    pulled = pull_changes()
+    return SyncReport(pushed, pulled, remapped, conflicts)
+
+
+class SyncService(QObject):
+    """
+    Passages de synchronisation périodiques, un à la fois, sur le
+    thread d'arrière-plan du DatabaseWorker.
+
+    Utilisé depuis le thread de l'interface uniquement.
+    """
+
+    # Passage terminé (SyncReport)
+    synced = pyqtSignal(object)
+    # Serveur joignable ou non (émis au changement)
+    online_changed = pyqtSignal(bool)
+
+    def __init__(self, worker: Optional[DatabaseWorker] = None, interval: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self.worker = worker or DatabaseWorker.get_instance()
+        # None : aucun passage terminé
+        self.online: Optional[bool] = None
+        self._running = False
+
+        if interval is None:
+            interval = _env_int("DB_SYNC_INTERVAL", DEFAULT_SYNC_INTERVAL)
+        self._timer = QTimer(self)
+        self._timer.setInterval(interval * 1000)
+        self._timer.timeout.connect(self.sync_now)
+
+    def start(self):
+        """Lance un passage puis les passages périodiques (réplica prêt)."""
+        if not self._timer.isActive():
+            self._timer.start()
+            self.sync_now()
+
+    def is_active(self) -> bool:
+        return self._timer.isActive()
+
+    def sync_now(self):
+        """Lance un passage, sauf s'il y en a déjà un en cours."""
+        if self._running:
+            return
+        self._running = True
+        job = self.worker.submit_background(sync_once)
+        job.result.connect(self._on_synced)
+        job.error.connect(self._on_failed)
+        job.finished.connect(self._on_finished)
+
+    def _on_synced(self, report: SyncReport):
+        self._set_online(True)
+        self.synced.emit(report)
+
+    def _on_failed(self, error):
+        # Hors ligne : le journal attend le passage suivant
+        if self.online is not False:
+            print(f"[SyncService] Synchronisation impossible : {error}")
+        self._set_online(False)
+
+    def _on_finished(self):
+        self._running = False
+
+    def _set_online(self, online: bool):
+        if online != self.online:
+            self.online = online
+            self.online_changed.emit(online)
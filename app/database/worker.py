@@ -0,0 +1,224 @@
+# app/database/worker.py
+
+"""
+Module worker.py
+
+Exécution des accès à la base de données hors du thread de l'interface.
+
+- DatabaseWorker : singleton qui exécute les fonctions de base.py sur un
+  QThreadPool dédié, et les traitements longs (exports) sur un second
+- DatabaseJob : résultat d'un appel, livré par signal dans le thread
+  de l'interface (`result`, `error`, puis `finished`)
+
+Les fonctions de base.py ouvrent et ferment leur propre session
+SQLAlchemy : une session est créée, utilisée et fermée dans le même
+thread du pool, et n'est jamais partagée entre threads. Seul le pool de
+connexions de l'engine, thread-safe, est commun.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal, pyqtSlot
+
+from app.database.instrumentation import track_action
+
+
+# =======================
+# Appel en cours
+# =======================
+class DatabaseJob(QObject):
+    """
+    Appel d'une fonction d'accès aux données, exécuté par le DatabaseWorker.
+
+    Les signaux sont émis dans le thread de l'interface ; un appel annulé
+    n'émet que `finished`.
+
+    Un appel suivi (`tracked`) forme une action pour l'instrumentation :
+    ses requêtes sont analysées ensemble (N+1, requêtes répétées).
+    """
+    result = pyqtSignal(object)
+    error = pyqtSignal(Exception)
+    finished = pyqtSignal()
+
+    # Relais interne : thread du pool -> thread de l'interface
+    _done = pyqtSignal(bool, object)
+
+    def __init__(
+        self, fn: Callable[..., Any], args: tuple, kwargs: dict,
+        key: Optional[str] = None, tracked: bool = True
+    ):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.key = key
+        self.tracked = tracked
+        self.cancelled = False
+        self._done.connect(self._deliver)
+
+    def cancel(self) -> None:
+        """Annule l'appel : son résultat, s'il arrive, sera ignoré."""
+        self.cancelled = True
+
+    def _run(self) -> None:
+        """Exécuté dans le thread du pool."""
+        if self.cancelled:
+            self._done.emit(False, None)
+            return
+        try:
+            if self.tracked:
+                with track_action(getattr(self.fn, "__name__", repr(self.fn))):
+                    value = self.fn(*self.args, **self.kwargs)
+            else:
+                value = self.fn(*self.args, **self.kwargs)
+        except Exception as e:
+            self._done.emit(False, e)
+        else:
+            self._done.emit(True, value)
+
+    @pyqtSlot(bool, object)
+    def _deliver(self, ok: bool, value: Any) -> None:
+        """Exécuté dans le thread de l'interface."""
+        if not self.cancelled:
+            if ok:
+                self.result.emit(value)
+            elif value is not None:
+                self.error.emit(value)
+        self.finished.emit()
+
+
+class _JobRunnable(QRunnable):
+    """Enveloppe QRunnable d'un DatabaseJob."""
+
+    def __init__(self, job: DatabaseJob):
+        super().__init__()
+        self.job = job
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        self.job._run()
+
+
+# =======================
+# Worker
+# =======================
+class DatabaseWorker(QObject):
+    """
+    Exécuteur des accès à la base de données.
+
+    - Singleton accessible via `get_instance()`
+    - Un seul thread : les appels s'exécutent dans l'ordre de soumission
+      (une écriture suivie d'un rechargement voit toujours sa modification)
+    - Un appel soumis avec une clé remplace l'appel en attente de même clé
+    - Les traitements longs (`submit_background`) ont leur propre thread
+      et leur propre session : ils ne retardent pas le tableau
+    - À la fermeture, les appels à clé (lectures) en attente sont
+      abandonnés, les autres (écritures) menés à terme, puis les hooks
+      de fermeture exécutés (voir `add_shutdown_hook`)
+    """
+
+    _instance: Optional["DatabaseWorker"] = None
+
+    @classmethod
+    def get_instance(cls) -> "DatabaseWorker":
+        """Retourne l'instance unique (singleton) de DatabaseWorker."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.background_pool = QThreadPool(self)
+        self.background_pool.setMaxThreadCount(1)
+        self._runnables: Dict[DatabaseJob, _JobRunnable] = {}
+        self._keyed: Dict[str, DatabaseJob] = {}
+        self._shutdown_hooks: List[Callable[[], None]] = []
+
+    def submit(self, fn: Callable[..., Any], *args, key: Optional[str] = None, **kwargs) -> DatabaseJob:
+        """
+        Planifie `fn(*args, **kwargs)` sur le thread de la base.
+
+        Args:
+            fn (Callable): Fonction d'accès aux données (base.py)
+            key (str, optional): Clé de remplacement : l'appel précédent de
+                même clé est annulé s'il n'a pas encore livré son résultat
+
+        Returns:
+            DatabaseJob: Appel planifié, dont on écoute les signaux
+        """
+        if key is not None:
+            self.cancel(key)
+
+        job = DatabaseJob(fn, args, kwargs, key)
+        runnable = _JobRunnable(job)
+        self._runnables[job] = runnable
+        if key is not None:
+            self._keyed[key] = job
+        job.finished.connect(lambda: self._forget(job))
+
+        self.pool.start(runnable)
+        return job
+
+    def submit_background(self, fn: Callable[..., Any], *args, **kwargs) -> DatabaseJob:
+        """
+        Planifie un traitement long (export...) sur le thread d'arrière-plan.
+
+        Mêmes signaux que `submit` ; la fonction doit prévoir sa propre
+        interruption (annuler le DatabaseJob n'arrête pas un appel commencé).
+        """
+        # Traitement par lots : ses répétitions de requêtes sont voulues
+        job = DatabaseJob(fn, args, kwargs, tracked=False)
+        runnable = _JobRunnable(job)
+        self._runnables[job] = runnable
+        job.finished.connect(lambda: self._forget(job))
+
+        self.background_pool.start(runnable)
+        return job
+
+    def cancel(self, key: str) -> None:
+        """Annule l'appel en attente ou en cours associé à une clé."""
+        job = self._keyed.pop(key, None)
+        if job is None:
+            return
+        job.cancel()
+        # Pas encore démarré : retiré de la file sans passer par le thread
+        if self.pool.tryTake(self._runnables[job]):
+            job._deliver(False, None)
+
+    def add_shutdown_hook(self, hook: Callable[[], None]) -> None:
+        """
+        Enregistre une fonction appelée par `shutdown()`, une fois la
+        file vidée, dans le thread appelant : dernier accès à la base
+        avant la fermeture (ex : écritures différées), interruption des
+        traitements d'arrière-plan.
+        """
+        self._shutdown_hooks.append(hook)
+
+    def shutdown(self) -> None:
+        """
+        Abandonne les lectures en attente, attend la fin des écritures
+        puis exécute les hooks de fermeture (qui interrompent aussi les
+        traitements d'arrière-plan) et attend ces derniers.
+        """
+        for key in list(self._keyed):
+            self.cancel(key)
+        self.pool.waitForDone()
+        # File vide : les hooks accèdent seuls à la base
+        for hook in self._shutdown_hooks:
+            try:
+                hook()
+            except Exception as e:
+                print(f"[DatabaseWorker] Erreur à la fermeture : {e}")
+        self.background_pool.clear()
+        self.background_pool.waitForDone()
+
+    def _forget(self, job: DatabaseJob) -> None:
+        self._runnables.pop(job, None)
+        if job.key is not None and self._keyed.get(job.key) is job:
+            del self._keyed[job.key]
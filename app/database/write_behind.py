@@ -0,0 +1,138 @@
+# app/database/write_behind.py
+
+"""
+Module write_behind.py
+
+Écritures différées des modifications de tâches.
+
+- WriteBehindQueue : modifications en attente, fusionnées par tâche
+  pendant un court délai puis envoyées en une seule transaction
+  (update_tasks_guarded) sur le thread de la base
+
+L'appelant met l'affichage à jour tout de suite ; la base ne reçoit
+qu'un UPDATE par tâche et par envoi, quel que soit le nombre de
+modifications successives. Chaque tâche garde la version lue avant sa
+première modification en attente : une écriture d'un autre client entre
+les deux est détectée comme un conflit.
+
+Les modifications encore en attente à la fermeture sont écrites par le
+hook de fermeture du DatabaseWorker.
+
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from app.database.base import update_tasks_guarded
+from app.database.worker import DatabaseJob, DatabaseWorker
+
+
+class WriteBehindQueue(QObject):
+    """
+    File des modifications de tâches en attente d'écriture.
+
+    Utilisée depuis le thread de l'interface uniquement.
+
+    _pending: par id, (version lue, champs modifiés fusionnés)
+    """
+
+    # Délai de regroupement après la première modification (ms)
+    DEFAULT_DELAY = 500
+
+    # Valeurs écrites par id (comme update_task)
+    flushed = pyqtSignal(dict)
+    # Écriture refusée pour une tâche (TaskConflictError)
+    conflicted = pyqtSignal(Exception)
+    # Envoi en échec : modifications non écrites (id, version, champs), erreur
+    flush_failed = pyqtSignal(list, Exception)
+
+    def __init__(self, worker: Optional[DatabaseWorker] = None, delay: int = DEFAULT_DELAY, parent=None):
+        super().__init__(parent)
+        self.worker = worker or DatabaseWorker.get_instance()
+        self._pending: Dict[int, Tuple[Optional[int], Dict[str, Any]]] = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay)
+        self._timer.timeout.connect(self.flush)
+
+        self.worker.add_shutdown_hook(self.flush_now)
+
+    # -----------------------
+    # File
+    # -----------------------
+    def enqueue(self, task_id: int, fields: Dict[str, Any], expected_version: Optional[int] = None):
+        """
+        Ajoute une modification ; elle est fusionnée avec celles déjà en
+        attente pour la même tâche (la dernière valeur d'un champ l'emporte).
+
+        Args:
+            task_id (int): Tâche modifiée
+            fields (dict): Champs modifiés
+            expected_version (int, optional): Version affichée ; ignorée si
+                la tâche a déjà des modifications en attente
+        """
+        version, merged = self._pending.get(task_id, (expected_version, {}))
+        self._pending[task_id] = (version, {**merged, **fields})
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def expected_version(self, task_id: int) -> Optional[int]:
+        """Version en base attendue par les modifications en attente d'une tâche."""
+        pending = self._pending.get(task_id)
+        return pending[0] if pending is not None else None
+
+    def has_pending(self) -> bool:
+        return bool(self._pending)
+
+    def _take(self) -> List[Tuple[int, Optional[int], Dict[str, Any]]]:
+        self._timer.stop()
+        updates = [(task_id, version, fields) for task_id, (version, fields) in self._pending.items()]
+        self._pending.clear()
+        return updates
+
+    # -----------------------
+    # Envoi
+    # -----------------------
+    def flush(self) -> Optional[DatabaseJob]:
+        """
+        Envoie les modifications en attente sur le thread de la base.
+
+        À appeler avant toute autre écriture ou relecture des tâches :
+        le worker exécutant les appels dans l'ordre, elles verront ces
+        modifications.
+
+        Returns:
+            Optional[DatabaseJob]: L'envoi planifié (None si rien n'attendait)
+        """
+        updates = self._take()
+        if not updates:
+            return None
+        job = self.worker.submit(update_tasks_guarded, updates)
+        job.result.connect(self._on_flushed)
+        job.error.connect(lambda error, updates=updates: self.flush_failed.emit(updates, error))
+        return job
+
+    def flush_now(self):
+        """Écrit les modifications en attente dans le thread appelant (fermeture)."""
+        updates = self._take()
+        if not updates:
+            return
+        try:
+            _, conflicts = update_tasks_guarded(updates)
+        except Exception as e:
+            print(f"[WriteBehindQueue] {len(updates)} modification(s) non enregistrée(s) : {e}")
+            return
+        for conflict in conflicts:
+            print(f"[WriteBehindQueue] Modification non enregistrée : {conflict}")
+
+    def _on_flushed(self, result):
+        written, conflicts = result
+        if written:
+            self.flushed.emit(written)
+        for conflict in conflicts:
+            self.conflicted.emit(conflict)
@@ -0,0 +1,333 @@
+
+# ============================
+# TEMPLATES QSS DE L'APPLICATION
+# ============================
+#
+# Gabarits compilés par StylesheetCompiler en une feuille de style unique,
+# appliquée à la QApplication. Les clés {NOM} sont des variables du
+# StyleManager (les clés FONT_* sont mises à l'échelle) ; les accolades
+# littérales du QSS sont doublées.
+#
+# Ordre : à spécificité égale, la dernière règle l'emporte. Les conteneurs
+# (dont la règle s'applique à tous leurs descendants) viennent donc en
+# premier, du plus englobant au plus proche, puis les widgets.
+
+QSS_TEMPLATES = [
+
+    #--------------------------
+    # Conteneurs
+    #--------------------------
+    ("main_window", """
+        QMainWindow, QMainWindow * {{
+            background-color: #22313F;
+            color: {TEXT_COLOR_1};
+        }}
+    """),
+
+    ("menu", """
+        MenuWidget, MenuWidget * {{
+            background-color: {MENU_BACKGROUND_COLOR};
+        }}
+    """),
+
+    ("right_panel", """
+        RightPanel, RightPanel * {{
+            background-color: {BACKGROUND_COLOR};
+            color: {TEXT_COLOR_1};
+            border-radius: {BORDER_RADIUS_PANEL};
+        }}
+    """),
+
+    ("intro", """
+        IntroScreen QStackedWidget, IntroScreen QStackedWidget * {{
+            background: {BACKGROUND_COLOR};
+        }}
+    """),
+
+    ("settings_screen", """
+        BaseSettingsScreen, BaseSettingsScreen * {{
+            font-size: {FONT_SIZE_SETTING};
+            background-color: {MAIN_BG_COLOR};
+            border-radius: {BORDER_RADIUS};
+        }}
+    """),
+
+    ("settings_sections", """
+        AppearanceSection, AppearanceSection *,
+        MusicSection, MusicSection *,
+        UserSection, UserSection * {{
+            background: transparent;
+        }}
+    """),
+
+    ("dialog", """
+        MainDialogForm, MainDialogForm * {{
+            background: {BACKGROUND_COLOR};
+        }}
+    """),
+
+    ("message", """
+        CustomMessage {{
+            background-color: {SETTINGS_BG_COLOR};
+            border-radius: 12px;
+        }}
+        CustomMessage QLabel {{
+            color: {TEXT_COLOR_1};
+            font-size: 16px;
+            font-family: Lato;
+        }}
+        CustomMessage QPushButton {{
+            background-color: {BTN_SETTING_BG_COLOR};
+            color: white;
+            padding: 8px 20px;
+            border-radius: 8px;
+        }}
+        CustomMessage QPushButton:hover {{
+            background-color: {BTN_SETTING_HOVER_BG_COLOR};
+        }}
+    """),
+
+    #--------------------------
+    # Menu
+    #--------------------------
+    ("menu_button", """
+        MenuButton {{
+            padding: 12px 20px;
+            border-radius: 10px;
+            font-size: {FONT_SIZE_BULLET};
+            font-weight: 600;
+            color: white;
+            background: transparent;
+        }}
+        MenuButton:hover {{
+            background: #33475B;
+        }}
+        MenuButton[active="true"] {{
+            border-radius: 12px;
+            font-weight: 700;
+            color: #FFF;
+            background: #1B2838;
+        }}
+    """),
+
+    #--------------------------
+    # Écran des tâches
+    #--------------------------
+    ("screen_tasks", """
+        ScreenTasks {{
+            font-size: {FONT_SIZE_SETTING};
+            background-color: {MAIN_BG_COLOR};
+            border-radius: {BORDER_RADIUS};
+        }}
+    """),
+
+    ("theme_board", """
+        QWidget#ThemeBoardUI {{
+            font-size: {FONT_SIZE_SETTING};
+            background-color: {THEME_BG_COLOR};
+            border-radius: {BORDER_RADIUS};
+            border: 1px solid #000000;
+        }}
+        QWidget#ThemeColumn {{
+            font-size: {FONT_SIZE_SETTING};
+            background-color: {THEME_BG_COLOR};
+            border-radius: {BORDER_RADIUS};
+            border: 1px solid #000000;
+        }}
+        QListView#TaskListView {{
+            background: transparent;
+        }}
+    """),
+
+    ("task_description", """
+        TaskDescriptionDialog, ArchiveDialog {{
+            font-size: {FONT_SIZE_SETTING};
+            color: {TEXT_COLOR_1};
+            background-color: {MAIN_BG_COLOR};
+        }}
+        QLabel#DescLabel {{
+            background-color: {THEME_BG_COLOR};
+            padding: 8px;
+        }}
+    """),
+
+    #--------------------------
+    # Widgets système
+    #--------------------------
+    ("labels", """
+        QLabel#CustomLabel {{
+            font-size: {FONT_SIZE_SETTING};
+            color: {TEXT_COLOR_1};
+            padding: 2px 0;
+        }}
+        QLabel#TitleLabel {{
+            font-size: {FONT_SIZE_TITLE_SETTING};
+            font-weight: {FONT_WEIGHT_BOLD};
+            color: {SETTING_TITLE_COLOR};
+        }}
+        QLabel#SubtitleLabel {{
+            background: transparent;
+            font-size: {FONT_SIZE_SETTING};
+            font-weight: {FONT_WEIGHT_SEMIBOLD};
+            color: {TEXT_COLOR_1};
+        }}
+        QLabel#ThemeTitleLabel {{
+            background: {CARD_BG_COLOR};
+            font-size: {FONT_THEME_TITLE};
+            font-weight: {FONT_WEIGHT_SEMIBOLD};
+            border-radius: {BORDER_RADIUS};
+            padding: 10px;
+        }}
+    """),
+
+    ("hover_button", """
+        HoverButton {{
+            background-color: {BTN_SETTING_BG_COLOR};
+            color: {BUTTON_FG};
+            border-radius: {BORDER_RADIUS_BTN};
+            font-size: {FONT_SIZE_SETTING};
+        }}
+        HoverButton:hover {{
+            background-color: {BTN_SETTING_HOVER_BG_COLOR};
+            color: {BTN_SETTING_BG_COLOR};
+        }}
+    """),
+
+    ("line_edit", """
+        CustomLineEdit {{
+            padding: 6px 10px;
+            font-size: {FONT_SIZE_SETTING};
+            background-color: {INPUT_BACKGROUND_COLOR};
+            border-radius: {BORDER_RADIUS_BTN};
+            border: 1px solid {LINE_SETTING_COLOR};
+        }}
+    """),
+
+    ("text_edit", """
+        CustomTextEdit {{
+            font-size: {FONT_SIZE_SETTING};
+            padding: 6px 15px;
+            background-color: {INPUT_BACKGROUND_COLOR};
+            color: {TEXT_COLOR_1};
+            border-radius: {BORDER_RADIUS_BTN};
+            border: 1px solid {BORDER_COLOR};
+        }}
+    """),
+
+    ("combo", """
+        CustomComboBox {{
+            background-color: {INPUT_BACKGROUND_COLOR};
+            font-size: {FONT_SIZE_SETTING};
+            /* espace pour la flèche externe */
+            padding: 6px 20px 6px 15px;
+            color: {TEXT_COLOR_1};
+            border: 1px solid {BORDER_COLOR};
+            border-radius: {BORDER_RADIUS_BTN};
+        }}
+        /* Masque la flèche native */
+        CustomComboBox::drop-down {{
+            width: 0px;
+            border: none;
+        }}
+        /* Popup */
+        CustomComboBox QListView {{
+            background-color: {INPUT_BACKGROUND_COLOR};
+            border: 1px solid {BORDER_COLOR};
+            selection-background-color: {HOVER_COLOR};
+            border-radius: {BORDER_RADIUS_BTN};
+            outline: 0;
+        }}
+        CustomComboBox QListView::item {{
+            background-color: transparent;
+            font-size: {FONT_SIZE_SETTING};
+            padding: 8px 10px;
+            color: {TEXT_COLOR_1};
+            border-radius: {BORDER_RADIUS_BTN};
+        }}
+        CustomComboBox QListView::item:hover,
+        CustomComboBox QListView::item:selected {{
+            background-color: {MENU_ACTIVE_BG};
+            color: {TEXT_COLOR_HOVER};
+            border-radius: {BORDER_RADIUS_BTN};
+        }}
+    """),
+
+    ("datetime_edit", """
+        CustomDateTimeEdit {{
+            font-size: {FONT_SIZE_SETTING};
+            padding: 6px 10px 6px 10px;
+            color: {TEXT_COLOR_1};
+            background-color: {INPUT_BACKGROUND_COLOR};
+            border: 1px solid {BORDER_COLOR};
+            border-radius: {BORDER_RADIUS_BTN};
+        }}
+        CustomDateTimeEdit::drop-down {{
+            width: 20px;
+        }}
+        CustomDateTimeEdit QCalendarWidget {{
+            background-color: {INPUT_BACKGROUND_COLOR};
+            color: {TEXT_COLOR_1};
+            font-size: {FONT_SIZE_SETTING};
+            border: 1px solid {BORDER_COLOR};
+        }}
+        CustomDateTimeEdit QCalendarWidget QToolButton {{
+            background-color: {BACKGROUND_COLOR_COMBO};
+            height: 30px;
+            border: none;
+        }}
+        CustomDateTimeEdit QCalendarWidget QAbstractItemView {{
+            selection-background-color: {BG_DISABLED_COLOR};
+            outline: none;
+        }}
+        CustomDateTimeEdit QCalendarWidget QAbstractItemView::item:selected {{
+            background-color: {BG_DISABLED_COLOR};
+            color: {TEXT_COLOR_1};
+        }}
+        CustomDateTimeEdit QCalendarWidget QAbstractItemView::item:hover {{
+            background-color: {BORDER_COLOR};
+        }}
+    """),
+
+    ("separator", """
+        CustomSeparator {{
+            background-color: {LINE_SETTING_COLOR};
+        }}
+    """),
+
+    ("scroll_area", """
+        CustomScrollArea {{
+            background-color: {SETTINGS_BG_COLOR};
+            border: none;
+        }}
+        CustomScrollArea QScrollBar:vertical {{
+            background: {BG_DISABLED_COLOR};
+            width: 15px;
+            border-radius: 6px;
+        }}
+        CustomScrollArea QScrollBar::handle:vertical {{
+            background: {BTN_SETTING_BG_COLOR};
+            min-height: 30px;
+            border-radius: 6px;
+        }}
+        CustomScrollArea QScrollBar::handle:vertical:hover {{
+            background: {BTN_SETTING_HOVER_BG_COLOR};
+        }}
+        CustomScrollArea QScrollBar:horizontal {{
+            background: {BG_DISABLED_COLOR};
+            height: 12px;
+            border-radius: 6px;
+        }}
+        CustomScrollArea QScrollBar::handle:horizontal {{
+            background: {BTN_SETTING_BG_COLOR};
+            min-width: 30px;
+            border-radius: 6px;
+        }}
+        CustomScrollArea QScrollBar::handle:horizontal:hover {{
+            background: {BTN_SETTING_HOVER_BG_COLOR};
+        }}
+        CustomScrollArea QScrollBar::add-line, CustomScrollArea QScrollBar::sub-line {{
+            width: 0px;
+            height: 0px;
+        }}
+    """),
+]
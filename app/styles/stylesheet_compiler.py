@@ -0,0 +1,101 @@
+# app/styles/stylesheet_compiler.py
+
+"""
+Module stylesheet_compiler.py
+
+Compilation de la feuille de style unique de l'application Kairo.
+
+Les gabarits de qss_templates.py sont rendus une fois par couple
+(thème, échelle de police) à partir des variables du StyleManager, puis
+mis en cache. Un changement de thème se résume alors à un seul appel à
+`QApplication.setStyleSheet` ; les widgets n'ont plus de feuille de
+style propre ni de connexion à `theme_changed` pour leur style.
+
+Les états visuels passent par des propriétés dynamiques (ex : `active`)
+et `StylesheetCompiler.set_state()`. Les cartes de tâches, dessinées
+par TaskCardDelegate, n'ont pas de règle ici.
+
+Auteur : SethiarWorks
+Date : 01-01-2026
+"""
+
+from typing import Any, Dict, Tuple
+
+from app.styles.style_manager import StyleManager
+from app.styles.qss_templates import QSS_TEMPLATES
+
+
+class _StyleVars(dict):
+    """Variables des gabarits : polices mises à l'échelle, autres clés telles quelles."""
+
+    def __missing__(self, key: str) -> Any:
+        if key.startswith("FONT_SIZE") or key == "FONT_THEME_TITLE":
+            return StyleManager.get_scaled_font(key)
+        return StyleManager.get(key)
+
+
+class StylesheetCompiler:
+    """
+    Classe statique qui compile et met en cache la feuille de style globale.
+
+    _cache: feuilles compilées, par (thème, échelle de police)
+    """
+    _cache: Dict[Tuple[str, float], str] = {}
+
+    @staticmethod
+    def compile(theme_name: str) -> str:
+        """
+        Retourne la feuille de style de l'application pour le thème courant.
+
+        Args:
+            theme_name (str): Nom du thème chargé dans le StyleManager
+
+        Returns:
+            str: Feuille de style complète
+        """
+        key = (theme_name, StyleManager._current_scale)
+        stylesheet = StylesheetCompiler._cache.get(key)
+        if stylesheet is None:
+            variables = _StyleVars()
+            stylesheet = "\n".join(
+                template.format_map(variables) for _, template in QSS_TEMPLATES
+            )
+            StylesheetCompiler._cache[key] = stylesheet
+        return stylesheet
+
+    @staticmethod
+    def apply(app, theme_name: str):
+        """
+        Applique la feuille compilée à la QApplication.
+
+        Args:
+            app (QApplication): Application
+            theme_name (str): Nom du thème courant
+        """
+        stylesheet = StylesheetCompiler.compile(theme_name)
+        if app.styleSheet() != stylesheet:
+            app.setStyleSheet(stylesheet)
+
+    @staticmethod
+    def invalidate():
+        """Vide le cache (après modification directe des variables de style)."""
+        StylesheetCompiler._cache.clear()
+
+    @staticmethod
+    def set_state(widget, name: str, value: Any):
+        """
+        Change une propriété dynamique utilisée par la feuille de style
+        et met à jour l'apparence du seul widget concerné.
+
+        Args:
+            widget (QWidget): Widget ciblé
+            name (str): Nom de la propriété (ex : 'active')
+            value (Any): Nouvelle valeur
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
+        widget.update()
@@ -5,6 +5,7 @@ from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QFont
 
 from app.styles.style_manager import StyleManager
+from app.styles.stylesheet_compiler import StylesheetCompiler
 from app.ui.menu.menu_widget import MenuWidget
 from app.ui.screens.screen_manager import ScreenManager
 from app.core.settings.theme_manager import ThemeManager
@@ -65,11 +66,8 @@ class MainWindow(QMainWindow):
         font = QFont(family, size)
         app.setFont(font)
 
-        # Background global
-        self.setStyleSheet(f"""
-            background-color: #22313F;
-            color: {StyleManager.get("TEXT_COLOR_1")};
-        """)
+        # Feuille de style globale (compilée une fois par thème et échelle)
+        StylesheetCompiler.apply(app, self.theme_manager.current_theme)
 
         self.repaint()
         app.processEvents()
\ No newline at end of file
@@ -21,8 +21,6 @@ from PyQt6.QtCore import Qt, pyqtSignal
 from app.ui.widgets.settings_widgets.display_items import LogoDisplayItem
 from .menu_button import MenuButton
 
-from app.styles.style_manager import StyleManager
-
 
 class MenuWidget(QWidget):
     """
@@ -49,13 +47,6 @@ class MenuWidget(QWidget):
         """
         super().__init__(parent)
         self.setFixedWidth(260)
-        
-        # Style du menu (couleur de fond fixe)
-        self.setStyleSheet(f"""
-            QWidget {{
-                background-color: {StyleManager.get('MENU_BACKGROUND_COLOR')};
-            }}
-        """)
 
         self.active_button = None
         
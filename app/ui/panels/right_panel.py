@@ -7,8 +7,7 @@ Conteneur principal pour la partie droite de l’interface.
 Affiche dynamiquement l’écran demandé via un QStackedWidget.
 
 Points clés :
-    - Style entièrement piloté par StyleManager.
-    - Réagit automatiquement aux changements de thème.
+    - Style : RightPanel de la feuille globale (StylesheetCompiler).
     - Construction propre, lisible et extensible.
 
 Auteur : SethiarWorks
@@ -16,8 +15,6 @@ Date : 01-01-2026
 """
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QStackedWidget
-from app.styles.style_manager import StyleManager
-from app.core.settings.theme_manager import ThemeManager
 from app.ui.screens.intro.tuto_panel import IntroScreen
 
 
@@ -29,10 +26,6 @@ class RightPanel(QWidget):
         super().__init__()
         
         self._init_ui()
-        self._apply_style()
-        
-        # Mise à jour lorsque le thème change
-        ThemeManager.get_instance().theme_changed.connect(self._apply_style)
         
     # =======================
     # UI Construction
@@ -60,22 +53,6 @@ class RightPanel(QWidget):
 
         self.set_screen("intro")
        
-        
-    # =======================
-    # UI Construction
-    # =======================
-    
-    def _apply_style(self):
-        """
-        Applique le style du RightPanel selon le thème actif.
-        """
-        
-        self.setStyleSheet(f"""
-            background-color: {StyleManager.get('BACKGROUND_COLOR')};
-            color: {StyleManager.get('TEXT_COLOR_1')};
-            border-radius: {StyleManager.get('BORDER_RADIUS_PANEL')};
-        """)
-
 
     # =======================
     # Screen management
@@ -28,17 +28,18 @@ class BaseScreen(QWidget):
         # --------------------------
         if scroll:
 
-            scroll_area = CustomScrollArea()
-            scroll_area.setWidgetResizable(True)
+            self.scroll_area = CustomScrollArea()
+            self.scroll_area.setWidgetResizable(True)
              
             self.inner_widget = QWidget()
-            scroll_area.setWidget(self.inner_widget)
+            self.scroll_area.setWidget(self.inner_widget)
             
             self.inner_layout = QVBoxLayout(self.inner_widget)
             
-            self.outer_layout.addWidget(scroll_area)
+            self.outer_layout.addWidget(self.scroll_area)
 
         else:
+            self.scroll_area = None
             self.inner_widget = self
             self.inner_layout = QVBoxLayout(self)
              
@@ -8,7 +8,6 @@ from app.assets.assets import LEFT_ARROW_ICON, RIGHT_ARROW_ICON
 from .screens import Screen0, Screen1, Screen2, Screen3
 from .dot_label import DotLabel 
 
-from app.styles.style_manager import StyleManager
 
 class IntroScreen(QWidget):
     
@@ -73,9 +72,6 @@ class IntroScreen(QWidget):
             QSizePolicy.Policy.Expanding, 
             QSizePolicy.Policy.Expanding
         )
-        self.stack.setStyleSheet(f"""
-                background: {StyleManager.get('BACKGROUND_COLOR')};
-        """)
         layout.addWidget(self.stack)
 
         # Navigation
@@ -0,0 +1,126 @@
+# app/ui/screens/screen_tasks/archive/archive_dialog.py
+
+from PyQt6.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QListWidget, QListWidgetItem, QAbstractItemView
+from PyQt6.QtCore import Qt
+
+from app.ui.widgets.system.label import SubtitleLabel
+from app.ui.widgets.system.line_edit import CustomLineEdit
+from app.ui.widgets.system.hover_button import HoverButton
+
+
+class ArchiveDialog(QDialog):
+    """
+    Tâches archivées (terminées ou annulées depuis longtemps) :
+    - Recherche sur le thème ou le titre
+    - Pages chargées à la demande, plus récentes d'abord
+    - Restauration des tâches sélectionnées dans le tableau
+    
+    Les accès à la base passent par le TasksController.
+    """
+    
+    def __init__(self, controller, parent=None):
+        super().__init__(parent)
+        
+        self.setObjectName("ArchiveDialog")
+        self.setWindowTitle("Archives")
+        self.setMinimumSize(500, 500)
+        
+        self.controller = controller
+        self._cursor = None
+        
+        layout = QVBoxLayout(self)
+        layout.setSpacing(10)
+        
+        # Recherche
+        self.search_input = CustomLineEdit()
+        self.search_input.setPlaceholderText("Thème ou titre")
+        layout.addWidget(self.search_input)
+        
+        # Liste des tâches archivées
+        self.list_widget = QListWidget()
+        self.list_widget.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        layout.addWidget(self.list_widget)
+        
+        self.status_label = SubtitleLabel("Chargement…")
+        layout.addWidget(self.status_label)
+        
+        # Boutons
+        self.btn_more = HoverButton("Afficher plus")
+        self.btn_more.setEnabled(False)
+        self.btn_restore = HoverButton("Restaurer")
+        self.btn_restore.setEnabled(False)
+        close_btn = HoverButton("Fermer")
+        
+        btn_layout = QHBoxLayout()
+        btn_layout.addWidget(self.btn_more)
+        btn_layout.addStretch()
+        btn_layout.addWidget(self.btn_restore)
+        btn_layout.addWidget(close_btn)
+        layout.addLayout(btn_layout)
+        
+        # Connexions
+        self.search_input.textChanged.connect(self.reload)
+        self.btn_more.clicked.connect(self._load_more)
+        self.btn_restore.clicked.connect(self._restore_selected)
+        close_btn.clicked.connect(self.close)
+        self.list_widget.itemSelectionChanged.connect(
+            lambda: self.btn_restore.setEnabled(bool(self.list_widget.selectedItems()))
+        )
+        self.controller.archive_page_loaded.connect(self._on_page_loaded)
+        self.controller.archive_restored.connect(self._on_restored)
+        self.finished.connect(self._disconnect)
+        
+        self.reload()
+        
+        
+    #-------------------
+    # Chargement
+    #-------------------
+    def reload(self):
+        self.controller.load_archive(self.search_input.text().strip())
+        
+        
+    def _load_more(self):
+        if self._cursor is not None:
+            self.controller.load_archive(self.search_input.text().strip(), after=self._cursor)
+        
+        
+    def _on_page_loaded(self, tasks, cursor, first):
+        if first:
+            self.list_widget.clear()
+        for task in tasks:
+            item = QListWidgetItem(self._label(task))
+            item.setData(Qt.ItemDataRole.UserRole, task["id"])
+            self.list_widget.addItem(item)
+        
+        self._cursor = cursor
+        self.btn_more.setEnabled(cursor is not None)
+        self.status_label.setText(
+            f"{self.list_widget.count()} tâche(s) affichée(s)" if self.list_widget.count()
+            else "Aucune tâche archivée"
+        )
+        
+        
+    @staticmethod
+    def _label(task):
+        archived = (task["archived_at"] or "")[:10]
+        return f"{task['title']}  —  {task['theme']}  ·  {task['status']}  ·  archivée le {archived}"
+        
+        
+    #-------------------
+    # Restauration
+    #-------------------
+    def _restore_selected(self):
+        task_ids = [item.data(Qt.ItemDataRole.UserRole) for item in self.list_widget.selectedItems()]
+        if task_ids:
+            self.btn_restore.setEnabled(False)
+            self.controller.restore_archived(task_ids)
+        
+        
+    def _on_restored(self, count):
+        self.reload()
+        
+        
+    def _disconnect(self):
+        self.controller.archive_page_loaded.disconnect(self._on_page_loaded)
+        self.controller.archive_restored.disconnect(self._on_restored)
@@ -1,19 +1,88 @@
 # app/ui/screens/screen_task/controller.py
 
-from PyQt6.QtCore import QObject, pyqtSignal
+import threading
 
-from app.database.base import get_all_tasks, delete_task, update_task, create_task
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from app.database.base import (
+    load_all_tasks, get_tasks_revision, get_tasks_changed_since, delete_task,
+    delete_tasks, update_tasks, create_tasks, search_task_ids, get_task_description,
+    get_board_summary, serialize_task, TaskConflictError, DEFAULT_PAGE_SIZE
+)
+from app.database.archive import get_archived_page, restore_tasks
+from app.database.engine import replica_path
+from app.database.export import export_tasks, ExportCancelled, ICAL_TODO
+from app.database.importer import import_tasks
+from app.database.repository import TaskRepository, DescriptionCache, create_task_record
+from app.database.snapshot import (
+    SNAPSHOT_ERRORS, discard_snapshot, open_snapshot, save_snapshot, snapshot_path, snapshot_source
+)
+from app.database.sync import SyncService
+from app.database.worker import DatabaseWorker
+from app.database.write_behind import WriteBehindQueue
 
 
 class TasksController(QObject):
     """
     Controller pour ScreenTasks.
-    - Charge les tâches depuis la DB.
-    - Applique tri multi-critères et filtrage.
+    - Charge les tâches depuis la DB dans un TaskRepository (cache mémoire).
+    - Applique tri multi-critères et pagination depuis le cache ; la
+      recherche (plein texte, côté SQL) ne renvoie que des ids.
+    - Charge les descriptions à la demande (`request_description`).
+    - Consulte et restaure les tâches archivées (`load_archive`,
+      `restore_archived`).
+    - Exporte les tâches en arrière-plan (`export_to`), avec progression.
+    - Importe un fichier de tâches en arrière-plan (`import_from`) ; le
+      tableau est rechargé une seule fois, à la fin.
+    - Affiche les comptes de chaque colonne (total, ouvertes, en retard),
+      lus par une requête d'agrégat (`refresh_summary`) et non comptés
+      sur les tâches chargées.
     - Gère la sélection des cartes.
+    
+    Tous les accès à la base passent par le DatabaseWorker : l'interface
+    n'attend jamais MySQL, elle affiche un état de chargement.
+    Les écritures mettent le cache à jour avec la tâche renvoyée par la
+    base, sans relire la table ; les modifications d'une tâche sont
+    affichées tout de suite et écrites en différé (WriteBehindQueue),
+    regroupées en une transaction ; un rechargement complet n'a lieu qu'au
+    premier affichage ou sur `refresh()`. Les modifications des autres
+    clients sont détectées par une sonde périodique de la révision, et
+    seules les tâches modifiées depuis sont relues.
+    
+    Au démarrage, le tableau est affiché depuis l'instantané disque du
+    dernier tableau (app.database.snapshot), sans attendre la base ; la
+    sonde de révision n'en relit ensuite que les différences. L'instantané
+    est réécrit après chaque chargement complet et à la fermeture.
+    
+    En mode hors ligne (DB_REPLICA), la base est un réplica local : les
+    écritures n'attendent jamais le réseau, et la synchronisation
+    (SyncService) fait apparaître les tâches reçues du serveur par le
+    même flux de modifications.
     """
 
+    # Intervalle de la sonde de révision (ms)
+    CHANGE_PROBE_INTERVAL = 5000
+    # Relecture des comptes des colonnes sans écriture (retards) (ms)
+    SUMMARY_REFRESH_INTERVAL = 60000
+
     task_selected = pyqtSignal(dict)
+    # Description chargée (id de la tâche, texte) ; id en object : un int Qt
+    # est sur 32 bits et tronquerait les ids locaux (>= LOCAL_ID_BASE)
+    description_loaded = pyqtSignal(object, str)
+    # Page des archives (tâches, curseur suivant, True si première page)
+    archive_page_loaded = pyqtSignal(list, object, bool)
+    # Tâches restaurées depuis les archives (nombre)
+    archive_restored = pyqtSignal(int)
+    # Export : progression (tâches écrites, total), fin (tâches, fichier), échec
+    export_progress = pyqtSignal(int, int)
+    export_finished = pyqtSignal(int, str)
+    export_failed = pyqtSignal(str)
+    # Import : progression (lignes traitées), bilan (ImportReport), échec
+    import_progress = pyqtSignal(int)
+    import_finished = pyqtSignal(object)
+    import_failed = pyqtSignal(str)
+    loading_changed = pyqtSignal(bool)
+    error_occurred = pyqtSignal(str)
 
     def __init__(
         self, 
@@ -22,7 +91,7 @@ class TasksController(QObject):
         search_input=None
     ):
         """
-        :param ???
+        :param theme_board: ThemeBoard affichant les colonnes
         :param sort_combobox: CustomComboBox pour le tri
         :param search_input: Optional QLineEdit pour filtrage
         """
@@ -30,94 +99,598 @@ class TasksController(QObject):
         self.theme_board = theme_board
         self.sort_combobox = sort_combobox
         self.search_input = search_input
+        
+        self.worker = DatabaseWorker.get_instance()
+        self.repository = TaskRepository()
+        self.descriptions = DescriptionCache()
+        
+        # Modifications de tâches en attente d'écriture
+        self.writes = WriteBehindQueue(self.worker, parent=self)
+        self.writes.conflicted.connect(self._resolve_conflict)
+        self.writes.flush_failed.connect(self._on_flush_failed)
+        self.writes.flushed.connect(lambda _: self.refresh_summary())
+        
+        # Interruption de l'export en cours (None : aucun)
+        self._export_stop = None
+        self.worker.add_shutdown_hook(self.cancel_export)
+        # Interruption de l'import en cours (None : aucun)
+        self._import_stop = None
+        self.worker.add_shutdown_hook(self.cancel_import)
+        
+        # Instantané du tableau ("" : désactivé) ; lu une seule fois, au
+        # premier affichage, et gardé ouvert jusqu'à sa reprise dans le cache
+        self._snapshot_path = snapshot_path()
+        self._snapshot_source = snapshot_source() if self._snapshot_path else ""
+        self._snapshot_tried = False
+        self._snapshot = None
+        self.worker.add_shutdown_hook(self.save_snapshot)
+        
+        # Critères de l'affichage courant et curseurs des colonnes
+        self._query = ""
+        self._sort_key = ""
+        self._cursors = {}
+        # Lignes affichées par colonne étendue (load_more) ; conservées d'un
+        # rendu à l'autre, remises à zéro par un vrai rechargement
+        self._extents = {}
+        # Ids retenus par la recherche en cours (None : pas de recherche)
+        self._matches = None
+        
+        # Appels en attente
+        self._pending = 0
+        
+        # Synchronisation du réplica local, lancée dès que la base répond
+        self.sync = None
+        if replica_path():
+            self.sync = SyncService(self.worker, parent=self)
+            self.sync.synced.connect(self._on_synced)
+        
+        # Sonde des modifications faites par d'autres clients
+        self._probe_timer = QTimer(self)
+        self._probe_timer.setInterval(self.CHANGE_PROBE_INTERVAL)
+        self._probe_timer.timeout.connect(self.check_for_changes)
+        self._probe_timer.start()
+        
+        # Tâches passées en retard sans écriture
+        self._summary_timer = QTimer(self)
+        self._summary_timer.setInterval(self.SUMMARY_REFRESH_INTERVAL)
+        self._summary_timer.timeout.connect(self.refresh_summary)
+        self._summary_timer.start()
 
         # Connexions
         self.theme_board.task_clicked.connect(self._on_task_clicked)
+        self.theme_board.load_more_requested.connect(self.load_more)
         
         self.sort_combobox.currentTextChanged.connect(self.reload_tasks)
         if self.search_input:
             self.search_input.textChanged.connect(self.reload_tasks)
 
     
+    # =======================
+    # Appels à la base
+    # =======================
+    
+    def _submit(self, fn, *args, on_result=None, key=None, **kwargs):
+        """Planifie un appel sur le worker et suit l'état de chargement."""
+        job = self.worker.submit(fn, *args, key=key, **kwargs)
+        if on_result is not None:
+            job.result.connect(on_result)
+        job.error.connect(self._on_error)
+        job.finished.connect(self._on_job_finished)
+        
+        self._pending += 1
+        if self._pending == 1:
+            self.loading_changed.emit(True)
+        return job
+    
+    
+    def _on_job_finished(self):
+        self._pending -= 1
+        if self._pending == 0:
+            self.loading_changed.emit(False)
+            
+            
+    def _on_error(self, error):
+        if isinstance(error, TaskConflictError):
+            self._resolve_conflict(error)
+            return
+        self.error_occurred.emit(str(error))
+        
+        
+    def _on_flush_failed(self, updates, error):
+        # Affichage en avance sur la base : resynchronisé
+        self.error_occurred.emit(
+            f"{len(updates)} modification(s) n'ont pas pu être enregistrées : {error}"
+        )
+        self.refresh()
+        
+        
+    def _resolve_conflict(self, error):
+        """
+        Écriture refusée (tâche modifiée ailleurs) : le cache reprend
+        l'état de la base et l'utilisateur est prévenu.
+        """
+        self.descriptions.discard([error.task_id])
+        if self.repository.loaded:
+            if error.current is None:
+                self.repository.discard([error.task_id])
+            else:
+                self.repository.put(error.current)
+            self._render()
+        self.error_occurred.emit(
+            f"{error}. L'affichage a été mis à jour, vos modifications "
+            "n'ont pas été enregistrées."
+        )
+    
+    
     # =======================
     # Chargement des tâches
     # =======================
     
     def reload_tasks(self):
-        """Charge et trie les tâches selon le critère choisi."""
-        tasks = get_all_tasks()
-       
-        # --- Filtrage par recherche ---
-        if self.search_input:
-            query = self.search_input.text().strip().lower()
-            if query:
-                tasks = [
-                    t for t in tasks
-                    if query in t["theme"].lower() 
-                    or query in t["title"].lower() 
-                    or query in t["description"].lower()
-                ]
-
-        # --- Tri ---
-        sort_key = self.sort_combobox.currentText()
-        if sort_key == "Date de fin":
-            # Trier par deadline croissant
-            tasks.sort(key=lambda t: t["deadline"] or "9999-12-31")
-        elif sort_key == "Urgence":
-            # Trier par priorité : Haute -> Moyenne -> Basse
-            priority_order = {"Urgente":0, "Haute": 1, "Moyenne": 2, "Basse": 3}
-            tasks.sort(key=lambda t: priority_order.get(t.get("priority", "Moyenne"), 1))
-        elif sort_key == "Deadline puis Urgence":
-            # Tri combiné : deadline, puis priorité
-            priority_order = {"Urgente":0, "Haute": 1, "Moyenne": 2, "Basse": 3}
-            tasks.sort(key=lambda t: (t["deadline"] or "9999-12-31", priority_order.get(t.get("priority", "Moyenne"), 1)))
-
-        # Mise à jour UI
-        self.theme_board.clear()
-        for task in tasks:
-            theme = task.get("theme", "Sans titre")
-            self.theme_board.add_task_to_theme(task["theme"], task)
+        """Affiche le tableau selon le critère choisi (depuis le cache s'il est chargé)."""
+        # --- Recherche (côté SQL) et tri (en mémoire) ---
+        self._query = self.search_input.text().strip() if self.search_input else ""
+        self._sort_key = self.sort_combobox.currentText()
+        # Nouveaux critères : colonnes ramenées à leur première page
+        self._extents.clear()
+        
+        if self.repository.loaded:
+            self._update_view()
+        elif self._snapshot is not None:
+            # Instantané en cours de reprise : affiché selon les critères courants
+            return
+        elif not self._restore_snapshot():
+            self.refresh()
+            
+            
+    def _restore_snapshot(self) -> bool:
+        """
+        Affiche le tableau depuis l'instantané disque (premier affichage),
+        puis le reprend dans le cache à l'itération suivante de la boucle
+        d'événements.
+        
+        Returns:
+            bool: False si aucun instantané utilisable (chargement complet)
+        """
+        if self._snapshot_tried or not self._snapshot_source:
+            return False
+        self._snapshot_tried = True
+        snapshot = open_snapshot(self._snapshot_path, self._snapshot_source)
+        if snapshot is None:
+            return False
+        
+        # Tri enregistré et pas de recherche : première page déjà ordonnée
+        if not self._query and snapshot.sort_key == self._sort_key:
+            try:
+                board = snapshot.board()
+            except SNAPSHOT_ERRORS as e:
+                self._discard_snapshot(snapshot, e)
+                return False
+            self.theme_board.set_board(board)
+            self._cursors = {theme: cursor for theme, _, cursor in board}
+        self._snapshot = snapshot
+        QTimer.singleShot(0, self._adopt_snapshot)
+        return True
+    
+    
+    def _discard_snapshot(self, snapshot, error):
+        """Instantané corrompu (décodage) : supprimé, la base fait foi."""
+        print(f"[TasksController] Instantané illisible, ignoré : {error!r}")
+        snapshot.close()
+        discard_snapshot(self._snapshot_path)
+    
+    
+    def _adopt_snapshot(self):
+        snapshot, self._snapshot = self._snapshot, None
+        try:
+            tasks = list(snapshot.tasks())
+        except SNAPSHOT_ERRORS as e:
+            self._discard_snapshot(snapshot, e)
+            self.refresh()
+            return
+        self.repository.replace(tasks, snapshot.revision)
+        snapshot.close()
+        self._update_view()
+        self.refresh_summary()
+        # Revalidation : seules les tâches écrites depuis l'instantané sont relues
+        self.check_for_changes()
+        
+        
+    def save_snapshot(self):
+        """Enregistre le tableau affiché dans l'instantané disque."""
+        if not self._snapshot_source or not self.repository.loaded:
+            return
+        save_snapshot(
+            self._snapshot_path, self.repository.tasks(), self.repository.revision,
+            self._sort_key, self._snapshot_source
+        )
+            
+            
+    def refresh(self):
+        """Recharge toutes les tâches depuis la base (invalidation explicite)."""
+        # Modifications en attente écrites d'abord : le chargement les voit
+        self.writes.flush()
+        self._extents.clear()
+        # Un nouveau chargement remplace celui en attente
+        self._submit(load_all_tasks, on_result=self._on_tasks_loaded, key="load_tasks")
+        
+        
+    def check_for_changes(self):
+        """
+        Sonde la révision de la base et applique les modifications
+        survenues depuis celle du cache.
+        
+        Appel silencieux (ni état de chargement, ni message d'erreur) :
+        la sonde tourne en continu, y compris base indisponible.
+        """
+        # Pendant un import, un seul rechargement à la fin
+        if not self.repository.loaded or self._import_stop is not None:
+            return
+        job = self.worker.submit(get_tasks_revision, key="probe_revision")
+        job.result.connect(self._on_revision)
+        job.error.connect(lambda e: print(f"[TasksController] Sonde de révision : {e}"))
+            
+            
+    def _on_revision(self, revision):
+        if not self.repository.loaded:
+            return
+        # Base répondant : réplica prêt (migré), synchronisation possible
+        self._start_sync()
+        if revision < self.repository.revision:
+            # Base plus ancienne que le cache (instantané d'une base restaurée)
+            self.refresh()
+        elif revision > self.repository.revision:
+            self.writes.flush()
+            self._submit(
+                get_tasks_changed_since, self.repository.revision,
+                on_result=self._on_changes, key="load_changes"
+            )
+            
+            
+    def _on_changes(self, changes):
+        records, deleted, revision = changes
+        # TaskRecord sérialisés ici, hors du thread de la base
+        changed = [serialize_task(record) for record in records]
+        if changed or deleted:
+            self.refresh_summary()
+        # Descriptions éventuellement modifiées : relues au prochain affichage
+        self.descriptions.discard([task["id"] for task in changed])
+        self.descriptions.discard(deleted)
+        if self.repository.loaded and self.repository.apply_changes(changed, deleted, revision):
+            self._update_view()
+        
+        
+    def _on_tasks_loaded(self, result):
+        records, revision = result
+        # TaskRecord sérialisés ici, hors du thread de la base
+        self.repository.replace(map(serialize_task, records), revision)
+        self.descriptions.clear()
+        self._update_view()
+        self.refresh_summary()
+        self._start_sync()
+        # Instantané réécrit hors du thread de l'interface (tâches copiées :
+        # le cache continue d'évoluer)
+        if self._snapshot_source:
+            self.worker.submit_background(
+                save_snapshot, self._snapshot_path, self.repository.tasks(),
+                revision, self._sort_key, self._snapshot_source
+            ).error.connect(lambda e: print(f"[TasksController] Instantané : {e}"))
+            
+            
+    def _start_sync(self):
+        # Réplica prêt (migré) : la synchronisation peut commencer
+        if self.sync is not None and not self.sync.is_active():
+            self.sync.start()
+            
+            
+    def _on_synced(self, report):
+        for conflict in report.conflicts:
+            self._resolve_conflict(conflict)
+        # Tâches reçues ou renumérotées : relues par le flux de modifications
+        if report.pulled or report.remapped:
+            self.check_for_changes()
+        
+        
+    def refresh_summary(self):
+        """
+        Relit les comptes des colonnes (une requête GROUP BY, sans lire
+        les tâches). Appel silencieux, comme la sonde de révision.
+        """
+        job = self.worker.submit(get_board_summary, key="board_summary")
+        job.result.connect(self.theme_board.set_summary)
+        job.error.connect(lambda e: print(f"[TasksController] Comptes du tableau : {e}"))
+        
+        
+    def _update_view(self):
+        """Affiche le tableau, après avoir relancé la recherche s'il y en a une."""
+        if self._query:
+            # La recherche (SQL) doit voir les modifications en attente
+            self.writes.flush()
+            # Une nouvelle recherche remplace celle en attente
+            self._submit(
+                search_task_ids, self._query,
+                on_result=self._on_search_result, key="search_tasks"
+            )
+        else:
+            self._matches = None
+            self._render()
+            
+            
+    def _on_search_result(self, task_ids):
+        self._matches = frozenset(task_ids)
+        self._render()
+        
+        
+    def _render(self):
+        # Mise à jour UI : seules les cartes modifiées sont touchées ; les
+        # colonnes étendues gardent leurs lignes
+        board = self.repository.board(self._sort_key, self._matches, extents=self._extents)
+        self.theme_board.set_board(board)
+        self._cursors = {theme: cursor for theme, _, cursor in board}
+            
+            
+    def load_more(self, theme: str):
+        """Affiche la page suivante d'une colonne."""
+        if self._cursors.get(theme) is None:
+            return
+        
+        tasks, cursor = self.repository.page(
+            theme, self._sort_key, after=self._cursors[theme], matches=self._matches
+        )
+        self._show_page(theme, tasks, cursor)
+            
+            
+    def load_more_all(self):
+        """Affiche la page suivante de toutes les colonnes incomplètes."""
+        for theme in self.theme_board.columns_with_more():
+            self.load_more(theme)
+            
+    
+    def _show_page(self, theme: str, tasks, cursor):
+        self._cursors[theme] = cursor
+        self._extents[theme] = max(self._extents.get(theme, 0), DEFAULT_PAGE_SIZE) + len(tasks)
+        
+        self.theme_board.append_tasks(theme, tasks)
+        self.theme_board.set_has_more(theme, cursor is not None)
     
     
     # =======================
     # Sélection d'une tâche
     # =======================
     
-    def _on_task_clicked(self, task_data, card_widget):
-        # Désélection de toutes les cartes
-        for column in self.theme_board.theme_columns.values():
-            for card in column.tasks:
-                card.set_selected(False)
-        
-        #Sélection de la carte cliquée
-        card_widget.set_selected(True)
+    def _on_task_clicked(self, task_data):
+        # Sélection de la carte cliquée, désélection des autres colonnes
+        self.theme_board.select_task(task_data["id"])
         
         # Emission du signal        
         self.task_selected.emit(task_data)
+        
+        
+    # =======================
+    # Descriptions (à la demande)
+    # =======================
+    
+    def request_description(self, task_id: int):
+        """Émet `description_loaded` pour une tâche, depuis le cache ou la base."""
+        description = self.descriptions.get(task_id)
+        if description is not None:
+            self.description_loaded.emit(task_id, description)
+            return
+        self._submit(
+            get_task_description, task_id,
+            on_result=lambda text, task_id=task_id: self._on_description(task_id, text),
+            key=f"description_{task_id}"
+        )
+        
+        
+    def _on_description(self, task_id, description):
+        if description is None:
+            # Tâche supprimée entre-temps
+            self.description_loaded.emit(task_id, "")
+            return
+        self.descriptions.put(task_id, description)
+        self.description_loaded.emit(task_id, description)
+    
+    
+    # =======================
+    # Archives
+    # =======================
+    
+    def load_archive(self, search: str = "", after=None):
+        """Émet `archive_page_loaded` avec une page des tâches archivées."""
+        self._submit(
+            get_archived_page, after=after, search=search,
+            on_result=lambda page, first=after is None: self.archive_page_loaded.emit(*page, first),
+            key="archive_page"
+        )
+        
+        
+    def restore_archived(self, task_ids):
+        # Les tâches restaurées reviennent par le flux de modifications
+        self._submit(restore_tasks, list(task_ids), on_result=self._on_archived_restored)
+        
+        
+    def _on_archived_restored(self, count):
+        self.check_for_changes()
+        self.archive_restored.emit(count)
+    
+    
+    # =======================
+    # Export
+    # =======================
+    
+    def export_to(self, path: str, ical_component: str = ICAL_TODO):
+        """
+        Exporte les tâches dans un fichier (format selon l'extension), sur
+        le thread d'arrière-plan : le tableau reste utilisable.
+        """
+        self.cancel_export()
+        stop = self._export_stop = threading.Event()
+        
+        def start():
+            if stop.is_set():
+                return
+            job = self.worker.submit_background(
+                export_tasks, path, ical_component=ical_component,
+                progress=self.export_progress.emit, stop=stop.is_set
+            )
+            job.result.connect(lambda count: self.export_finished.emit(count, path))
+            job.error.connect(self._on_export_error)
+        
+        # Modifications en attente écrites avant la lecture
+        flush = self.writes.flush()
+        if flush is None:
+            start()
+        else:
+            flush.finished.connect(start)
+            
+            
+    def cancel_export(self):
+        if self._export_stop is not None:
+            self._export_stop.set()
+            self._export_stop = None
+            
+            
+    def _on_export_error(self, error):
+        if isinstance(error, ExportCancelled):
+            self.export_failed.emit("Export annulé")
+        else:
+            self.export_failed.emit(f"Erreur lors de l'export : {error}")
+    
+    
+    # =======================
+    # Import
+    # =======================
+    
+    def import_from(self, path: str):
+        """
+        Importe un fichier CSV / NDJSON sur le thread d'arrière-plan ;
+        la sonde de révision est suspendue jusqu'à la fin.
+        """
+        self.cancel_import()
+        self.writes.flush()
+        stop = self._import_stop = threading.Event()
+        job = self.worker.submit_background(
+            import_tasks, path, progress=self.import_progress.emit, stop=stop.is_set
+        )
+        job.result.connect(self.import_finished.emit)
+        job.error.connect(lambda error: self.import_failed.emit(f"Erreur lors de l'import : {error}"))
+        job.finished.connect(lambda: self._on_import_done(stop))
+        
+        
+    def cancel_import(self):
+        if self._import_stop is not None:
+            self._import_stop.set()
+            self._import_stop = None
+            
+            
+    def _on_import_done(self, stop):
+        if self._import_stop is stop:
+            self._import_stop = None
+        # Un seul rechargement, y compris après annulation (lots déjà écrits)
+        self.refresh()
     
     
     # =======================  
     # Suppression de la tâche
     # =======================
     def suppress_task(self, task_id):
-        # Supprime de la DB et recharge la liste
-        delete_task(task_id)
-        self.reload_tasks()
+        # Supprime de la DB (si la tâche n'a pas changé entre-temps)
+        # puis retire la tâche du cache
+        self.writes.flush()
+        self._submit(
+            delete_task, task_id, expected_version=self._version_of(task_id),
+            on_result=lambda _, task_id=task_id: self._on_tasks_deleted([task_id])
+        )
+        
+        
+    def _on_tasks_deleted(self, task_ids):
+        self.descriptions.discard(task_ids)
+        self._apply(self.repository.discard, task_ids)
+        self.refresh_summary()
         
         
     # =======================
     # Modification de la tâche
     # =======================
     def edit_task(self, task_id: int, **kwargs):
-        update_task(task_id, **kwargs)
-        self.reload_tasks()
+        # Affichage immédiat ; l'écriture est différée et fusionnée avec
+        # les modifications suivantes de la même tâche
+        expected_version = self.writes.expected_version(task_id)
+        if expected_version is None:
+            expected_version = self._version_of(task_id)
+        self.writes.enqueue(task_id, kwargs, expected_version)
+        
+        fields = dict(kwargs)
+        # La description va dans son cache, pas dans celui du tableau
+        if "description" in fields:
+            self.descriptions.put(task_id, fields.pop("description"))
+        # Version qu'aura la tâche une fois l'envoi écrit (un UPDATE par envoi)
+        if expected_version is not None:
+            fields["version"] = expected_version + 1
+        self._apply(self.repository.patch, [{"id": task_id, **fields}])
+            
+            
+    def _version_of(self, task_id):
+        """Version de la tâche connue du cache (None : écriture non conditionnée)."""
+        task = self.repository.get(task_id)
+        return task.get("version") if task is not None else None
         
     
     # =======================
     # Création de la tâche
     # =======================    
     def create_task_from_form(self, data):
-        create_task(**data)
-        self.reload_tasks()    
+        self._submit(create_task_record, on_result=self._on_task_saved, **data)
+        
+        
+    def _on_task_saved(self, task):
+        self.descriptions.put(task["id"], task["description"])
+        self._apply(self.repository.put, {**task, "description": None})
+        self.refresh_summary()
+        
+        
+    # =======================
+    # Opérations par lots
+    # =======================
+    def suppress_tasks(self, task_ids):
+        # Une seule transaction, puis mise à jour du cache
+        task_ids = list(task_ids)
+        self.writes.flush()
+        self._submit(
+            delete_tasks, task_ids,
+            on_result=lambda _: self._on_tasks_deleted(task_ids)
+        )
+        
+        
+    def edit_tasks(self, updates):
+        # updates : liste de dicts contenant chacun l'id de la tâche
+        updates = list(updates)
+        self.writes.flush()
+        self._submit(
+            update_tasks, updates,
+            on_result=lambda _: self._on_tasks_edited(updates)
+        )
+        
+        
+    def _on_tasks_edited(self, updates):
+        self.descriptions.discard([data["id"] for data in updates if "description" in data])
+        self._apply(self.repository.patch, [
+            {key: value for key, value in data.items() if key != "description"}
+            for data in updates
+        ])
+        self.refresh_summary()
+        
+        
+    def create_tasks_from_forms(self, data_list):
+        # Les ids créés ne sont pas relus : rechargement complet
+        self._submit(create_tasks, list(data_list), on_result=lambda _: self.refresh())
+        
         
-        
\ No newline at end of file
+    def _apply(self, change, *args):
+        """Applique une écriture confirmée au cache puis met l'affichage à jour."""
+        if self.repository.loaded:
+            change(*args)
+            self._update_view()
+        else:
+            self.refresh()
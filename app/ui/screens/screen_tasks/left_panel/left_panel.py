@@ -60,6 +60,18 @@ class ScreenTaskLeftPanel(BaseScreen):
         # Suppression de la tâche sélectionnée
         self.btn_delete = HoverButton("Supprimer une tâche")
         self.btn_delete.setObjectName("ActionButton")
+        
+        # Consultation et restauration des tâches archivées
+        self.btn_archive = HoverButton("Archives")
+        self.btn_archive.setObjectName("ActionButton")
+        
+        # Import de tâches (CSV, NDJSON)
+        self.btn_import = HoverButton("Importer")
+        self.btn_import.setObjectName("ActionButton")
+        
+        # Export des tâches (CSV, NDJSON, iCalendar)
+        self.btn_export = HoverButton("Exporter")
+        self.btn_export.setObjectName("ActionButton")
 
         
         # Ajout dans le layout
@@ -78,6 +90,15 @@ class ScreenTaskLeftPanel(BaseScreen):
         left_panel_layout.addWidget(self.btn_delete)
         left_panel_layout.addSpacing(15)
         
+        left_panel_layout.addWidget(self.btn_archive)
+        left_panel_layout.addSpacing(15)
+        
+        left_panel_layout.addWidget(self.btn_import)
+        left_panel_layout.addSpacing(15)
+        
+        left_panel_layout.addWidget(self.btn_export)
+        left_panel_layout.addSpacing(15)
+        
         left_panel_layout.addStretch(1)
         
         self.inner_layout.addLayout(left_panel_layout)
@@ -1,23 +1,42 @@
 # app/ui/screens/screen_tasks/screen_tasks.py
 
-from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QMessageBox
+from PyQt6.QtWidgets import QVBoxLayout, QHBoxLayout, QMessageBox, QFileDialog, QProgressDialog
 from PyQt6.QtCore import Qt, pyqtSignal
 
 # UI
 from app.ui.screens.base_screen import BaseScreen
 from app.ui.screens.screen_tasks.theme_board.theme_board import ThemeBoard
 
-from app.styles.style_manager import StyleManager
-from app.core.settings.theme_manager import ThemeManager
 from app.ui.screens.screen_tasks.left_panel.left_panel import ScreenTaskLeftPanel
-from app.ui.widgets.system.label import TitleLabel
+from app.ui.widgets.system.label import TitleLabel, SubtitleLabel
 from app.ui.widgets.system.separator import CustomSeparator
 
 from .controller import TasksController
+from app.database.export import ICAL_TODO, ICAL_EVENT
 from app.forms.task_form import TaskForm
+from app.ui.screens.screen_tasks.theme_board.task_description_dialog import TaskDescriptionDialog
+from app.ui.screens.screen_tasks.archive.archive_dialog import ArchiveDialog
 
 
 
+# Filtres du dialogue d'export : (extension, composant iCalendar)
+EXPORT_FILTERS = {
+    "CSV (*.csv)": (".csv", ICAL_TODO),
+    "CSV compressé (*.csv.gz)": (".csv.gz", ICAL_TODO),
+    "NDJSON (*.ndjson)": (".ndjson", ICAL_TODO),
+    "NDJSON compressé (*.ndjson.gz)": (".ndjson.gz", ICAL_TODO),
+    "iCalendar, tâches (*.ics)": (".ics", ICAL_TODO),
+    "iCalendar, échéances en événements (*.ics)": (".ics", ICAL_EVENT),
+}
+
+
+# Fichiers acceptés par l'import
+IMPORT_FILTER = "Tâches (*.csv *.csv.gz *.ndjson *.ndjson.gz *.jsonl *.jsonl.gz)"
+
+# Erreurs d'import détaillées dans le bilan affiché
+IMPORT_ERRORS_SHOWN = 10
+
+
 class ScreenTasks(BaseScreen):
     """
     Screen principal pour gérer les tâches :
@@ -35,15 +54,15 @@ class ScreenTasks(BaseScreen):
         self.setObjectName("ScreenTasks")
         
         self.selected_task = None
+        # Tâche dont le formulaire attend la description
+        self._edit_pending = None
+        # Progression de l'export en cours
+        self._export_dialog = None
+        # Progression de l'import en cours
+        self._import_dialog = None
         
         self._build_ui()
         self._init_controller()
-        
-        # Application du style
-        self.apply_theme()
-          
-        # Mise à jour dynamique
-        ThemeManager.get_instance().theme_changed.connect(self.apply_theme)
 
      
     # =======================
@@ -65,6 +84,9 @@ class ScreenTasks(BaseScreen):
         self.left_panel.btn_add.clicked.connect(self.open_task_form)
         self.left_panel.btn_edit.clicked.connect(self.edit_selected_task)
         self.left_panel.btn_delete.clicked.connect(self.delete_selected_task)
+        self.left_panel.btn_archive.clicked.connect(self.open_archive)
+        self.left_panel.btn_export.clicked.connect(self.export_tasks)
+        self.left_panel.btn_import.clicked.connect(self.import_tasks)
         
         # Colonne droite
         self.right_panel = QVBoxLayout()
@@ -77,6 +99,11 @@ class ScreenTasks(BaseScreen):
         self.right_panel.addWidget(separator)
         self.right_panel.addSpacing(10)
         
+        # État de chargement (accès base en arrière-plan)
+        self.loading_label = SubtitleLabel("Chargement…")
+        self.loading_label.setVisible(False)
+        self.right_panel.addWidget(self.loading_label)
+        
         
         # Insertion du tableau des thèmes 
         self.theme_board = ThemeBoard()
@@ -98,27 +125,32 @@ class ScreenTasks(BaseScreen):
             search_input=self.left_panel.search_input
         )
         self.controller.task_selected.connect(self._on_task_selected)
+        self.controller.loading_changed.connect(self.loading_label.setVisible)
+        self.controller.error_occurred.connect(self._on_database_error)
+        self.controller.description_loaded.connect(self._on_description_loaded)
+        self.controller.export_progress.connect(self._on_export_progress)
+        self.controller.export_finished.connect(self._on_export_finished)
+        self.controller.export_failed.connect(self._on_export_failed)
+        self.controller.import_progress.connect(self._on_import_progress)
+        self.controller.import_finished.connect(self._on_import_finished)
+        self.controller.import_failed.connect(self._on_import_failed)
+        
+        # Chargement de la page suivante en bas de défilement
+        self.scroll_area.verticalScrollBar().valueChanged.connect(self._on_scrolled)
         
         # Premier chargement
         self.controller.reload_tasks()    
         
         
-    # =======================
-    # Styles
-    # =======================    
-    def apply_theme(self):
-        self.setStyleSheet(f"""
-            ScreenTasks {{
-                font-size: {StyleManager.get_scaled_font('FONT_SIZE_SETTING')};
-                background-color: {StyleManager.get('MAIN_BG_COLOR')};
-                border-radius: {StyleManager.get('BORDER_RADIUS')};
-            }}
-        """)    
-    
-    
     # =======================
     # UI handlers
     # =======================
+    # Retour sur l'écran : tâches modifiées hors de l'application ?
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.controller.check_for_changes()
+        
+        
     # Sélection d'une carte
     def _on_task_selected(self, task_data):
         self.selected_task = task_data
@@ -126,6 +158,26 @@ class ScreenTasks(BaseScreen):
         self.left_panel.btn_delete.setEnabled(True)
         self.task_selected.emit(task_data)
         
+        # Description chargée à la demande (cache ou base)
+        dialog = TaskDescriptionDialog(task_data, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        self.controller.description_loaded.connect(dialog.on_description_loaded)
+        self.controller.request_description(task_data["id"])
+        dialog.exec()
+        self.controller.description_loaded.disconnect(dialog.on_description_loaded)
+        
+        
+    # Erreur d'accès à la base
+    def _on_database_error(self, message):
+        QMessageBox.warning(self, "Erreur", message)
+        
+        
+    # Fin de défilement : pages suivantes
+    def _on_scrolled(self, value):
+        scrollbar = self.scroll_area.verticalScrollBar()
+        if scrollbar.maximum() > 0 and value >= scrollbar.maximum() - 50:
+            self.controller.load_more_all()
+        
         
     # Ajout de la modification
     def update_task_selection(self, tasks):
@@ -151,12 +203,121 @@ class ScreenTasks(BaseScreen):
     def edit_selected_task(self):
         if not self.selected_task:
             return
-        form = TaskForm(task_data=self.selected_task)
+        # Le formulaire s'ouvre à réception de la description
+        self._edit_pending = self.selected_task["id"]
+        self.controller.request_description(self._edit_pending)
+        
+        
+    def _on_description_loaded(self, task_id, description):
+        if task_id != self._edit_pending or not self.selected_task:
+            return
+        self._edit_pending = None
+        form = TaskForm(task_data={**self.selected_task, "description": description})
         form.task_saved.connect(lambda data: self.controller.edit_task(data.pop("id"), **data))
         form.setModal(True)
         form.exec() 
       
         
+    # Archives : consultation et restauration
+    def open_archive(self):
+        dialog = ArchiveDialog(self.controller, self)
+        dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        dialog.exec()
+        
+        
+    # Export : fichier choisi, écrit en arrière-plan
+    def export_tasks(self):
+        path, selected = QFileDialog.getSaveFileName(
+            self, "Exporter les tâches", "taches.csv", ";;".join(EXPORT_FILTERS)
+        )
+        if not path:
+            return
+        extension, ical_component = EXPORT_FILTERS.get(selected, (".csv", ICAL_TODO))
+        if not path.lower().endswith(extension):
+            path += extension
+        
+        self._export_dialog = QProgressDialog("Export des tâches…", "Annuler", 0, 0, self)
+        self._export_dialog.setWindowTitle("Export")
+        self._export_dialog.setMinimumDuration(0)
+        self._export_dialog.canceled.connect(self.controller.cancel_export)
+        self._export_dialog.show()
+        self.controller.export_to(path, ical_component)
+        
+        
+    def _on_export_progress(self, done, total):
+        if self._export_dialog is not None:
+            self._export_dialog.setMaximum(total)
+            self._export_dialog.setValue(done)
+            
+            
+    def _close_export_dialog(self):
+        if self._export_dialog is not None:
+            self._export_dialog.canceled.disconnect(self.controller.cancel_export)
+            self._export_dialog.close()
+            self._export_dialog.deleteLater()
+            self._export_dialog = None
+            
+            
+    def _on_export_finished(self, count, path):
+        self._close_export_dialog()
+        QMessageBox.information(self, "Export", f"{count} tâche(s) exportée(s) dans {path}")
+        
+        
+    def _on_export_failed(self, message):
+        cancelled = self._export_dialog is None or self._export_dialog.wasCanceled()
+        self._close_export_dialog()
+        if not cancelled:
+            QMessageBox.warning(self, "Erreur", message)
+        
+        
+    # Import : fichier choisi, écrit par lots en arrière-plan
+    def import_tasks(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Importer des tâches", "", IMPORT_FILTER)
+        if not path:
+            return
+        
+        # Nombre de lignes inconnu : indicateur d'activité
+        self._import_dialog = QProgressDialog("Import des tâches…", "Arrêter", 0, 0, self)
+        self._import_dialog.setWindowTitle("Import")
+        self._import_dialog.setMinimumDuration(0)
+        self._import_dialog.canceled.connect(self.controller.cancel_import)
+        self._import_dialog.show()
+        self.controller.import_from(path)
+        
+        
+    def _on_import_progress(self, processed):
+        if self._import_dialog is not None:
+            self._import_dialog.setLabelText(f"Import des tâches… {processed} ligne(s) traitée(s)")
+            
+            
+    def _close_import_dialog(self):
+        if self._import_dialog is not None:
+            self._import_dialog.canceled.disconnect(self.controller.cancel_import)
+            self._import_dialog.close()
+            self._import_dialog.deleteLater()
+            self._import_dialog = None
+            
+            
+    def _on_import_finished(self, report):
+        self._close_import_dialog()
+        message = f"{report.imported} tâche(s) importée(s)."
+        if report.failed:
+            details = "\n".join(
+                f"Ligne {error.line} : {error.message}" for error in report.errors[:IMPORT_ERRORS_SHOWN]
+            )
+            message += f"\n{report.failed} ligne(s) ignorée(s) :\n{details}"
+            if report.failed > IMPORT_ERRORS_SHOWN:
+                message += "\n…"
+            QMessageBox.warning(self, "Import", message)
+        else:
+            QMessageBox.information(self, "Import", message)
+            
+            
+    def _on_import_failed(self, message):
+        self._close_import_dialog()
+        QMessageBox.warning(self, "Erreur", message)
+        
+        
     # Message de confirmation
     def delete_selected_task(self):
         if not self.selected_task:
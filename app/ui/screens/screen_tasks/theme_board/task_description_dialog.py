@@ -7,7 +7,6 @@ from PyQt6.QtCore import Qt
 from app.ui.widgets.system.label import CustomLabel
 from app.ui.widgets.system.hover_button import HoverButton
 
-from app.styles.style_manager import StyleManager
 
 class TaskDescriptionDialog(QDialog):
     
@@ -15,11 +14,17 @@ class TaskDescriptionDialog(QDialog):
         """
         Dialogue affichant la description d'une tâche.
         Supporte les descriptions longues avec scroll automatique.
+        
+        La description n'est pas chargée avec le tableau : tant qu'elle
+        vaut None, un message d'attente est affiché jusqu'à
+        `set_description()`.
         """
         super().__init__(parent)
         
         self.setObjectName("TaskDescriptionDialog")
         
+        self.task_id = task_data.get("id")
+        
         self.setWindowTitle(task_data.get("title", "Tâche"))
         self.setMinimumWidth(300)
         self.setMaximumWidth(500)
@@ -42,11 +47,14 @@ class TaskDescriptionDialog(QDialog):
         scroll_layout.setSpacing(0)
     
         # Description    
-        desc_label = CustomLabel(task_data.get("description", "Aucune description"))
-        desc_label.setObjectName("DescLabel")
-        desc_label.setWordWrap(True)
-        desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        scroll_layout.addWidget(desc_label)
+        self.desc_label = CustomLabel("Chargement…")
+        self.desc_label.setObjectName("DescLabel")
+        self.desc_label.setWordWrap(True)
+        self.desc_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        scroll_layout.addWidget(self.desc_label)
+        
+        if task_data.get("description") is not None:
+            self.set_description(task_data["description"])
         
         # Bouton fermer
         close_btn = HoverButton("Fermer")
@@ -59,23 +67,12 @@ class TaskDescriptionDialog(QDialog):
         
         desc_layout.addLayout(btn_layout)
         
-        # Appliquer le thème
-        self.apply_theme()
         
+    def set_description(self, description):
+        self.desc_label.setText(description or "Aucune description")
         
-    def apply_theme(self):
-        # Style de la fenêtre de decription
-        self.setStyleSheet(f"""
-            TaskDescriptionDialog {{
-                font-size: {StyleManager.get_scaled_font('FONT_SIZE_SETTING')};
-                color: {StyleManager.get('TEXT_COLOR_1')};
-                background-color: {StyleManager.get('MAIN_BG_COLOR')};
-            }}
-
-            #DescLabel {{
-                background-color: {StyleManager.get('THEME_BG_COLOR')};
-                padding: 8px;              
-            }}
-        """)
         
-        
\ No newline at end of file
+    # Réponse du controller (filtrée : une seule tâche par dialogue)
+    def on_description_loaded(self, task_id, description):
+        if task_id == self.task_id:
+            self.set_description(description)
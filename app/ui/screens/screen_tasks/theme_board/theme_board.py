@@ -9,11 +9,17 @@ from app.ui.screens.screen_tasks.theme_column.theme_column import ThemeColumn
 class ThemeBoard(QWidget):
     """
     Conteneur principal qui organise toutes les colonnes de thèmes.
+
+    Un rechargement est réconcilié avec l'existant : chaque colonne ne
+    signale à sa vue que les tâches ajoutées, modifiées, déplacées ou
+    retirées, et les colonnes ne sont créées ou retirées qu'à
+    l'apparition ou la disparition de leur thème.
     """
     
         
     # Signal pour le controller
-    task_clicked = pyqtSignal(dict, object)
+    task_clicked = pyqtSignal(dict)
+    load_more_requested = pyqtSignal(str)
 
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -23,6 +29,8 @@ class ThemeBoard(QWidget):
         
         # Déclaration du dictionnaire des thèmes
         self.theme_columns = {}
+        # Comptes par thème (get_board_summary), appliqués aussi aux colonnes créées ensuite
+        self.summary = {}
 
     #-------------------
     # Methodes Utilisateur
@@ -37,24 +45,78 @@ class ThemeBoard(QWidget):
             
         self.theme_columns.clear()
         
+        
+    def set_board(self, board):
+        """
+        Affiche un tableau complet en réconciliant avec les colonnes existantes.
+
+        Args:
+            board (list): Pour chaque thème, dans l'ordre d'affichage :
+                (thème, tâches sérialisées, curseur de la page suivante)
+        """
+        themes = set()
+        for position, (theme_name, tasks, cursor) in enumerate(board):
+            themes.add(theme_name)
+            column = self._get_or_create_column(theme_name)
+            self._place_column(column, position)
+            column.set_tasks(tasks)
+            column.set_has_more(cursor is not None)
+            
+        # Thèmes disparus
+        for theme_name in [name for name in self.theme_columns if name not in themes]:
+            column = self.theme_columns.pop(theme_name)
+            self.ui.theme_layout.removeWidget(column)
+            column.deleteLater()
+        
+    
+    def set_summary(self, summary):
+        """
+        Affiche les comptes de chaque colonne.
+
+        Args:
+            summary (dict): ThemeSummary par thème (voir get_board_summary)
+        """
+        self.summary = summary
+        for theme_name, column in self.theme_columns.items():
+            column.set_summary(summary.get(theme_name))
+        
     
     def _get_or_create_column(self, theme_name: str):
         if theme_name not in self.theme_columns:
             col = ThemeColumn(theme_name)
+            col.task_clicked.connect(self.task_clicked)
+            col.load_more_requested.connect(self.load_more_requested)
+            col.set_summary(self.summary.get(theme_name))
             self.theme_columns[theme_name] = col
             self.ui.theme_layout.addWidget(col)
             
         return self.theme_columns[theme_name]
     
     
-    def add_task_to_theme(self, theme_name: str, task_data: dict):
+    def _place_column(self, column: ThemeColumn, index: int):
+        layout = self.ui.theme_layout
+        if layout.indexOf(column) != index:
+            layout.removeWidget(column)
+            layout.insertWidget(index, column)
+    
+    
+    def append_tasks(self, theme_name: str, tasks):
+        """Ajoute une page de tâches à la colonne d'un thème."""
+        self._get_or_create_column(theme_name).append_tasks(tasks)
+        
+        
+    def select_task(self, task_id):
+        """Sélectionne une tâche sur tout le tableau (None : aucune)."""
+        for column in self.theme_columns.values():
+            column.select_task(task_id if column.model.row_of(task_id) >= 0 else None)
+    
+    
+    def set_has_more(self, theme_name: str, has_more: bool):
+        """Indique si la colonne d'un thème a encore des tâches à charger."""
         column = self._get_or_create_column(theme_name)
-        card = column.add_task(task_data)
-
-        # Connexion clic -> ThemeBoard
-        card.clicked.connect(
-            lambda data=task_data, card_widget=card:
-                self.task_clicked.emit(data, card_widget)
-        )
+        column.set_has_more(has_more)
         
-        
\ No newline at end of file
+    
+    def columns_with_more(self):
+        """Thèmes dont la colonne n'est pas entièrement chargée."""
+        return [name for name, column in self.theme_columns.items() if column.has_more]
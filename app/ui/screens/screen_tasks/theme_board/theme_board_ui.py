@@ -4,8 +4,6 @@ from PyQt6.QtWidgets import QWidget, QHBoxLayout, QBoxLayout
 
 from PyQt6.QtCore import Qt
 
-from app.styles.style_manager import StyleManager
-from app.core.settings.theme_manager import ThemeManager
 
 
 
@@ -19,10 +17,6 @@ class ThemeBoardUI(QWidget):
         self.setObjectName("ThemeBoardUI")
         
         self._build_ui() 
-        
-        self.apply_theme()
-        
-        ThemeManager.get_instance().theme_changed.connect(self.apply_theme)
     
         
     def _build_ui(self):
@@ -34,15 +28,3 @@ class ThemeBoardUI(QWidget):
         
         self.setLayout(self.theme_layout)
         
-                
-    def apply_theme(self):
-        self.setStyleSheet(f"""
-            QWidget#ThemeBoardUI {{
-                font-size: {StyleManager.get_scaled_font("FONT_SIZE_SETTING")};
-                background-color: {StyleManager.get('THEME_BG_COLOR')};
-                border-radius: {StyleManager.get('BORDER_RADIUS')};
-                border: 1px solid #000000;
-            }}                   
-        """) 
-        
-        
\ No newline at end of file
@@ -0,0 +1,123 @@
+# app/ui/screens/screen_tasks/theme_column/task_list_model.py
+
+from PyQt6.QtCore import QAbstractListModel, QModelIndex, Qt
+
+
+class TaskListModel(QAbstractListModel):
+    """
+    Modèle des tâches d'une colonne (dictionnaires sérialisés).
+
+    - `set_tasks` réconcilie par id de tâche : seules les lignes ajoutées,
+      modifiées, déplacées ou retirées sont signalées à la vue
+    - `append_tasks` ajoute une page en bas de colonne
+    """
+
+    TaskRole = Qt.ItemDataRole.UserRole + 1
+
+    # Au-delà de ce nombre d'insertions et déplacements (ex : changement
+    # de tri), une remise à zéro coûte moins cher que les signaux un à un
+    MAX_STEPS = 50
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._tasks = []
+
+
+    #-------------------
+    # API Qt
+    #-------------------
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._tasks)
+
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self._tasks):
+            return None
+        task = self._tasks[index.row()]
+        if role == self.TaskRole:
+            return task
+        if role == Qt.ItemDataRole.DisplayRole:
+            return task.get("title")
+        return None
+
+
+    #-------------------
+    # Methodes Utilisateur
+    #-------------------
+    @property
+    def tasks(self):
+        return list(self._tasks)
+
+
+    def task_at(self, row: int) -> dict:
+        return self._tasks[row]
+
+
+    def row_of(self, task_id: int) -> int:
+        """Ligne d'une tâche, ou -1 si elle n'est pas dans la colonne."""
+        for row, task in enumerate(self._tasks):
+            if task["id"] == task_id:
+                return row
+        return -1
+
+
+    def append_tasks(self, tasks):
+        if not tasks:
+            return
+        first = len(self._tasks)
+        self.beginInsertRows(QModelIndex(), first, first + len(tasks) - 1)
+        self._tasks.extend(tasks)
+        self.endInsertRows()
+
+
+    def set_tasks(self, tasks):
+        """Remplace le contenu de la colonne en réconciliant par id."""
+        new_ids = {task["id"] for task in tasks}
+
+        old_ids = [task["id"] for task in self._tasks if task["id"] in new_ids]
+        kept = set(old_ids)
+        target_ids = [task["id"] for task in tasks if task["id"] in kept]
+        moves = sum(1 for old, new in zip(old_ids, target_ids) if old != new)
+        steps = moves + len(tasks) - len(old_ids)
+
+        # Colonne vide, contenu sans rapport ou réordonné : remise à zéro
+        if not old_ids or steps > self.MAX_STEPS:
+            self.beginResetModel()
+            self._tasks = list(tasks)
+            self.endResetModel()
+            return
+
+        # 1. Retrait des tâches disparues, par blocs contigus (du bas vers le haut)
+        row = len(self._tasks) - 1
+        while row >= 0:
+            if self._tasks[row]["id"] in new_ids:
+                row -= 1
+                continue
+            last = row
+            while row >= 0 and self._tasks[row]["id"] not in new_ids:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._tasks[row + 1:last + 1]
+            self.endRemoveRows()
+
+        # 2. Insertions, déplacements et modifications, dans l'ordre cible
+        for target, task in enumerate(tasks):
+            if target < len(self._tasks) and self._tasks[target]["id"] == task["id"]:
+                if self._tasks[target] != task:
+                    self._tasks[target] = task
+                    index = self.index(target)
+                    self.dataChanged.emit(index, index)
+                continue
+
+            source = self.row_of(task["id"])
+            if source > target:
+                self.beginMoveRows(QModelIndex(), source, source, QModelIndex(), target)
+                del self._tasks[source]
+                self._tasks.insert(target, task)
+                self.endMoveRows()
+                index = self.index(target)
+                self.dataChanged.emit(index, index)
+            else:
+                self.beginInsertRows(QModelIndex(), target, target)
+                self._tasks.insert(target, task)
+                self.endInsertRows()
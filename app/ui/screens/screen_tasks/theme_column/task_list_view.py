@@ -0,0 +1,130 @@
+# app/ui/screens/screen_tasks/theme_column/task_list_view.py
+
+from PyQt6.QtWidgets import QListView, QAbstractItemView, QFrame, QSizePolicy
+from PyQt6.QtCore import Qt, QEasingCurve, QVariantAnimation, QItemSelectionModel, pyqtSignal
+
+from app.core.settings.theme_manager import ThemeManager
+from app.ui.screens.screen_tasks.theme_column.task_list_model import TaskListModel
+from app.ui.widgets.main_widgets.task_card.task_card_delegate import TaskCardDelegate
+
+
+class TaskListView(QListView):
+    """
+    Liste des cartes d'une colonne (Model/View).
+
+    - Cartes dessinées par TaskCardDelegate : aucun widget par tâche
+    - Hauteur ajustée au contenu, dans la limite de MAX_HEIGHT
+      (au-delà, défilement interne)
+    - Émet `bottom_reached` en fin de défilement
+    """
+
+    # Espacement entre les cartes et hauteur maximale de la liste
+    CARD_SPACING = 20
+    MAX_HEIGHT = 640
+
+    bottom_reached = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setObjectName("TaskListView")
+
+        self.task_model = TaskListModel(self)
+        self.delegate = TaskCardDelegate(self)
+        self.setModel(self.task_model)
+        self.setItemDelegate(self.delegate)
+
+        # Toutes les cartes ont la même hauteur : pas de mesure ligne par ligne
+        self.setUniformItemSizes(True)
+        self.setSpacing(self.CARD_SPACING // 2)
+        self.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.setMouseTracking(True)
+        self.setFrameShape(QFrame.Shape.NoFrame)
+        self.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+
+        # Overlay de sélection : une seule animation pour la colonne
+        self._selected_id = None
+        self._previous_id = None
+        self._fade = QVariantAnimation(self)
+        self._fade.setDuration(160)
+        self._fade.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self._fade.setStartValue(0.0)
+        self._fade.setEndValue(1.0)
+        self._fade.valueChanged.connect(self._on_fade)
+
+        # Connexions
+        self.verticalScrollBar().valueChanged.connect(self._on_scrolled)
+        self.task_model.modelReset.connect(self._on_reset)
+        self.task_model.rowsInserted.connect(self._update_height)
+        self.task_model.rowsRemoved.connect(self._update_height)
+        ThemeManager.get_instance().theme_changed.connect(self.apply_theme)
+
+        self._update_height()
+
+
+    #-------------------
+    # Methodes Utilisateur
+    #-------------------
+    def select_task(self, task_id):
+        """Sélectionne une tâche (None : aucune), avec l'animation de l'overlay."""
+        if task_id != self._selected_id:
+            self._previous_id = self._selected_id
+            self._selected_id = task_id
+            self._fade.stop()
+            self._fade.start()
+        self._apply_selection()
+
+
+    def apply_theme(self):
+        self.delegate.refresh_style()
+        self.scheduleDelayedItemsLayout()
+        self._update_height()
+        self.viewport().update()
+
+
+    #-------------------
+    # Interne
+    #-------------------
+    def _apply_selection(self):
+        row = -1 if self._selected_id is None else self.task_model.row_of(self._selected_id)
+        if row < 0:
+            self.selectionModel().clearSelection()
+        else:
+            self.selectionModel().setCurrentIndex(
+                self.task_model.index(row),
+                QItemSelectionModel.SelectionFlag.ClearAndSelect
+            )
+
+
+    def _on_fade(self, value):
+        overlay = {}
+        if self._previous_id is not None and value < 1.0:
+            overlay[self._previous_id] = 1.0 - value
+        if self._selected_id is not None:
+            overlay[self._selected_id] = value
+        self.delegate.overlay = overlay
+        self.viewport().update()
+
+
+    def _on_reset(self):
+        # La sélection ne survit pas à une remise à zéro du modèle
+        if self._selected_id is not None:
+            self._apply_selection()
+        self._update_height()
+
+
+    def _on_scrolled(self, value):
+        scrollbar = self.verticalScrollBar()
+        if scrollbar.maximum() > 0 and value >= scrollbar.maximum() - 50:
+            self.bottom_reached.emit()
+
+
+    def _update_height(self):
+        """Hauteur des cartes présentes, plafonnée à MAX_HEIGHT."""
+        rows = self.task_model.rowCount()
+        if rows:
+            row_height = self.sizeHintForRow(0) + self.spacing() * 2
+        else:
+            row_height = 0
+        self.setFixedHeight(min(rows * row_height, self.MAX_HEIGHT))
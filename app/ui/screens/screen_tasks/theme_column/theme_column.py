@@ -1,27 +1,40 @@
 # app/ui/screens/screen_task/theme_column/theme_column_ui.py
 
 from PyQt6.QtWidgets import QWidget, QVBoxLayout
+from PyQt6.QtCore import pyqtSignal
 
 from app.ui.screens.screen_tasks.theme_column.theme_column_ui import ThemeColumnUI
 
-from app.ui.widgets.main_widgets.task_card.task_card import TaskCard
-
 
 class ThemeColumn(QWidget):
     """
     Colonne d'un thème :
     - Titre du thème
-    - Cartes associées
+    - Comptes du thème (total, ouvertes, en retard), indépendants des
+      pages chargées
+    - Cartes associées (TaskListView)
+    - Bouton de chargement de la page suivante
     """
     
+    # Clic sur une carte (données de la tâche)
+    task_clicked = pyqtSignal(dict)
+    # Demande de la page suivante (nom du thème)
+    load_more_requested = pyqtSignal(str)
+    
     def __init__(self, theme_name: str, parent=None):
         super().__init__(parent)
         
         self.theme_name = theme_name
         
         self.ui = ThemeColumnUI(theme_name)
+        self.view = self.ui.task_view
+        self.model = self.view.task_model
         
-        self.tasks = []
+        self.has_more = False
+        
+        self.ui.btn_load_more.clicked.connect(self._request_more)
+        self.view.bottom_reached.connect(self._request_more)
+        self.view.clicked.connect(self._on_clicked)
         
         layout = QVBoxLayout()
         layout.addWidget(self.ui)
@@ -32,11 +45,55 @@ class ThemeColumn(QWidget):
     #-------------------
     # Methodes Utilisateur
     #-------------------   
-    def add_task(self, task_data: dict):
-        card = TaskCard(task_data)
-        self.tasks.append(card)
+    @property
+    def tasks(self):
+        """Tâches affichées, dans l'ordre de la colonne."""
+        return self.model.tasks
+    
+    
+    def set_tasks(self, tasks):
+        """Remplace les tâches affichées (réconciliation par id)."""
+        self.model.set_tasks(tasks)
+        
+        
+    def append_tasks(self, tasks):
+        """Ajoute une page de tâches en bas de la colonne."""
+        self.model.append_tasks(tasks)
+        
         
-        self.ui.tasks_layout.addWidget(card)
+    def select_task(self, task_id):
+        """Sélectionne une tâche de la colonne (None : aucune)."""
+        self.view.select_task(task_id)
+    
+    
+    def set_summary(self, summary):
+        """Affiche les comptes du thème (ThemeSummary, None : masqués)."""
+        if summary is None:
+            self.ui.theme_counts.setVisible(False)
+            return
+        text = f"{summary.total} tâche(s) · {summary.open} ouverte(s)"
+        if summary.overdue:
+            text += f" · {summary.overdue} en retard"
+        self.ui.theme_counts.setText(text)
+        self.ui.theme_counts.setVisible(True)
+        
+        
+    def set_has_more(self, has_more: bool):
+        """Affiche ou masque le bouton "Afficher plus"."""
+        self.has_more = has_more
+        self.ui.btn_load_more.setVisible(has_more)
+        
+        
+    #-------------------
+    # Interne
+    #-------------------
+    def _request_more(self):
+        if self.has_more:
+            self.load_more_requested.emit(self.theme_name)
+            
+            
+    def _on_clicked(self, index):
+        task_data = self.model.task_at(index.row())
         
-        return card
-        
\ No newline at end of file
+        # La description (chargée à la demande) est affichée par le screen
+        self.task_clicked.emit(task_data)
@@ -3,14 +3,14 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
 from PyQt6.QtCore import Qt
 
-from app.ui.widgets.system.label import ThemeTitleLabel
+from app.ui.widgets.system.label import ThemeTitleLabel, SubtitleLabel
+from app.ui.widgets.system.hover_button import HoverButton
+from app.ui.screens.screen_tasks.theme_column.task_list_view import TaskListView
 
-from app.styles.style_manager import StyleManager
-from app.core.settings.theme_manager import ThemeManager
 
 class ThemeColumnUI(QWidget):
     """
-    Layout vertical avec bordure + titre.
+    Layout vertical avec bordure + titre et comptes du thème.
     
     """
     
@@ -21,9 +21,6 @@ class ThemeColumnUI(QWidget):
         
         
         self.build_ui()
-        self.apply_theme()
-        
-        ThemeManager.get_instance().theme_changed.connect(self.apply_theme)
         
         
     def build_ui(self):
@@ -41,23 +38,19 @@ class ThemeColumnUI(QWidget):
         self.theme_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self.theme_column_layout.addWidget(self.theme_title)
         
-        # Layout des cartes
-        self.tasks_layout = QVBoxLayout()
-        self.tasks_layout.setSpacing(20)
-        self.theme_column_layout.addLayout(self.tasks_layout)   
+        # Comptes du thème (masqués tant qu'ils ne sont pas connus)
+        self.theme_counts = SubtitleLabel()
+        self.theme_counts.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.theme_counts.setVisible(False)
+        self.theme_column_layout.addWidget(self.theme_counts)
         
-        self.setLayout(self.theme_column_layout)
+        # Liste des cartes (Model/View)
+        self.task_view = TaskListView()
+        self.theme_column_layout.addWidget(self.task_view)
         
-    
-    
-    def apply_theme(self):
-        self.setStyleSheet(f"""
-            #ThemeColumn {{
-                font-size: {StyleManager.get_scaled_font("FONT_SIZE_SETTING")};
-                background-color: {StyleManager.get('THEME_BG_COLOR')};
-                border-radius: {StyleManager.get('BORDER_RADIUS')};
-                border: 1px solid #000000;
-            }}                   
-        """) 
-        
-        
\ No newline at end of file
+        # Chargement de la page suivante
+        self.btn_load_more = HoverButton("Afficher plus")
+        self.btn_load_more.setVisible(False)
+        self.theme_column_layout.addWidget(self.btn_load_more, 0, Qt.AlignmentFlag.AlignHCenter)
+        
+        self.setLayout(self.theme_column_layout)
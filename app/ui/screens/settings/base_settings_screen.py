@@ -7,8 +7,6 @@ from app.ui.widgets.settings_widgets.notification_widget import CustomMessage
 from app.ui.screens.base_screen import BaseScreen
 from app.ui.widgets.system.hover_button import HoverButton
 
-from app.styles.style_manager import StyleManager
-
 
 class BaseSettingsScreen(BaseScreen):
     """
@@ -29,9 +27,6 @@ class BaseSettingsScreen(BaseScreen):
             height=40
         )
         
-        # Application du style
-        self.apply_theme()
-        
         # Connexion pour sauver les paramètres
         self.save_btn.clicked.connect(self.save_all_sections)
         
@@ -40,15 +35,6 @@ class BaseSettingsScreen(BaseScreen):
 
     
     
-    # Méthode pour appliquer les styles
-    def apply_theme(self):
-        self.setStyleSheet(f"""
-            font-size: {StyleManager.get_scaled_font('FONT_SIZE_SETTING')};
-            background-color: {StyleManager.get('MAIN_BG_COLOR')};
-            border-radius: {StyleManager.get('BORDER_RADIUS')};
-        """) 
-    
-    
     # Ajouter une section
     def add_section(self, section_widget: QWidget):
         self.inner_layout.insertWidget(self.inner_layout.count() - 1, section_widget)
@@ -17,7 +17,6 @@ class AppearanceSection(QWidget):
         super().__init__()
         
         self.logic = AppearanceLogic()
-        self.setStyleSheet("background: transparent;")
 
         self.main_layout = QVBoxLayout(self)
         self.main_layout.setContentsMargins(30, 10, 30, 20)
@@ -11,7 +11,6 @@ class MusicSection(QWidget):
         super().__init__()
         
         self.music_widget = MusicWidget()
-        self.setStyleSheet("background: transparent;")
         
         self.main_layout = QVBoxLayout()
         self.main_layout.setContentsMargins(30, 10, 30, 20)
@@ -21,7 +21,6 @@ class UserSection(QWidget):
     def __init__(self):
         super().__init__()
         self.logic = UserLogic()
-        self.setStyleSheet("background: transparent;")
 
         self.main_layout = QVBoxLayout()
         self.main_layout.setContentsMargins(30, 10, 30, 20)
@@ -0,0 +1,137 @@
+# app/ui/widgets/main_widgets/task_card/task_card_delegate.py
+
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle
+from PyQt6.QtGui import QPainter, QColor, QFont, QFontMetrics
+from PyQt6.QtCore import Qt, QRectF, QSize, QMargins
+
+from app.styles.style_manager import StyleManager
+from app.ui.screens.screen_tasks.theme_column.task_list_model import TaskListModel
+
+from .priority_badge import get_priority_color
+
+
+class TaskCardDelegate(QStyledItemDelegate):
+    """
+    Dessine chaque tâche d'une colonne sous forme de carte, sans
+    widget : fond arrondi, titre / statut / priorité, badge de
+    priorité et overlay de sélection.
+
+    Seules les lignes visibles sont dessinées. La carte n'a pas de règle
+    dans la feuille de style : police, rayon et couleurs (palette de
+    dessin) sont lus dans le StyleManager par `refresh_style()`, rappelée
+    lors d'un changement de thème.
+    """
+
+    # Marges et interligne des labels d'une carte
+    PADDING = QMargins(30, 10, 20, 10)
+    LINE_SPACING = 3
+
+    # Badge priorité
+    BADGE_RADIUS = 10
+    BADGE_MARGIN = 8
+
+    # Overlay de sélection
+    GLOW_COLOR = QColor(94, 160, 255)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+
+        # Opacité de l'overlay par id de tâche (animée par la vue)
+        self.overlay = {}
+
+        self.refresh_style()
+
+
+    def refresh_style(self):
+        """Relit police, rayon et palette de la carte depuis le StyleManager."""
+        family = StyleManager.get("FONT_FAMILY").split(",")[0].strip()
+        self._font = QFont(family)
+        self._font.setPixelSize(int(StyleManager.get_scaled_font("FONT_SIZE_SETTING").replace("px", "")))
+        self._font.setWeight(QFont.Weight(int(StyleManager.get("FONT_WEIGHT_SEMIBOLD"))))
+        self._metrics = QFontMetrics(self._font)
+        self._radius = int(str(StyleManager.get("BORDER_RADIUS")).replace("px", ""))
+
+        # Palette de dessin : fond (normal, survol, sélection) et texte
+        self._background = QColor(StyleManager.get("CARD_BG_COLOR"))
+        self._background_hover = QColor(StyleManager.get("CARD_BG_COLOR_HOVER"))
+        self._background_selected = QColor(StyleManager.get("CARD_BG_COLOR_SELECTED"))
+        self._text_color = QColor(StyleManager.get("TEXT_COLOR_1"))
+
+
+    # ---------------------------
+    # Taille
+    # ---------------------------
+    def sizeHint(self, option, index):
+        height = (
+            self.PADDING.top() + self.PADDING.bottom()
+            + 3 * self._metrics.height() + 2 * self.LINE_SPACING
+        )
+        return QSize(option.rect.width(), height)
+
+
+    # ---------------------------
+    # Paint
+    # ---------------------------
+    def paint(self, painter, option, index):
+        task = index.data(TaskListModel.TaskRole)
+        if task is None:
+            return
+
+        rect = QRectF(option.rect)
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setPen(Qt.PenStyle.NoPen)
+
+        # Fond de carte
+        if selected:
+            background = self._background_selected
+        elif hovered:
+            background = self._background_hover
+        else:
+            background = self._background
+        painter.setBrush(background)
+        painter.drawRoundedRect(rect, self._radius, self._radius)
+
+        # Overlay animé
+        opacity = self.overlay.get(task["id"], 0.0)
+        if opacity > 0:
+            glow_color = QColor(self.GLOW_COLOR)
+            glow_color.setAlphaF(opacity * 0.8)
+            painter.setBrush(glow_color)
+            painter.drawRoundedRect(rect, 12, 12)
+
+        # Labels
+        painter.setFont(self._font)
+        painter.setPen(self._text_color)
+        text_rect = rect.toRect().marginsRemoved(self.PADDING)
+        text_width = text_rect.width() - (self.BADGE_RADIUS * 2 + self.BADGE_MARGIN)
+        line_height = self._metrics.height()
+        lines = (
+            f"Titre : {task.get('title') or 'Sans titre'}",
+            f"Statut : {task.get('status') or 'Inconnu'}",
+            f"Priorité : {task.get('priority') or 'moyenne'}",
+        )
+        for position, text in enumerate(lines):
+            top = text_rect.top() + position * (line_height + self.LINE_SPACING)
+            elided = self._metrics.elidedText(text, Qt.TextElideMode.ElideRight, text_width)
+            painter.drawText(
+                text_rect.left(), top, text_width, line_height,
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, elided
+            )
+
+        # Badge priorité
+        radius = self.BADGE_RADIUS
+        margin = self.BADGE_MARGIN
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(get_priority_color(task.get("priority") or "moyenne"))
+        painter.drawEllipse(
+            int(rect.right()) - radius * 2 - margin,
+            int(rect.top()) + margin,
+            radius * 2,
+            radius * 2
+        )
+
+        painter.restore()
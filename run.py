@@ -19,12 +19,29 @@ import traceback
 
 from PyQt6.QtWidgets import QApplication
 
+from app.database.archive import archive_closed_tasks
+from app.database.migrations import bootstrap
+from app.database.worker import DatabaseWorker
 from app.ui.main_window import MainWindow
 
+def _report_bootstrap_error(error):
+    # Base lente ou indisponible : l'application reste utilisable, les
+    # chargements signaleront eux-mêmes leur échec
+    print(f"[bootstrap] Base de données indisponible : {error}")
+
+
 # Définition de la méthode afin de lancer l'application codée.=
 def main():
     try:
         app = QApplication(sys.argv)
+        # Connexion et mise à jour du schéma sur le thread de la base,
+        # soumises avant tout chargement : la fenêtre n'attend pas MySQL
+        worker = DatabaseWorker.get_instance()
+        worker.submit(bootstrap).error.connect(_report_bootstrap_error)
+        # Tâches closes anciennes sorties du tableau avant son premier chargement
+        worker.submit(archive_closed_tasks).error.connect(_report_bootstrap_error)
+        # Fin des accès base en cours avant la fermeture
+        app.aboutToQuit.connect(worker.shutdown)
         main_window = MainWindow()
         main_window.show()
         sys.exit(app.exec())